@@ -0,0 +1,588 @@
+#!/usr/bin/env python3
+"""Offline micro-benchmarks for the dataset scripts; results are printed as JSON."""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import pathlib
+import platform
+import random
+import shlex
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Iterator
+
+from dataset_common import DOCUMENT_CACHE, fixture_dirs, read_mapping
+from export_compression import open_export
+from export_jsonl import CANONICAL_EXPORT_PATH, encode_row, export_rows, sort_key
+from export_merkle import ExportMerkle, ExportMerkleBuilder, diff_export_merkles, export_merkle_path
+from export_sqlite import SQLITE_BATCH_ROWS, SqliteExportReader, SqliteExportWriter
+from fixture_pack import pack_tree, tree_files
+from json_schema import dataset_schemas, validate
+from synthetic_corpus import REPO_ROOT, generate_corpus
+from timings import TIMINGS
+from validate_dataset import validate_fixtures
+from verify_fixtures import EngineVerificationSession, compare_engine_verification
+
+
+def timed(func: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def load_export_rows(path: pathlib.Path) -> list[dict[str, Any]]:
+    if not path.exists():
+        raise SystemExit(f"Export not found: {path}. Run scripts/export_jsonl.py --include-archives first.")
+    with open_export(path) as handle:
+        return [json.loads(line) for line in handle if line.strip()]
+
+
+def bench_schema(args: argparse.Namespace) -> dict[str, Any]:
+    seed_rows = load_export_rows(pathlib.Path(args.export))
+    rows = [seed_rows[index % len(seed_rows)] for index in range(args.rows)]
+
+    started = time.perf_counter()
+    validator = dataset_schemas()["export_row"]
+    compile_seconds = time.perf_counter() - started
+
+    def run() -> None:
+        for row in rows:
+            if validate(validator, row):
+                raise SystemExit("Benchmark rows do not match the export row schema.")
+
+    seconds = timed(run, args.repeat)
+    return {
+        "benchmark": "schema",
+        "rows": args.rows,
+        "compile_seconds": round(compile_seconds, 6),
+        "validate_seconds": round(seconds, 6),
+        "rows_per_second": round(args.rows / seconds) if seconds else None,
+    }
+
+
+def write_engine_run(root: pathlib.Path, fixtures: int) -> tuple[pathlib.Path, pathlib.Path, list[str]]:
+    """Write a synthetic expected tree plus an engine-root acceptance run with one report row per fixture."""
+    expected_root = root / "fixtures"
+    actual_root = root / "actual"
+    request = {"policy_pack_id": "cA-pro", "policy_pack_version": "1.0", "profile_id": None, "profile_version": None, "device": None}
+    expected = json.dumps({"outcome": "pass", "request": request})
+    actual = json.dumps({"policy_pack_id": "cA-pro", "model_version": "cA-1.0-pro", "run": {}})
+    names = [f"fixture_{index:06d}" for index in range(fixtures)]
+    for name in names:
+        bundle = expected_root / name / "expected" / "cA-1.0-pro" / "cA-pro"
+        bundle.mkdir(parents=True)
+        (bundle / "expected_artifact.json").write_text(expected, encoding="utf-8")
+        (bundle / "expected_verdict.json").write_text(expected, encoding="utf-8")
+        (actual_root / name).mkdir(parents=True)
+        (actual_root / name / "artifact.json").write_text(actual, encoding="utf-8")
+        (actual_root / name / "verdict.json").write_text(actual, encoding="utf-8")
+    rows = [{"fixture": name, "status": "pass", "policy_pack_id": "cA-pro", "policy_pack_version": "1.0"} for name in names]
+    (actual_root / "report.json").write_text(json.dumps({"fixtures": rows}), encoding="utf-8")
+    return expected_root, actual_root, names
+
+
+def bench_sqlite(args: argparse.Namespace) -> dict[str, Any]:
+    seed_rows = load_export_rows(pathlib.Path(args.export))
+
+    def rows() -> Iterator[dict[str, Any]]:
+        for index in range(args.rows):
+            seed = seed_rows[index % len(seed_rows)]
+            yield dict(seed, metadata=dict(seed["metadata"], fixture_id=f"{seed['metadata']['fixture_id']}_{index:07d}"))
+
+    probe = seed_rows[0]["metadata"]
+    filters = {"scenario_type": probe["scenario_type"], "policy_pack_id": probe["policy_pack_id"]}
+    with tempfile.TemporaryDirectory(prefix="blux-ca-bench-") as tmp:
+        database = pathlib.Path(tmp) / "export.sqlite"
+        jsonl_path = pathlib.Path(tmp) / "export.jsonl"
+
+        started = time.perf_counter()
+        with jsonl_path.open("wb") as handle:
+            for row in rows():
+                handle.write(encode_row(row))
+        jsonl_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        writer = SqliteExportWriter(database, args.batch_rows)
+        for row in rows():
+            writer.add(row)
+        row_count, digest = writer.finish()
+        load_seconds = time.perf_counter() - started
+
+        with SqliteExportReader(database) as reader:
+            started = time.perf_counter()
+            matches = reader.count(**filters)
+            query_seconds = time.perf_counter() - started
+            started = time.perf_counter()
+            with (pathlib.Path(tmp) / "expanded.jsonl").open("wb") as handle:
+                expanded_digest = reader.expand(handle)
+            expand_seconds = time.perf_counter() - started
+        if expanded_digest != digest:
+            raise SystemExit("SQLite re-emitted export does not match the loaded rows.")
+
+        started = time.perf_counter()
+        with jsonl_path.open("rb") as handle:
+            scanned = sum(1 for line in handle if all(json.loads(line)["metadata"][key] == value for key, value in filters.items()))
+        scan_seconds = time.perf_counter() - started
+        if scanned != matches:
+            raise SystemExit(f"SQLite filter matched {matches} rows, JSONL scan {scanned}.")
+        database_bytes = database.stat().st_size
+    return {
+        "benchmark": "sqlite",
+        "rows": row_count,
+        "batch_rows": args.batch_rows,
+        "database_bytes": database_bytes,
+        "jsonl_write_seconds": round(jsonl_seconds, 3),
+        "load_seconds": round(load_seconds, 3),
+        "load_rows_per_second": round(row_count / load_seconds) if load_seconds else None,
+        "expand_seconds": round(expand_seconds, 3),
+        "filter": filters,
+        "filter_matches": matches,
+        "indexed_query_seconds": round(query_seconds, 6),
+        "jsonl_scan_seconds": round(scan_seconds, 3),
+    }
+
+
+def bench_merkle(args: argparse.Namespace) -> dict[str, Any]:
+    seed_rows = load_export_rows(pathlib.Path(args.export))
+    rng = random.Random(args.seed)
+    changed = set(rng.sample(range(args.rows), args.changes))
+    removed = set(rng.sample(sorted(set(range(args.rows)) - changed), args.changes))
+
+    def rows(release: int) -> Iterator[dict[str, Any]]:
+        for index in range(args.rows):
+            if release and index in removed:
+                continue
+            seed = seed_rows[index % len(seed_rows)]
+            metadata = dict(seed["metadata"], fixture_id=f"{seed['metadata']['fixture_id']}_{index:07d}")
+            row = dict(seed, metadata=metadata)
+            if release and index in changed:
+                row["verdict"] = dict(row["verdict"], note="changed")
+            yield row
+        if release:
+            for index in range(args.changes):
+                seed = seed_rows[index % len(seed_rows)]
+                yield dict(seed, metadata=dict(seed["metadata"], fixture_id=f"zz_added_{index:07d}"))
+
+    def write_release(path: pathlib.Path, release: int) -> None:
+        merkle = ExportMerkleBuilder()
+        hasher = hashlib.sha256()
+        with path.open("wb") as handle:
+            for row in sorted(rows(release), key=sort_key):
+                line = encode_row(row)
+                handle.write(line)
+                hasher.update(line)
+                merkle.add(sort_key(row), line)
+        merkle.write(path, hasher.hexdigest())
+
+    def jsonl_diff(old_path: pathlib.Path, new_path: pathlib.Path) -> tuple[int, int, int]:
+        hashes = []
+        for path in (old_path, new_path):
+            with path.open("rb") as handle:
+                hashes.append({sort_key(json.loads(line)): hashlib.sha256(line).hexdigest() for line in handle})
+        old, new = hashes
+        return len(new.keys() - old.keys()), len(old.keys() - new.keys()), sum(1 for key in old.keys() & new.keys() if old[key] != new[key])
+
+    with tempfile.TemporaryDirectory(prefix="blux-ca-bench-") as tmp:
+        old_path, new_path = pathlib.Path(tmp) / "old.jsonl", pathlib.Path(tmp) / "new.jsonl"
+        started = time.perf_counter()
+        write_release(old_path, 0)
+        write_seconds = time.perf_counter() - started
+        write_release(new_path, 1)
+
+        started = time.perf_counter()
+        old, new = ExportMerkle(export_merkle_path(old_path)), ExportMerkle(export_merkle_path(new_path))
+        load_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        diff = diff_export_merkles(old, new)
+        diff_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        corrupt = new.check_rows(new_path, diff.added + diff.changed)
+        check_changed_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        expected = jsonl_diff(old_path, new_path)
+        jsonl_diff_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        with new_path.open("rb") as handle:
+            hashlib.file_digest(handle, "sha256")
+        full_hash_seconds = time.perf_counter() - started
+        manifest_bytes = export_merkle_path(new_path).stat().st_size
+    if (len(diff.added), len(diff.removed), len(diff.changed)) != expected or corrupt:
+        raise SystemExit(f"Merkle diff {len(diff.added)}/{len(diff.removed)}/{len(diff.changed)} does not match the JSONL diff {expected}.")
+    return {
+        "benchmark": "merkle",
+        "rows": args.rows,
+        "changes": args.changes,
+        "added_removed_changed": expected,
+        "manifest_bytes": manifest_bytes,
+        "export_with_merkle_seconds": round(write_seconds, 3),
+        "manifest_load_seconds": round(load_seconds, 3),
+        "merkle_diff_seconds": round(diff_seconds, 6),
+        "nodes_visited": diff.visited,
+        "check_changed_rows_seconds": round(check_changed_seconds, 6),
+        "jsonl_diff_seconds": round(jsonl_diff_seconds, 3),
+        "full_sha256_seconds": round(full_hash_seconds, 3),
+    }
+
+
+def bench_engine_report(args: argparse.Namespace) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory(prefix="blux-ca-bench-") as tmp:
+        expected_root, actual_root, names = write_engine_run(pathlib.Path(tmp), args.fixtures)
+        sample = names[: args.legacy_sample]
+
+        def legacy() -> None:
+            for name in sample:
+                if compare_engine_verification(name, expected_root, actual_root, "cA-1.0-pro", "cA-pro", None):
+                    raise SystemExit("Synthetic engine run failed verification.")
+
+        def session() -> None:
+            failures = EngineVerificationSession(expected_root, actual_root, "cA-1.0-pro", "cA-pro", None).verify_all(names, args.jobs)
+            if failures:
+                raise SystemExit("Synthetic engine run failed verification.")
+
+        legacy_seconds = timed(legacy, 1)
+        session_seconds = timed(session, args.repeat)
+    projected = legacy_seconds / len(sample) * len(names) if sample else None
+    return {
+        "benchmark": "engine-report",
+        "fixtures": len(names),
+        "jobs": args.jobs,
+        "legacy_sample": len(sample),
+        "legacy_sample_seconds": round(legacy_seconds, 6),
+        "legacy_projected_seconds": round(projected, 3) if projected is not None else None,
+        "session_seconds": round(session_seconds, 6),
+    }
+
+
+def bench_timings(args: argparse.Namespace) -> dict[str, Any]:
+    """Time validate+export in-process with TIMINGS disabled and enabled, and bound the disabled cost."""
+    with tempfile.TemporaryDirectory(prefix="blux-ca-bench-") as tmp:
+        corpus = pathlib.Path(tmp) / "corpus"
+        generate_corpus(corpus, args.fixtures, actual_outputs=False)
+        previous_cwd = os.getcwd()
+        os.chdir(corpus)
+        try:
+            mapping = read_mapping()
+            fixtures = fixture_dirs()
+
+            def run() -> None:
+                DOCUMENT_CACHE.clear()
+                validate_fixtures(fixtures, mapping)
+                export_rows(pathlib.Path("export.jsonl"), mapping, True)
+
+            disabled_seconds = timed(run, args.repeat)
+            TIMINGS.enable()
+            enabled_seconds = timed(run, args.repeat)
+            spans = sum(entry[1] for entry in TIMINGS.phases.values()) + sum(entry[2] for entry in TIMINGS.fixtures.values())
+            TIMINGS.enabled = False
+        finally:
+            os.chdir(previous_cwd)
+
+    loops = 1_000_000
+    started = time.perf_counter()
+    for _ in range(loops):
+        with TIMINGS.phase("noop"):
+            pass
+    null_span_seconds = (time.perf_counter() - started) / loops
+    spans_per_run = spans // args.repeat
+    return {
+        "benchmark": "timings",
+        "fixtures": args.fixtures,
+        "disabled_seconds": round(disabled_seconds, 6),
+        "enabled_seconds": round(enabled_seconds, 6),
+        "spans_per_run": spans_per_run,
+        "null_span_ns": round(null_span_seconds * 1e9, 1),
+        "disabled_overhead_percent": round(100 * spans_per_run * null_span_seconds / disabled_seconds, 4),
+    }
+
+
+SCRIPTS_DIR = pathlib.Path(__file__).resolve().parent
+SCALE_PHASES: dict[str, list[str]] = {
+    "validate": ["validate_dataset.py"],
+    "validate-parallel": ["validate_dataset.py", "--jobs", "0"],
+    "export": ["export_jsonl.py", "--include-archives", "--write-sha256"],
+    "verify": ["verify_fixtures.py", "--actual-root", "actual"],
+}
+
+
+def run_phase(argv: list[str], cwd: pathlib.Path, env: dict[str, str] | None = None) -> dict[str, Any]:
+    """Run one script in a child process; return wall time, exit code and peak RSS of that process tree."""
+    started = time.perf_counter()
+    process = subprocess.Popen([sys.executable, *argv], cwd=cwd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    stderr = process.stderr.read() if process.stderr else b""
+    # wait4 reports rusage for this child (and its reaped workers), unlike RUSAGE_CHILDREN which
+    # keeps a running maximum across every phase.
+    _, status, rusage = os.wait4(process.pid, 0)
+    seconds = time.perf_counter() - started
+    process.returncode = os.waitstatus_to_exitcode(status)
+    result = {
+        "seconds": round(seconds, 3),
+        "peak_rss_kib": rusage.ru_maxrss,
+        "returncode": process.returncode,
+    }
+    if process.returncode:
+        result["stderr_tail"] = stderr.decode("utf-8", "replace")[-500:]
+    return result
+
+
+def current_commit() -> str | None:
+    try:
+        completed = subprocess.run(["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip()
+
+
+def bench_scale(args: argparse.Namespace) -> dict[str, Any]:
+    phases = [phase.strip() for phase in args.phases.split(",") if phase.strip()]
+    unknown = sorted(set(phases) - set(SCALE_PHASES))
+    if unknown:
+        raise SystemExit(f"Unknown phases: {', '.join(unknown)} (choose from {', '.join(SCALE_PHASES)}).")
+    workdir = pathlib.Path(args.workdir) if args.workdir else pathlib.Path(tempfile.mkdtemp(prefix="blux-ca-scale-"))
+    runs = []
+    try:
+        for size in (int(value) for value in args.sizes.split(",") if value.strip()):
+            corpus = workdir / f"corpus-{size}"
+            started = time.perf_counter()
+            generate_corpus(corpus, size, artifact_bytes=args.artifact_bytes, actual_outputs="verify" in phases)
+            results: dict[str, Any] = {"generate": {"seconds": round(time.perf_counter() - started, 3)}}
+            for phase in phases:
+                script, *flags = SCALE_PHASES[phase]
+                results[phase] = run_phase([(SCRIPTS_DIR / script).as_posix(), *flags], corpus)
+            runs.append({"fixtures": size, "phases": results})
+            if not args.keep:
+                shutil.rmtree(corpus)
+    finally:
+        if not args.keep and not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+    return {
+        "benchmark": "scale",
+        "commit": current_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "artifact_bytes": args.artifact_bytes,
+        "runs": runs,
+    }
+
+
+STUB_ENGINE = SCRIPTS_DIR / "stub_engine" / "src" / "blux_ca" / "__main__.py"
+
+
+def bench_engine_worker(args: argparse.Namespace) -> dict[str, Any]:
+    engine = shlex.join([sys.executable, STUB_ENGINE.as_posix()])
+    modes = {
+        "per_process": ["--engine-cmd", f"{engine} run --goal {{goal}} --out {{out_dir}} --model-version {{model_version}} --policy-pack {{policy_pack}} --profile={{profile}}"],
+        "worker": ["--engine-worker", f"{engine} worker"],
+    }
+    with tempfile.TemporaryDirectory(prefix="blux-ca-bench-") as tmp:
+        corpus = pathlib.Path(tmp) / "corpus"
+        generate_corpus(corpus, args.fixtures, actual_outputs=False)
+        env = dict(os.environ, BLUX_CA_STUB_DATASET=(corpus / "fixtures").as_posix(), BLUX_CA_STUB_DELAY=str(args.engine_delay))
+        results = {
+            mode: run_phase([(SCRIPTS_DIR / "verify_fixtures.py").as_posix(), *flags, "--jobs", str(args.jobs)], corpus, env)
+            for mode, flags in modes.items()
+        }
+    per_process, worker = results["per_process"]["seconds"], results["worker"]["seconds"]
+    return {
+        "benchmark": "engine-worker",
+        "fixtures": args.fixtures,
+        "jobs": args.jobs,
+        "engine_delay": args.engine_delay,
+        "runs": results,
+        "speedup": round(per_process / worker, 2) if worker else None,
+    }
+
+
+def drop_caches(paths: list[pathlib.Path]) -> bool:
+    """Evict ``paths`` from the page cache; also drop dentry/inode caches when permitted (root)."""
+    for path in paths:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    try:
+        os.sync()
+        pathlib.Path("/proc/sys/vm/drop_caches").write_text("3\n", encoding="ascii")
+    except OSError:
+        return False
+    return True
+
+
+def bench_pack(args: argparse.Namespace) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory(prefix="blux-ca-bench-") as tmp:
+        corpus = pathlib.Path(tmp) / "corpus"
+        generate_corpus(corpus, args.fixtures, artifact_bytes=args.artifact_bytes, actual_outputs=False)
+        pack_path = corpus / "fixtures.pack"
+        packed_files, pack_bytes = pack_tree(corpus / "fixtures", pack_path)
+        cached_paths = [corpus / "fixtures" / rel for rel in tree_files(corpus / "fixtures")] + [pack_path]
+        env = {key: value for key, value in os.environ.items() if key != "BLUX_DATASET_FIXTURE_PACK"}
+        modes = {"loose": env, "pack": dict(env, BLUX_DATASET_FIXTURE_PACK=pack_path.name)}
+        runs: dict[str, list[dict[str, Any]]] = {mode: [] for mode in modes}
+        dropped = True
+        for _ in range(args.repeat):
+            for mode, mode_env in modes.items():
+                dropped = drop_caches(cached_paths) and dropped
+                runs[mode].append(run_phase([(SCRIPTS_DIR / "validate_dataset.py").as_posix()], corpus, mode_env))
+    best = {mode: min(run["seconds"] for run in mode_runs) for mode, mode_runs in runs.items()}
+    return {
+        "benchmark": "pack",
+        "fixtures": args.fixtures,
+        "files": packed_files,
+        "pack_bytes": pack_bytes,
+        "dentry_cache_dropped": dropped,
+        "runs": runs,
+        "best_seconds": best,
+        "speedup": round(best["loose"] / best["pack"], 2) if best["pack"] else None,
+    }
+
+
+UNIFIED_STAGES = [
+    ["validate_dataset.py"],
+    ["verify_fixtures.py", "--actual-root", "actual"],
+    ["export_jsonl.py", "--include-archives"],
+]
+
+
+def bench_unified(args: argparse.Namespace) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory(prefix="blux-ca-bench-") as tmp:
+        corpus = pathlib.Path(tmp) / "corpus"
+        generate_corpus(corpus, args.fixtures, artifact_bytes=args.artifact_bytes, actual_outputs=True)
+        runs: dict[str, list[dict[str, Any]]] = {"separate": [], "unified": []}
+        for _ in range(args.repeat):
+            stages = [run_phase([(SCRIPTS_DIR / script).as_posix(), *flags], corpus) for script, *flags in UNIFIED_STAGES]
+            runs["separate"].append({
+                "seconds": round(sum(stage["seconds"] for stage in stages), 3),
+                "peak_rss_kib": max(stage["peak_rss_kib"] for stage in stages),
+                "returncode": max(stage["returncode"] for stage in stages),
+                "stages": stages,
+            })
+            runs["unified"].append(run_phase([(SCRIPTS_DIR / "dataset_cli.py").as_posix(), "all", "--actual-root", "actual", "--include-archives"], corpus))
+    best = {mode: min(run["seconds"] for run in mode_runs) for mode, mode_runs in runs.items()}
+    return {
+        "benchmark": "unified",
+        "fixtures": args.fixtures,
+        "runs": runs,
+        "best_seconds": best,
+        "speedup": round(best["separate"] / best["unified"], 2) if best["unified"] else None,
+    }
+
+
+def bench_bridge(args: argparse.Namespace) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory(prefix="blux-ca-bench-") as tmp:
+        corpus = pathlib.Path(tmp) / "corpus"
+        generate_corpus(corpus, args.fixtures, actual_outputs=False)
+        env = dict(os.environ, BLUX_CA_STUB_DATASET=(corpus / "fixtures").as_posix(), BLUX_CA_STUB_DELAY=str(args.engine_delay))
+        verify = [(SCRIPTS_DIR / "verify_fixtures.py").as_posix(), "--engine-root", (SCRIPTS_DIR / "stub_engine").as_posix(), "--bridge-cache", "bridge-cache", "--jobs", str(args.jobs)]
+        runs = {
+            "uncached": run_phase([*verify, "--no-bridge-cache"], corpus, env),
+            "cold": run_phase([*verify, "--actual-root", "actual"], corpus, env),
+            "warm": run_phase([*verify, "--actual-root", "actual-warm"], corpus, env),
+            "incremental_unchanged": run_phase([*verify, "--actual-root", "actual", "--incremental"], corpus, env),
+        }
+        for fixture_dir in fixture_dirs(corpus / "fixtures")[: args.changes]:
+            goal = json.loads((fixture_dir / "goal.json").read_text(encoding="utf-8"))
+            goal["prompt"] = f"{goal.get('prompt', '')} (revised)"
+            (fixture_dir / "goal.json").write_text(json.dumps(goal, indent=2) + "\n", encoding="utf-8")
+        runs["incremental_changed"] = run_phase([*verify, "--actual-root", "actual", "--incremental"], corpus, env)
+    uncached = runs["uncached"]["seconds"]
+    return {
+        "benchmark": "bridge",
+        "fixtures": args.fixtures,
+        "changes": args.changes,
+        "engine_delay": args.engine_delay,
+        "runs": runs,
+        "speedup": {mode: round(uncached / run["seconds"], 2) if run["seconds"] else None for mode, run in runs.items() if mode != "uncached"},
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark BLUX cA dataset tooling on synthetic workloads.")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    schema = subparsers.add_parser("schema", help="Validate N export rows (cycled from the canonical export) against the export row schema.")
+    schema.add_argument("--rows", type=int, default=100_000)
+    schema.add_argument("--repeat", type=int, default=3)
+    schema.add_argument("--export", default=CANONICAL_EXPORT_PATH.as_posix())
+    schema.set_defaults(func=bench_schema)
+
+    sqlite = subparsers.add_parser("sqlite", help="Bulk-load N export rows (cycled from the canonical export) into a SQLite export, then time an indexed filter, the JSONL re-emit and a JSONL scan.")
+    sqlite.add_argument("--rows", type=int, default=1_000_000)
+    sqlite.add_argument("--batch-rows", type=int, default=SQLITE_BATCH_ROWS, help="Rows per insert transaction.")
+    sqlite.add_argument("--export", default=CANONICAL_EXPORT_PATH.as_posix())
+    sqlite.set_defaults(func=bench_sqlite)
+
+    merkle = subparsers.add_parser("merkle", help="Two synthetic N-row releases (cycled from the canonical export) differing in a few rows: Merkle manifest diff vs a full JSONL diff.")
+    merkle.add_argument("--rows", type=int, default=200_000)
+    merkle.add_argument("--changes", type=int, default=10, help="Rows changed, removed and added between the releases (each).")
+    merkle.add_argument("--seed", type=int, default=0)
+    merkle.add_argument("--export", default=CANONICAL_EXPORT_PATH.as_posix())
+    merkle.set_defaults(func=bench_merkle)
+
+    engine_report = subparsers.add_parser("engine-report", help="Engine-root verification against a synthetic N-row acceptance report: per-fixture calls vs one session.")
+    engine_report.add_argument("--fixtures", type=int, default=20_000)
+    engine_report.add_argument("--legacy-sample", type=int, default=1_000, help="Fixtures timed through per-call compare_engine_verification(); the full run is projected from this sample.")
+    engine_report.add_argument("--jobs", type=int, default=1)
+    engine_report.add_argument("--repeat", type=int, default=1)
+    engine_report.set_defaults(func=bench_engine_report)
+
+    engine_worker = subparsers.add_parser("engine-worker", help="Dataset-format verification through the stub engine: one process per fixture (--engine-cmd) vs long-lived workers (--engine-worker).")
+    engine_worker.add_argument("--fixtures", type=int, default=500)
+    engine_worker.add_argument("--jobs", type=int, default=1)
+    engine_worker.add_argument("--engine-delay", type=float, default=0.0, help="Seconds the stub engine sleeps per process start, on top of interpreter startup.")
+    engine_worker.set_defaults(func=bench_engine_worker)
+
+    pack = subparsers.add_parser("pack", help="Cold-cache validate_dataset.py over a loose synthetic fixture tree vs the same tree packed with fixture_pack.py.")
+    pack.add_argument("--fixtures", type=int, default=5_000)
+    pack.add_argument("--artifact-bytes", type=int, default=0)
+    pack.add_argument("--repeat", type=int, default=3)
+    pack.set_defaults(func=bench_pack)
+
+    unified = subparsers.add_parser("unified", help="validate_dataset.py, verify_fixtures.py and export_jsonl.py as three processes vs one dataset_cli.py all run on a synthetic corpus.")
+    unified.add_argument("--fixtures", type=int, default=2_000)
+    unified.add_argument("--artifact-bytes", type=int, default=0)
+    unified.add_argument("--repeat", type=int, default=3)
+    unified.set_defaults(func=bench_unified)
+
+    bridge = subparsers.add_parser("bridge", help="Engine-root verification through the stub engine: bridge goals regenerated every run vs the bridge cache, and --incremental with N changed goals.")
+    bridge.add_argument("--fixtures", type=int, default=2_000)
+    bridge.add_argument("--changes", type=int, default=5)
+    bridge.add_argument("--engine-delay", type=float, default=0.0, help="Seconds the stub engine sleeps per acceptance run.")
+    bridge.add_argument("--jobs", type=int, default=1)
+    bridge.set_defaults(func=bench_bridge)
+
+    timings = subparsers.add_parser("timings", help="Instrumentation overhead: validate+export on a synthetic corpus with TIMINGS disabled vs enabled.")
+    timings.add_argument("--fixtures", type=int, default=2_000)
+    timings.add_argument("--repeat", type=int, default=3)
+    timings.set_defaults(func=bench_timings)
+
+
+    scale = subparsers.add_parser("scale", help="Generate synthetic corpora and time validate/export/verify per phase with peak RSS.")
+    scale.add_argument("--sizes", default="1000,10000,100000", help="Comma-separated corpus sizes (fixture directories).")
+    scale.add_argument("--artifact-bytes", type=int, default=0, help="Pad text artifact content to at least this many bytes.")
+    scale.add_argument("--phases", default=",".join(SCALE_PHASES), help=f"Comma-separated phases to run (default: {','.join(SCALE_PHASES)}).")
+    scale.add_argument("--workdir", default=None, help="Directory for generated corpora (default: a temporary directory).")
+    scale.add_argument("--keep", action="store_true", help="Keep generated corpora instead of deleting each after it is measured.")
+    scale.set_defaults(func=bench_scale)
+
+    parser.add_argument("--output", default=None, help="Also write the JSON result to this path.")
+    args = parser.parse_args()
+    rendered = json.dumps(args.func(args), indent=2, sort_keys=True)
+    if args.output:
+        pathlib.Path(args.output).write_text(rendered + "\n", encoding="utf-8")
+    print(rendered)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Run validate, verify and export from one process so the fixture corpus is loaded only once."""
+from __future__ import annotations
+
+import argparse
+import importlib
+import os
+import sys
+
+from dataset_common import DOCUMENT_CACHE, FIXTURE_ROOT, format_cache_stats, layout_index
+from timings import configure_timings, emit_timings
+
+# Subcommand -> script module; a module is imported only when its subcommand runs.
+COMMANDS = {
+    "validate": "validate_dataset",
+    "verify": "verify_fixtures",
+    "export": "export_jsonl",
+    "diff-exports": "diff_exports",
+}
+
+
+def command_parser(command: str) -> tuple[argparse.ArgumentParser, object]:
+    """Return the standalone script's argument parser for ``command`` and the script module."""
+    module = importlib.import_module(COMMANDS[command])
+    parser = argparse.ArgumentParser(prog=f"dataset_cli.py {command}", description=module.__doc__)
+    module.add_arguments(parser)
+    return parser, module
+
+
+def size_document_cache() -> None:
+    """Let the document cache hold the whole corpus so later stages reuse what earlier ones parsed."""
+    if "BLUX_DATASET_CACHE_ENTRIES" in os.environ:
+        return
+    # Expected fixture files plus the same again for verified outputs and archives.
+    DOCUMENT_CACHE.max_entries = max(DOCUMENT_CACHE.max_entries, 2 * layout_index(FIXTURE_ROOT).file_count())
+
+
+def run_all(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="dataset_cli.py all",
+        description="Validate, verify and export in one process, stopping at the first failing stage. Verification is skipped when no actual outputs or engine are given.",
+    )
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes for validation and verification (0 uses all CPUs).")
+    parser.add_argument("--schema", action="store_true", help="Also validate against schemas/ (see validate_dataset.py --schema).")
+    parser.add_argument("--actual-root", default=None, help="Captured dataset-format outputs to verify against (see verify_fixtures.py).")
+    parser.add_argument("--engine-root", default=None, help="Local blux-ca checkout to verify against (default: BLUX_CA_ENGINE_ROOT).")
+    parser.add_argument("--engine-cmd", default=None, help="Per-fixture engine command template (default: BLUX_CA_ENGINE_CMD).")
+    parser.add_argument("--engine-worker", default=None, help="Long-lived engine worker command (default: BLUX_CA_ENGINE_WORKER).")
+    parser.add_argument("--policy-pack", default="cA-pro", help="Dataset policy pack bundle to verify against.")
+    parser.add_argument("--profile", default=None, help="Optional dataset profile bundle to verify against.")
+    parser.add_argument("--cache", action="store_true", help="Reuse and record cached verification passes (see verify_fixtures.py --cache).")
+    parser.add_argument("--include-archives", action="store_true", help="Include archived compatibility examples in the export.")
+    parser.add_argument("--write-sha256", action="store_true", help="Write a sibling .sha256 file for the JSONL output.")
+    parser.add_argument("--write-merkle", action="store_true", help="Write a sibling .merkle.json Merkle manifest for the JSONL output.")
+    parser.add_argument("--cache-stats", action="store_true", help="Print document cache hit/miss counters to stderr after the last stage.")
+    parser.add_argument("--timings", nargs="?", const="-", default=None, help="Write one JSON timing summary covering every stage to PATH (stderr when omitted); BLUX_DATASET_TIMINGS=PATH does the same.")
+    args = parser.parse_args(argv)
+    timings_destination = configure_timings(args.timings)
+    size_document_cache()
+
+    verify_argv = ["--jobs", str(args.jobs), "--policy-pack", args.policy_pack]
+    for flag, value in (("--actual-root", args.actual_root), ("--engine-root", args.engine_root), ("--engine-cmd", args.engine_cmd), ("--engine-worker", args.engine_worker), ("--profile", args.profile)):
+        if value is not None:
+            verify_argv += [flag, value]
+    if args.cache:
+        verify_argv.append("--cache")
+    stages = [
+        ("validate", ["--jobs", str(args.jobs)] + (["--schema"] if args.schema else [])),
+        ("verify", verify_argv),
+        ("export", [flag for flag, enabled in (("--include-archives", args.include_archives), ("--write-sha256", args.write_sha256), ("--write-merkle", args.write_merkle)) if enabled]),
+    ]
+    status = 0
+    for command, stage_argv in stages:
+        stage_parser, module = command_parser(command)
+        stage_args = stage_parser.parse_args(stage_argv)
+        if command == "verify" and not (stage_args.actual_root or stage_args.engine_root or stage_args.engine_cmd or stage_args.engine_worker):
+            print("Skipping verify: no --actual-root, --engine-root, --engine-cmd or --engine-worker given.", file=sys.stderr)
+            continue
+        status = module.run(stage_args)
+        if status:
+            print(f"Stopping after failed {command} stage.", file=sys.stderr)
+            break
+    if args.cache_stats:
+        print(format_cache_stats(), file=sys.stderr)
+    emit_timings(timings_destination, "dataset_cli")
+    return status
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Run the dataset tools from one process. 'validate', 'verify', 'export' and 'diff-exports' take the same options as the standalone scripts; 'all' runs validate, verify and export in turn over one loaded corpus.",
+    )
+    parser.add_argument("command", choices=(*COMMANDS, "all"))
+    parser.add_argument("options", nargs=argparse.REMAINDER, help="Options for the command (see '<command> --help').")
+    args = parser.parse_args(argv)
+    if args.command == "all":
+        return run_all(args.options)
+    command_args, module = command_parser(args.command)
+    stage_args = command_args.parse_args(args.options)
+    timings_destination = configure_timings(getattr(stage_args, "timings", None))
+    status = module.run(stage_args)
+    emit_timings(timings_destination, COMMANDS[args.command])
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
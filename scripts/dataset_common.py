@@ -2,11 +2,18 @@
 """Shared helpers for BLUX cA dataset validation, export, and verification."""
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 import pathlib
 from dataclasses import dataclass
 from typing import Any, Iterable
 
+from document_cache import DocumentCache
+from fixture_layout import FixturePack, LayoutIndex
+from timings import TIMINGS
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parent.parent
 DATASET_VERSION_PATH = pathlib.Path("DATASET_VERSION")
 DATASET_MAPPING_PATH = pathlib.Path("DATASET_ENGINE_MAPPING.json")
 FIXTURE_ROOT = pathlib.Path("fixtures")
@@ -23,15 +30,52 @@ REQUIRED_METADATA_FIELDS = (
     "scenario_type",
     "expected_outcome",
 )
+LAYOUT_CACHE_PATH = os.environ.get("BLUX_DATASET_LAYOUT_CACHE") or None
+FIXTURE_PACK_PATH = os.environ.get("BLUX_DATASET_FIXTURE_PACK") or None
 
 
-def load_json(path: pathlib.Path) -> Any:
+def normalize(payload: Any) -> Any:
+    if isinstance(payload, dict):
+        return {k: normalize(v) for k, v in sorted(payload.items()) if k not in VOLATILE_KEYS}
+    if isinstance(payload, list):
+        return [normalize(v) for v in payload]
+    return payload
+
+
+def _document_signature(path: pathlib.Path) -> tuple[int, int]:
+    pack = _covering_pack(path)
+    if pack is not None:
+        return pack.signature(path)
+    stat = path.stat()
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _decode_json(path: pathlib.Path) -> Any:
+    pack = _covering_pack(path)
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return json.loads(pack.read_bytes(path).decode("utf-8") if pack is not None else path.read_text(encoding="utf-8"))
     except json.JSONDecodeError as exc:
         raise SystemExit(f"Invalid JSON in {path}: {exc}") from exc
 
 
+DOCUMENT_CACHE = DocumentCache(_document_signature, _decode_json, normalize)
+
+
+def load_json(path: pathlib.Path) -> Any:
+    return DOCUMENT_CACHE.load(path)
+
+
+
+def load_normalized_json(path: pathlib.Path) -> Any:
+    return DOCUMENT_CACHE.load_normalized(path)
+
+
+
+def format_cache_stats() -> str:
+    stats = DOCUMENT_CACHE.stats()
+    return "document cache: " + " ".join(f"{key}={value}" for key, value in stats.items())
+
+
 
 def read_dataset_version() -> str:
     if not DATASET_VERSION_PATH.exists():
@@ -54,24 +98,76 @@ def read_mapping() -> dict[str, Any]:
 
 
 
-def normalize(payload: Any) -> Any:
-    if isinstance(payload, dict):
-        return {k: normalize(v) for k, v in sorted(payload.items()) if k not in VOLATILE_KEYS}
-    if isinstance(payload, list):
-        return [normalize(v) for v in payload]
-    return payload
+def escape_pointer_token(token: Any) -> str:
+    """Escape one JSON pointer (RFC 6901) reference token."""
+    return str(token).replace("~", "~0").replace("/", "~1")
 
 
 
 def canonical_dumps(payload: Any) -> str:
-    return json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    with TIMINGS.phase("canonical_dumps") as span:
+        text = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        span.nbytes = len(text)
+    return text
+
+
+
+_LAYOUT_INDEXES: dict[str, LayoutIndex | FixturePack] = {}
+
+
+def layout_index(root: pathlib.Path = FIXTURE_ROOT, *, refresh: bool = False) -> LayoutIndex | FixturePack:
+    """Return the process-wide layout index (or mounted fixture pack) for ``root``, building it on first use."""
+    index = _LAYOUT_INDEXES.get(str(root))
+    if index is None:
+        if FIXTURE_PACK_PATH and root == FIXTURE_ROOT:
+            return mount_fixture_pack(pathlib.Path(FIXTURE_PACK_PATH), root)
+        cache_path = pathlib.Path(LAYOUT_CACHE_PATH) if LAYOUT_CACHE_PATH else None
+        index = _LAYOUT_INDEXES[str(root)] = LayoutIndex.build(root, cache_path)
+    elif refresh and index.refresh() and LAYOUT_CACHE_PATH and isinstance(index, LayoutIndex):
+        index.save(pathlib.Path(LAYOUT_CACHE_PATH))
+    return index
+
+
+def mount_fixture_pack(pack_path: pathlib.Path, root: pathlib.Path = FIXTURE_ROOT) -> FixturePack:
+    """Serve every path under ``root`` from the pack at ``pack_path`` for the rest of the process."""
+    previous = _LAYOUT_INDEXES.get(str(root))
+    if isinstance(previous, FixturePack):
+        previous.close()
+    pack = FixturePack(pack_path, root)
+    _LAYOUT_INDEXES[str(root)] = pack
+    return pack
+
+
+def _covering_index(path: pathlib.Path) -> LayoutIndex | FixturePack | None:
+    if FIXTURE_PACK_PATH and str(FIXTURE_ROOT) not in _LAYOUT_INDEXES:
+        layout_index(FIXTURE_ROOT)
+    for index in _LAYOUT_INDEXES.values():
+        if index._rel(path) is not None:
+            return index
+    return None
+
+
+def _covering_pack(path: pathlib.Path) -> FixturePack | None:
+    index = _covering_index(path)
+    return index if isinstance(index, FixturePack) else None
 
 
+def path_exists(path: pathlib.Path) -> bool:
+    """``path.exists()`` answered from a loaded layout index or fixture pack when one covers ``path``."""
+    index = _covering_index(path)
+    return index.exists(path) if index is not None else path.exists()
+
+
+def read_fixture_bytes(path: pathlib.Path) -> bytes:
+    """``path.read_bytes()``, served from a mounted fixture pack when one covers ``path``."""
+    pack = _covering_pack(path)
+    return pack.read_bytes(path) if pack is not None else path.read_bytes()
+
 
 def fixture_dirs(root: pathlib.Path = FIXTURE_ROOT) -> list[pathlib.Path]:
-    if not root.exists():
+    if not path_exists(root):
         raise SystemExit(f"fixtures directory missing: {root}")
-    return sorted(path for path in root.iterdir() if path.is_dir())
+    return layout_index(root).subdirs(root)
 
 
 @dataclass(frozen=True)
@@ -89,34 +185,57 @@ def iter_expected_bundles(
     fixture_dir: pathlib.Path,
     dataset_version: str,
 ) -> Iterable[BundleRef]:
+    layout = _covering_index(fixture_dir) or layout_index(fixture_dir.parent)
     expected_root = fixture_dir / "expected" / dataset_version
-    if expected_root.exists():
-        for entry in sorted(expected_root.iterdir()):
-            if not entry.is_dir():
-                continue
-            if (entry / "expected_artifact.json").exists() or (entry / "expected_verdict.json").exists():
-                yield BundleRef(fixture_dir, entry, dataset_version, entry.name, None, None)
-                continue
-            for pack_dir in sorted(path for path in entry.iterdir() if path.is_dir()):
-                yield BundleRef(fixture_dir, pack_dir, dataset_version, pack_dir.name, entry.name, None)
+    for entry in layout.subdirs(expected_root):
+        if layout.exists(entry / "expected_artifact.json") or layout.exists(entry / "expected_verdict.json"):
+            yield BundleRef(fixture_dir, entry, dataset_version, entry.name, None, None)
+            continue
+        for pack_dir in layout.subdirs(entry):
+            yield BundleRef(fixture_dir, pack_dir, dataset_version, pack_dir.name, entry.name, None)
 
-    archive_root = fixture_dir / "archives"
-    if archive_root.exists():
-        for version_dir in sorted(path for path in archive_root.iterdir() if path.is_dir()):
-            for pack_dir in sorted(path for path in version_dir.iterdir() if path.is_dir()):
-                yield BundleRef(fixture_dir, pack_dir, version_dir.name, pack_dir.name, None, version_dir.name)
+    for version_dir in layout.subdirs(fixture_dir / "archives"):
+        for pack_dir in layout.subdirs(version_dir):
+            yield BundleRef(fixture_dir, pack_dir, version_dir.name, pack_dir.name, None, version_dir.name)
 
 
 
-def build_export_row(bundle: BundleRef, mapping: dict[str, Any]) -> dict[str, Any]:
-    goal_path = bundle.fixture_dir / "goal.json"
-    goal = normalize(load_json(goal_path))
-    artifact_path = bundle.bundle_dir / "expected_artifact.json"
-    verdict_path = bundle.bundle_dir / "expected_verdict.json"
+def file_sha256(path: pathlib.Path) -> str:
+    pack = _covering_pack(path)
+    if pack is not None:
+        return pack.sha256(path)
+    hasher = hashlib.sha256()
+    with TIMINGS.phase("hash") as span, path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            hasher.update(chunk)
+        span.nbytes = handle.tell()
+    return hasher.hexdigest()
+
+
+
+def bundle_source_paths(bundle: BundleRef) -> dict[str, pathlib.Path | None]:
+    """Return the files an export row for ``bundle`` is derived from; ``report`` is None when absent."""
     report_path = bundle.bundle_dir / "report.json"
-    artifact = normalize(load_json(artifact_path))
-    verdict = normalize(load_json(verdict_path))
-    report = normalize(load_json(report_path)) if report_path.exists() else None
+    return {
+        "goal": bundle.fixture_dir / "goal.json",
+        "artifact": bundle.bundle_dir / "expected_artifact.json",
+        "verdict": bundle.bundle_dir / "expected_verdict.json",
+        "report": report_path if path_exists(report_path) else None,
+    }
+
+
+
+def build_export_row(bundle: BundleRef, mapping: dict[str, Any]) -> dict[str, Any]:
+    """Build the export row for ``bundle``; its payloads are shared ``DOCUMENT_CACHE`` entries, so copy before mutating them."""
+    sources = bundle_source_paths(bundle)
+    goal_path = sources["goal"]
+    goal = load_normalized_json(goal_path)
+    artifact_path = sources["artifact"]
+    verdict_path = sources["verdict"]
+    report_path = sources["report"]
+    artifact = load_normalized_json(artifact_path)
+    verdict = load_normalized_json(verdict_path)
+    report = load_normalized_json(report_path) if report_path is not None else None
 
     goal_metadata = dict(goal.get("metadata") or {})
     request = dict(verdict.get("request") or artifact.get("request") or {})
@@ -152,7 +271,7 @@ def build_export_row(bundle: BundleRef, mapping: dict[str, Any]) -> dict[str, An
             "goal": goal_path.as_posix(),
             "artifact": artifact_path.as_posix(),
             "verdict": verdict_path.as_posix(),
-            "report": report_path.as_posix() if report_path.exists() else None,
+            "report": report_path.as_posix() if report_path is not None else None,
         },
         "input": goal,
         "artifact": artifact,
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Report rows added, removed or changed between two BLUX cA exports from their Merkle manifests."""
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import sys
+
+from export_merkle import ExportMerkle, diff_export_merkles, export_merkle_path, merkle_row_fields
+
+CHECK_MODES = ("all", "changed")
+
+
+def resolve_manifest(path: pathlib.Path) -> tuple[pathlib.Path, pathlib.Path]:
+    """Return (manifest, export) for an export path or a ``.merkle.json`` path."""
+    if path.name.endswith(".merkle.json"):
+        return path, path.with_name(path.name.removesuffix(".merkle.json"))
+    return export_merkle_path(path), path
+
+
+def describe(key: tuple[str, str]) -> str:
+    fields = merkle_row_fields(*key)
+    text = (
+        f"{fields['fixture_id']} policy_pack={fields['policy_pack_id']} "
+        f"profile={fields['profile_id'] or 'default'} archive={fields['archive_version'] or '-'}"
+    )
+    # Rows that share a sort key are numbered in export order.
+    return f"{text} #{fields['ordinal']}" if fields["ordinal"] else text
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("old", help="Earlier export (or its .merkle.json manifest).")
+    parser.add_argument("new", help="Later export (or its .merkle.json manifest).")
+    parser.add_argument("--json", action="store_true", help="Print the diff as JSON instead of text.")
+    parser.add_argument("--check", nargs="?", const="all", choices=CHECK_MODES, default=None, help="Also re-hash rows of the new export against its manifest: every row (all, the default) or only added and changed rows (changed).")
+
+
+def run(args: argparse.Namespace) -> int:
+    old_manifest, _ = resolve_manifest(pathlib.Path(args.old))
+    new_manifest, new_export = resolve_manifest(pathlib.Path(args.new))
+    old, new = ExportMerkle(old_manifest), ExportMerkle(new_manifest)
+    diff = diff_export_merkles(old, new)
+
+    corrupt: list[tuple[str, str]] = []
+    tree_problems: list[str] = []
+    if args.check:
+        if not new_export.exists():
+            raise SystemExit(f"Export not found: {new_export}")
+        tree_problems = new.check_tree()
+        corrupt = new.check_rows(new_export, None if args.check == "all" else diff.added + diff.changed)
+
+    if args.json:
+        result = {
+            "old": {"manifest": old_manifest.as_posix(), "root": old.root, "rows": old.rows, "sha256": old.sha256},
+            "new": {"manifest": new_manifest.as_posix(), "root": new.root, "rows": new.rows, "sha256": new.sha256},
+            "added": [merkle_row_fields(*key) for key in diff.added],
+            "removed": [merkle_row_fields(*key) for key in diff.removed],
+            "changed": [merkle_row_fields(*key) for key in diff.changed],
+            "nodes_visited": diff.visited,
+        }
+        if args.check:
+            result["check"] = {"mode": args.check, "tree_problems": tree_problems, "corrupt": [merkle_row_fields(*key) for key in corrupt]}
+        print(json.dumps(result, indent=2, sort_keys=True))
+    else:
+        for label, keys in (("ADDED", diff.added), ("REMOVED", diff.removed), ("CHANGED", diff.changed)):
+            for key in keys:
+                print(f"{label}: {describe(key)}")
+        for problem in tree_problems:
+            print(f"FAIL: Merkle node {problem} in {new_manifest} does not match its children.")
+        for key in corrupt:
+            print(f"FAIL: row {describe(key)} in {new_export} does not match its Merkle leaf hash.")
+        print(
+            f"{len(diff.added)} added, {len(diff.removed)} removed, {len(diff.changed)} changed "
+            f"({old.rows} -> {new.rows} rows; root {old.root[:12]} -> {new.root[:12]}; {diff.visited} nodes visited)."
+        )
+    if tree_problems or corrupt:
+        return 2
+    return 1 if diff.added or diff.removed or diff.changed else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Diff two exports by walking only the differing subtrees of their Merkle manifests (export_jsonl.py --write-merkle).")
+    add_arguments(parser)
+    return run(parser.parse_args())
+
+
+if __name__ == "__main__":
+    sys.exit(main())
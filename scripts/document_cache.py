@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Per-process LRU of decoded JSON documents, so each unchanged file is read and decoded once."""
+from __future__ import annotations
+
+import os
+import pathlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from timings import TIMINGS
+
+DOCUMENT_CACHE_MAX_ENTRIES = int(os.environ.get("BLUX_DATASET_CACHE_ENTRIES", "8192"))
+
+_UNSET = object()
+
+
+@dataclass
+class _CachedDocument:
+    signature: tuple[int, int]
+    raw: Any
+    normalized: Any = _UNSET
+
+
+class DocumentCache:
+    """Bounded LRU of decoded JSON documents and their normalized forms; entries are shared and read-only."""
+
+    def __init__(
+        self,
+        signature: Callable[[pathlib.Path], tuple[int, int]],
+        decode: Callable[[pathlib.Path], Any],
+        normalize: Callable[[Any], Any],
+        max_entries: int = DOCUMENT_CACHE_MAX_ENTRIES,
+    ) -> None:
+        self._signature = signature
+        self._decode = decode
+        self._normalize = normalize
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, _CachedDocument] = OrderedDict()
+
+    def _entry(self, path: pathlib.Path) -> _CachedDocument:
+        signature = self._signature(path)
+        key = os.fspath(path)
+        entry = self._entries.get(key)
+        if entry is not None and entry.signature == signature:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+        self.misses += 1
+        with TIMINGS.phase("load_json", signature[0]):
+            entry = _CachedDocument(signature, self._decode(path))
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return entry
+
+    def load(self, path: pathlib.Path) -> Any:
+        return self._entry(path).raw
+
+    def load_normalized(self, path: pathlib.Path) -> Any:
+        entry = self._entry(path)
+        if entry.normalized is _UNSET:
+            with TIMINGS.phase("normalize"):
+                entry.normalized = self._normalize(entry.raw)
+        return entry.normalized
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def counters(self) -> tuple[int, int, int]:
+        return self.hits, self.misses, self.evictions
+
+    def merge_counters(self, counters: tuple[int, int, int]) -> None:
+        """Fold hit/miss/eviction counts gathered in a worker process into this cache's totals."""
+        hits, misses, evictions = counters
+        self.hits += hits
+        self.misses += misses
+        self.evictions += evictions
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
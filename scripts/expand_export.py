@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Expand a deduplicated (export_jsonl.py --dedup) or SQLite (--format sqlite) BLUX cA export back to the canonical JSONL file."""
+from __future__ import annotations
+
+import argparse
+import pathlib
+import sys
+
+from export_dedup import DedupExportReader, dedup_export_paths
+from export_jsonl import CANONICAL_EXPORT_PATH, atomic_output
+from export_sqlite import SqliteExportReader, sqlite_export_path
+
+
+def expand_export(export_path: pathlib.Path, output: pathlib.Path) -> tuple[int, str]:
+    """Write the canonical export for the deduplicated layout of ``export_path`` to ``output``.
+
+    The output only replaces ``output`` when its SHA-256 matches the one recorded in the
+    deduplicated manifest.
+    """
+    with DedupExportReader(export_path) as reader:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with atomic_output(output) as handle:
+            digest = reader.expand(handle)
+            if digest != reader.manifest["sha256"]:
+                raise SystemExit(f"Expanded export sha256 {digest} does not match {dedup_export_paths(export_path)[2]} ({reader.manifest['sha256']}).")
+        return len(reader), digest
+
+
+def expand_sqlite_export(export_path: pathlib.Path, output: pathlib.Path) -> tuple[int, str]:
+    """Write the canonical export stored in the SQLite database for ``export_path`` to ``output``.
+
+    The output only replaces ``output`` when its SHA-256 matches the one recorded in the database.
+    """
+    database = sqlite_export_path(export_path)
+    with SqliteExportReader(database) as reader:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with atomic_output(output) as handle:
+            digest = reader.expand(handle)
+            if digest != reader.meta["sha256"]:
+                raise SystemExit(f"Expanded export sha256 {digest} does not match {database} ({reader.meta['sha256']}).")
+        return len(reader), digest
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Expand a deduplicated or SQLite export back to canonical JSONL, byte for byte.")
+    parser.add_argument("--export", default=CANONICAL_EXPORT_PATH.as_posix(), help="Canonical export path whose .dedup.json/.dedup.jsonl/.blobs.jsonl (or .sqlite) siblings are read (default: %(default)s).")
+    parser.add_argument("--format", choices=("dedup", "sqlite"), default="dedup", help="Layout to expand: the deduplicated files or the SQLite database (default: %(default)s).")
+    parser.add_argument("--output", default=None, help="Where to write the expanded JSONL (default: the --export path).")
+    parser.add_argument("--write-sha256", action="store_true", help="Write a sibling .sha256 file for the expanded output.")
+    args = parser.parse_args()
+
+    export_path = pathlib.Path(args.export)
+    output = pathlib.Path(args.output) if args.output else export_path
+    expand = expand_sqlite_export if args.format == "sqlite" else expand_export
+    row_count, digest = expand(export_path, output)
+    if args.write_sha256:
+        output.with_suffix(output.suffix + ".sha256").write_text(f"{digest}  {output.name}\n", encoding="utf-8")
+    print(f"Expanded {row_count} rows to {output}.")
+    print(f"sha256={digest}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Reproducible gzip/xz/bz2 writers and transparent readers for compressed exports."""
+from __future__ import annotations
+
+import importlib
+import pathlib
+from typing import BinaryIO
+
+EXPORT_COMPRESSIONS = {"gzip": ".gz", "xz": ".xz", "bz2": ".bz2"}
+# Magic bytes and stdlib module per compression; modules are imported only when a compressed export is used.
+_COMPRESSION_FORMATS = {"gzip": (b"\x1f\x8b", "gzip"), "xz": (b"\xfd7zXZ\x00", "lzma"), "bz2": (b"BZh", "bz2")}
+
+
+def compressed_writer(handle: BinaryIO, compression: str) -> BinaryIO:
+    """Wrap ``handle`` in a compressor whose output depends only on the bytes written; closing it leaves ``handle`` open."""
+    if compression == "gzip":
+        import gzip
+
+        return gzip.GzipFile(filename="", mode="wb", fileobj=handle, compresslevel=9, mtime=0)
+    if compression == "xz":
+        import lzma
+
+        return lzma.LZMAFile(handle, "wb", format=lzma.FORMAT_XZ, check=lzma.CHECK_CRC64, preset=6)
+    if compression == "bz2":
+        import bz2
+
+        return bz2.BZ2File(handle, "wb", compresslevel=9)
+    raise SystemExit(f"Unsupported export compression: {compression} (choose from {', '.join(EXPORT_COMPRESSIONS)})")
+
+
+def export_compression(path: pathlib.Path) -> str | None:
+    """Detect gzip/xz/bz2 from the file's magic bytes; None for plain JSONL."""
+    with path.open("rb") as handle:
+        magic = handle.read(6)
+    for name, (prefix, _) in _COMPRESSION_FORMATS.items():
+        if magic.startswith(prefix):
+            return name
+    return None
+
+
+def open_export(path: pathlib.Path) -> BinaryIO:
+    """Open a JSONL export for binary reading, decompressing gzip/xz/bz2 transparently."""
+    compression = export_compression(path)
+    return importlib.import_module(_COMPRESSION_FORMATS[compression][1]).open(path, "rb") if compression else path.open("rb")
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""Content-addressed deduplicated export layout: blob table writer and lazy reader."""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pathlib
+import re
+from collections import Counter
+from typing import Any, BinaryIO, Iterator
+
+from dataset_common import VOLATILE_KEYS, canonical_dumps
+
+DEDUP_FIELDS = ("input", "artifact", "verdict", "report")
+DEDUP_FORMAT = 1
+# Values whose canonical JSON is shorter than this stay inline: a reference plus its blob line costs ~150 bytes.
+DEDUP_MIN_BYTES = int(os.environ.get("BLUX_DATASET_DEDUP_MIN_BYTES", "256"))
+_BLOB_REFERENCE = re.compile(rb'\{"\$blob":"([0-9a-f]{64})"\}')
+_BLOB_KEY = b'{"$blob":'
+_BLOB_LINE_PREFIX = b'{"payload":'
+_BLOB_LINE_SUFFIX_BYTES = len(b',"sha256":""}\n') + 64
+
+
+def dedup_export_paths(export_path: pathlib.Path) -> tuple[pathlib.Path, pathlib.Path, pathlib.Path]:
+    """Return the slim rows, blob table and manifest paths of the deduplicated layout of ``export_path``."""
+    stem = export_path.name.removesuffix(".jsonl")
+    return (
+        export_path.with_name(f"{stem}.dedup.jsonl"),
+        export_path.with_name(f"{stem}.blobs.jsonl"),
+        export_path.with_name(f"{stem}.dedup.json"),
+    )
+
+
+def expand_blob_references(data: bytes, blobs: dict[str, bytes], *, keep_missing: bool = False) -> bytes:
+    """Splice blob payload bytes (recursively) back in place of ``{"$blob": ...}`` references."""
+    # A nested value serializes exactly as it does on its own, and a {"$blob":"..."} literal cannot
+    # occur inside an escaped JSON string, so splicing bytes equals re-encoding the rebuilt value.
+
+    def splice(match: re.Match[bytes]) -> bytes:
+        digest = match.group(1).decode("ascii")
+        if keep_missing and digest not in blobs:
+            return match.group(0)
+        return expand_blob_references(blobs[digest], blobs, keep_missing=keep_missing)
+
+    return _BLOB_REFERENCE.sub(splice, data)
+
+
+def _is_blob_reference(value: Any) -> bool:
+    return isinstance(value, dict) and len(value) == 1 and "$blob" in value
+
+
+def _contains_blob_reference(value: Any) -> bool:
+    if isinstance(value, dict):
+        return _is_blob_reference(value) or any(_contains_blob_reference(member) for member in value.values())
+    if isinstance(value, list):
+        return any(_contains_blob_reference(member) for member in value)
+    return False
+
+
+def reject_blob_literals(row: dict[str, Any], line: bytes, label: str) -> None:
+    """Refuse a row whose data already holds a ``{"$blob": ...}`` object, which the layout cannot tell from a reference."""
+    if _BLOB_KEY in line and _contains_blob_reference(row):
+        raise SystemExit(f"{label} contains a literal {{\"$blob\": ...}} object, which --dedup would read back as a blob reference; export it without --dedup.")
+
+
+class BlobTable:
+    """Content-addressed store that replaces export payloads (and their large members) with ``{"$blob": sha256}`` references."""
+
+    def __init__(self, min_bytes: int = DEDUP_MIN_BYTES) -> None:
+        self.min_bytes = min_bytes
+        self.blobs: dict[str, bytes] = {}
+        self.uses: Counter[str] = Counter()
+
+    def _store(self, stored: bytes, canonical: bytes) -> dict[str, str] | None:
+        if len(canonical) < self.min_bytes:
+            return None
+        digest = hashlib.sha256(canonical).hexdigest()
+        self.uses[digest] += 1
+        if digest in self.blobs:
+            return {"$blob": digest}
+        self.blobs[digest] = stored
+        for nested in _BLOB_REFERENCE.findall(stored):
+            self.uses[nested.decode("ascii")] += 1
+        return {"$blob": digest}
+
+    def add(self, payload: Any) -> Any:
+        if not isinstance(payload, dict):
+            return payload
+        slim = dict(payload)
+        for key, value in payload.items():
+            if isinstance(value, (dict, list)) and key not in VOLATILE_KEYS:
+                value_bytes = canonical_dumps(value).encode("utf-8")
+                digest = hashlib.sha256(value_bytes).hexdigest()
+                if digest in self.blobs or len(value_bytes) >= self.min_bytes:
+                    slim[key] = {"$blob": digest}
+                    self.blobs.setdefault(digest, value_bytes)
+        stored = canonical_dumps(slim).encode("utf-8")
+        canonical = expand_blob_references(stored, self.blobs)
+        reference = self._store(stored, canonical)
+        if reference is None:
+            return payload
+        return reference
+
+    def inline_singletons(self) -> dict[str, bytes]:
+        """Remove and return blobs referenced only once; splice them back with ``expand_blob_references``."""
+        inline = {digest: self.blobs.pop(digest) for digest in list(self.blobs) if self.uses[digest] <= 1}
+        for digest, stored in self.blobs.items():
+            self.blobs[digest] = expand_blob_references(stored, inline, keep_missing=True)
+        return inline
+
+    def lines(self) -> Iterator[bytes]:
+        # Canonical form of {"payload": ..., "sha256": digest}, sorted by digest; DedupExportReader slices the payload back out.
+        for digest in sorted(self.blobs):
+            yield b"".join((_BLOB_LINE_PREFIX, self.blobs[digest], b',"sha256":"', digest.encode("ascii"), b'"}\n'))
+
+
+class DedupExportReader:
+    """Lazy, read-only access to a deduplicated export (``export_jsonl.py --dedup``); each blob is decoded once."""
+
+    def __init__(self, export_path: pathlib.Path, *, verify_sha256: bool = True) -> None:
+        rows_path, blobs_path, manifest_path = dedup_export_paths(export_path)
+        if not manifest_path.exists():
+            raise SystemExit(f"Deduplicated export manifest missing: {manifest_path}. Re-run export_jsonl.py with --dedup.")
+        self.manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        if self.manifest.get("format") != DEDUP_FORMAT:
+            raise SystemExit(f"Unsupported deduplicated export format in {manifest_path}: {self.manifest.get('format')}")
+        rows_bytes = rows_path.read_bytes()
+        blob_bytes = blobs_path.read_bytes()
+        if verify_sha256:
+            for label, path, data in (("rows", rows_path, rows_bytes), ("blobs", blobs_path, blob_bytes)):
+                digest = hashlib.sha256(data).hexdigest()
+                if digest != self.manifest.get(f"{label}_sha256"):
+                    raise SystemExit(f"Stale deduplicated export {path}: sha256 {self.manifest.get(f'{label}_sha256')} != {digest}")
+        self._rows = rows_bytes.splitlines(keepends=True)
+        self._blobs: dict[str, bytes] = {}
+        for line in blob_bytes.splitlines(keepends=True):
+            digest = line[-67:-3].decode("ascii")
+            self._blobs[digest] = line[len(_BLOB_LINE_PREFIX):-_BLOB_LINE_SUFFIX_BYTES]
+        self._decoded: dict[str, Any] = {}
+        if len(self._rows) != self.manifest.get("rows") or len(self._blobs) != self.manifest.get("blobs"):
+            raise SystemExit(f"Deduplicated export {rows_path} does not match its manifest row/blob counts.")
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __enter__(self) -> DedupExportReader:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._rows = []
+        self._blobs = {}
+        self._decoded = {}
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for row_number in range(len(self._rows)):
+            yield self.row(row_number)
+
+    def _members(self, value: Any) -> Any:
+        if isinstance(value, dict) and any(_is_blob_reference(member) for member in value.values()):
+            return {key: self.blob(member["$blob"]) if _is_blob_reference(member) else member for key, member in value.items()}
+        return value
+
+    def blob(self, digest: str) -> Any:
+        if digest not in self._decoded:
+            self._decoded[digest] = self._members(json.loads(self._blobs[digest]))
+        return self._decoded[digest]
+
+    def raw_row(self, row_number: int) -> bytes:
+        return expand_blob_references(self._rows[row_number], self._blobs)
+
+    def row(self, row_number: int) -> dict[str, Any]:
+        row = json.loads(self._rows[row_number])
+        for field in DEDUP_FIELDS:
+            value = row[field]
+            row[field] = self.blob(value["$blob"]) if _is_blob_reference(value) else self._members(value)
+        return row
+
+    def expand(self, handle: BinaryIO) -> str:
+        """Write the canonical export to ``handle`` and return its SHA-256."""
+        hasher = hashlib.sha256()
+        for line in self._rows:
+            expanded = expand_blob_references(line, self._blobs)
+            handle.write(expanded)
+            hasher.update(expanded)
+        return hasher.hexdigest()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Row index sidecar for JSONL exports and the memory-mapped reader that uses it."""
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import pathlib
+from typing import Any, BinaryIO, Iterator
+
+from export_compression import export_compression, open_export
+
+EXPORT_INDEX_FIELDS = ("fixture_id", "policy_pack_id", "profile_id", "archive_version")
+
+
+def export_index_path(export_path: pathlib.Path) -> pathlib.Path:
+    return export_path.with_suffix(export_path.suffix + ".index.json")
+
+
+class ExportIndexBuilder:
+    """Collect row byte spans and metadata lookups while an export is written."""
+
+    def __init__(self) -> None:
+        self.spans: list[list[int]] = []
+        self.lookup: dict[str, dict[Any, list[int]]] = {field: {} for field in EXPORT_INDEX_FIELDS}
+        self._offset = 0
+
+    def add(self, length: int, metadata: dict[str, Any]) -> None:
+        row_number = len(self.spans)
+        self.spans.append([self._offset, length])
+        self._offset += length
+        for field in EXPORT_INDEX_FIELDS:
+            self.lookup[field].setdefault(metadata.get(field), []).append(row_number)
+
+    def write(self, export_path: pathlib.Path, sha256: str) -> pathlib.Path:
+        path = export_index_path(export_path)
+        index = {
+            "export": export_path.name,
+            "sha256": sha256,
+            "size": self._offset,
+            "rows": self.spans,
+            # JSON object keys cannot be null, so lookups are stored as value/rows pairs.
+            "lookup": {
+                field: [{"value": value, "rows": rows} for value, rows in values.items()]
+                for field, values in self.lookup.items()
+            },
+        }
+        path.write_text(json.dumps(index, separators=(",", ":"), sort_keys=True) + "\n", encoding="utf-8")
+        return path
+
+
+
+class ExportReader:
+    """Random access to a memory-mapped JSONL export through its ``.index.json``; a stale index is rejected."""
+
+    def __init__(self, export_path: pathlib.Path, *, verify_sha256: bool = True) -> None:
+        self.export_path = export_path
+        index_path = export_index_path(export_path)
+        if not export_path.exists():
+            raise SystemExit(f"Export not found: {export_path}")
+        if not index_path.exists():
+            raise SystemExit(f"Export index missing: {index_path}. Re-run export_jsonl.py with --write-index.")
+        index = json.loads(index_path.read_text(encoding="utf-8"))
+        self._spans: list[list[int]] = index["rows"]
+        self._lookup: dict[str, dict[Any, list[int]]] = {
+            field: {entry["value"]: entry["rows"] for entry in entries} for field, entries in index["lookup"].items()
+        }
+        self._map: mmap.mmap | None = None
+        self._handle: BinaryIO | None = None
+        if export_compression(export_path):
+            with open_export(export_path) as handle:
+                self._buffer: bytes | mmap.mmap = handle.read()
+        else:
+            self._handle = export_path.open("rb")
+            size = export_path.stat().st_size
+            self._map = mmap.mmap(self._handle.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+            self._buffer = self._map if self._map is not None else b""
+        if index.get("size") != len(self._buffer):
+            size = len(self._buffer)
+            self.close()
+            raise SystemExit(f"Stale export index {index_path}: size {index.get('size')} != {size}")
+        if verify_sha256:
+            digest = hashlib.sha256(self._buffer).hexdigest()
+            if digest != index.get("sha256"):
+                self.close()
+                raise SystemExit(f"Stale export index {index_path}: sha256 {index.get('sha256')} != {digest}")
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def __enter__(self) -> ExportReader:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._buffer = b""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def raw_row(self, row_number: int) -> bytes:
+        offset, length = self._spans[row_number]
+        return self._buffer[offset:offset + length]
+
+    def row(self, row_number: int) -> dict[str, Any]:
+        return json.loads(self.raw_row(row_number))
+
+    def row_numbers(self, **filters: Any) -> list[int]:
+        """Row numbers whose metadata matches every ``field=value`` filter (``None`` matches null)."""
+        unknown = set(filters) - set(EXPORT_INDEX_FIELDS)
+        if unknown:
+            raise SystemExit(f"Unsupported export index fields: {', '.join(sorted(unknown))}")
+        if not filters:
+            return list(range(len(self._spans)))
+        candidates = sorted((self._lookup[field].get(value, []) for field, value in filters.items()), key=len)
+        matches = set(candidates[0]).intersection(*candidates[1:])
+        return sorted(matches)
+
+    def find(self, **filters: Any) -> Iterator[dict[str, Any]]:
+        for row_number in self.row_numbers(**filters):
+            yield self.row(row_number)
@@ -3,13 +3,43 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
 import hashlib
+import json
+import os
 import pathlib
 import sys
+import tempfile
+from functools import partial
+from typing import TYPE_CHECKING, Any, BinaryIO, Iterable, Iterator
 
-from dataset_common import build_export_row, canonical_dumps, fixture_dirs, iter_expected_bundles, read_mapping
+from dataset_common import (
+    BundleRef,
+    DATASET_MAPPING_PATH,
+    DATASET_VERSION_PATH,
+    build_export_row,
+    bundle_source_paths,
+    canonical_dumps,
+    file_sha256,
+    fixture_dirs,
+    format_cache_stats,
+    iter_expected_bundles,
+    load_normalized_json,
+    read_mapping,
+)
+from export_compression import EXPORT_COMPRESSIONS, compressed_writer
+from export_dedup import BlobTable, DEDUP_FIELDS, DEDUP_FORMAT, dedup_export_paths, expand_blob_references, reject_blob_literals
+from export_index import EXPORT_INDEX_FIELDS, ExportIndexBuilder, export_index_path
+from export_merkle import ExportMerkleBuilder, export_merkle_path
+from export_sqlite import SqliteExportWriter, sqlite_export_path
+from timings import TIMINGS, configure_timings, emit_timings, init_worker_timings
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
 
 CANONICAL_EXPORT_PATH = pathlib.Path("exports/blux-ca-dataset.jsonl")
+# Bump whenever build_export_row()/canonical_dumps() output changes so stale manifests are not reused.
+EXPORT_MANIFEST_VERSION = 2
 
 def sort_key(row: dict) -> tuple[str, int, str, str, str]:
     metadata = row["metadata"]
@@ -23,35 +53,580 @@ def sort_key(row: dict) -> tuple[str, int, str, str, str]:
 
 
 
-def main() -> int:
-    parser = argparse.ArgumentParser(description="Export deterministic BLUX cA JSONL rows.")
+def bundle_sort_key(bundle: BundleRef) -> tuple[str, int, str, str, str]:
+    """Return ``sort_key()`` of the row ``build_export_row(bundle)`` would produce, without building it."""
+    goal_metadata = load_normalized_json(bundle.fixture_dir / "goal.json").get("metadata") or {}
+    request = load_normalized_json(bundle.bundle_dir / "expected_verdict.json").get("request")
+    if not request:
+        request = load_normalized_json(bundle.bundle_dir / "expected_artifact.json").get("request") or {}
+    profile_id = request.get("profile_id", bundle.profile_id or goal_metadata.get("profile_id"))
+    return (
+        goal_metadata.get("fixture_id", bundle.fixture_dir.name),
+        0 if bundle.archive_version is None else 1,
+        bundle.archive_version or "",
+        profile_id or "",
+        request.get("policy_pack_id", bundle.policy_pack_id),
+    )
+
+
+
+def iter_export_bundles(mapping: dict[str, Any], include_archives: bool) -> Iterable[BundleRef]:
+    for fixture_dir in fixture_dirs():
+        for bundle in iter_expected_bundles(fixture_dir, mapping["dataset_version"]):
+            if bundle.archive_version is not None and not include_archives:
+                continue
+            yield bundle
+
+
+
+def export_rows(
+    output: pathlib.Path,
+    mapping: dict[str, Any],
+    include_archives: bool,
+    index: ExportIndexBuilder | None = None,
+    merkle: ExportMerkleBuilder | None = None,
+) -> tuple[int, str]:
+    encoded = [encode_bundle(bundle, mapping) for bundle in iter_export_bundles(mapping, include_archives)]
+    with TIMINGS.phase("sort"):
+        encoded.sort(key=lambda item: sort_key(item[0]))
+    if index is not None:
+        for row, line in encoded:
+            index.add(len(line), row["metadata"])
+    if merkle is not None:
+        for row, line in encoded:
+            merkle.add(sort_key(row), line)
+    jsonl = b"".join(line for _, line in encoded)
+    with TIMINGS.phase("write", len(jsonl)):
+        output.write_bytes(jsonl)
+    with TIMINGS.phase("hash", len(jsonl)):
+        digest = hashlib.sha256(jsonl).hexdigest()
+    return len(encoded), digest
+
+
+
+@contextlib.contextmanager
+def atomic_output(output: pathlib.Path) -> Iterator[BinaryIO]:
+    """Yield a temp file next to ``output`` that replaces it only if the block completes."""
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{output.name}.", suffix=".tmp", dir=output.parent)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            yield handle
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, output)
+    except BaseException:
+        pathlib.Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+
+def encode_row(row: dict[str, Any]) -> bytes:
+    return f"{canonical_dumps(row)}\n".encode("utf-8")
+
+
+
+def encode_bundle(bundle: BundleRef, mapping: dict[str, Any]) -> tuple[dict[str, Any], bytes]:
+    """Build and encode the export row for ``bundle``, timed against its fixture."""
+    with TIMINGS.fixture(bundle.fixture_dir.name):
+        row = build_export_row(bundle, mapping)
+        return row, encode_row(row)
+
+
+
+def stream_export_rows(
+    output: pathlib.Path,
+    mapping: dict[str, Any],
+    include_archives: bool,
+    index: ExportIndexBuilder | None = None,
+    compression: str | None = None,
+    merkle: ExportMerkleBuilder | None = None,
+) -> tuple[int, str]:
+    """Write the export one row at a time, hashing incrementally, then atomically replace ``output``.
+
+    Only bundle references and their sort keys are held in memory; the bytes are identical to
+    ``export_rows()``. With ``compression`` the rows stream through a reproducible compressor;
+    the returned sha256 (and any index or Merkle tree) still describes the uncompressed JSONL stream.
+    """
+    bundles = list(iter_export_bundles(mapping, include_archives))
+    with TIMINGS.phase("sort"):
+        bundles.sort(key=bundle_sort_key)
+    hasher = hashlib.sha256()
+    with atomic_output(output) as raw, (compressed_writer(raw, compression) if compression else contextlib.nullcontext(raw)) as handle:
+        for bundle in bundles:
+            row, line = encode_bundle(bundle, mapping)
+            handle.write(line)
+            hasher.update(line)
+            if index is not None:
+                index.add(len(line), row["metadata"])
+            if merkle is not None:
+                merkle.add(sort_key(row), line)
+    return len(bundles), hasher.hexdigest()
+
+
+
+def dedup_export_rows(output: pathlib.Path, mapping: dict[str, Any], include_archives: bool) -> tuple[int, str, dict[str, Any]]:
+    """Write the deduplicated layout of ``output``: slim rows, a content-addressed blob table and a manifest.
+
+    ``DEDUP_FIELDS`` payloads (and their bulky members) that recur are replaced by
+    ``{"$blob": sha256}`` references and stored once in the blob table, sorted by hash; values
+    used by a single row are spliced back inline, where a reference would only add bytes. Rows
+    stream in canonical order through a temp file of fully referenced rows, and the returned
+    sha256 is the canonical export's. A row that already holds a ``{"$blob": ...}`` object is
+    refused, since it would read back as a reference.
+    """
+    bundles = list(iter_export_bundles(mapping, include_archives))
+    with TIMINGS.phase("sort"):
+        bundles.sort(key=bundle_sort_key)
+    rows_path, blobs_path, dedup_manifest_path = dedup_export_paths(output)
+    table = BlobTable()
+    hasher = hashlib.sha256()
+    expanded_bytes = 0
+    with tempfile.TemporaryFile(dir=output.parent) as referenced:
+        for bundle in bundles:
+            with TIMINGS.fixture(bundle.fixture_dir.name):
+                row = build_export_row(bundle, mapping)
+                line = encode_row(row)
+                reject_blob_literals(row, line, f"Bundle {bundle.bundle_dir.as_posix()}")
+                for field in DEDUP_FIELDS:
+                    row[field] = table.add(row[field])
+                slim = encode_row(row)
+            referenced.write(slim)
+            hasher.update(line)
+            expanded_bytes += len(line)
+
+        inline = table.inline_singletons()
+        referenced.seek(0)
+        rows_hasher = hashlib.sha256()
+        rows_bytes = 0
+        with atomic_output(rows_path) as handle:
+            for slim in referenced:
+                slim = expand_blob_references(slim, inline, keep_missing=True)
+                handle.write(slim)
+                rows_hasher.update(slim)
+                rows_bytes += len(slim)
+
+    blobs_hasher = hashlib.sha256()
+    blobs_bytes = 0
+    with atomic_output(blobs_path) as handle:
+        for line in table.lines():
+            handle.write(line)
+            blobs_hasher.update(line)
+            blobs_bytes += len(line)
+
+    manifest = {
+        "format": DEDUP_FORMAT,
+        "rows": len(bundles),
+        "blobs": len(table.blobs),
+        "rows_file": rows_path.name,
+        "rows_sha256": rows_hasher.hexdigest(),
+        "blobs_file": blobs_path.name,
+        "blobs_sha256": blobs_hasher.hexdigest(),
+        "sha256": hasher.hexdigest(),
+        "expanded_bytes": expanded_bytes,
+        "dedup_bytes": rows_bytes + blobs_bytes,
+    }
+    dedup_manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return len(bundles), manifest["sha256"], manifest
+
+
+
+def sqlite_export_rows(output: pathlib.Path, mapping: dict[str, Any], include_archives: bool) -> tuple[int, str]:
+    """Write the SQLite export (see ``SqliteExportWriter``); the sha256 is the canonical JSONL export's."""
+    bundles = list(iter_export_bundles(mapping, include_archives))
+    with TIMINGS.phase("sort"):
+        bundles.sort(key=bundle_sort_key)
+    writer = SqliteExportWriter(output)
+    try:
+        for bundle in bundles:
+            with TIMINGS.fixture(bundle.fixture_dir.name):
+                writer.add(build_export_row(bundle, mapping))
+        return writer.finish()
+    except BaseException:
+        writer.abort()
+        raise
+
+
+
+def shard_path(output: pathlib.Path, index: int, count: int) -> pathlib.Path:
+    return output.with_name(f"{output.stem}-{index:05d}-of-{count:05d}{output.suffix}")
+
+
+
+def shard_manifest_path(output: pathlib.Path) -> pathlib.Path:
+    return output.with_name(f"{output.stem}.shards.json")
+
+
+
+def _encoded_lengths_job(bundles: list[BundleRef], mapping: dict[str, Any]) -> tuple[list[int], dict[str, Any] | None]:
+    return [len(encode_bundle(bundle, mapping)[1]) for bundle in bundles], TIMINGS.drain()
+
+
+
+def _write_shard_job(job: tuple[pathlib.Path, list[BundleRef]], mapping: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any] | None]:
+    path, bundles = job
+    hasher = hashlib.sha256()
+    size = 0
+    first_key = last_key = None
+    with atomic_output(path) as handle:
+        for bundle in bundles:
+            row, line = encode_bundle(bundle, mapping)
+            handle.write(line)
+            hasher.update(line)
+            size += len(line)
+            last_key = list(sort_key(row))
+            if first_key is None:
+                first_key = last_key
+    entry = {
+        "file": path.name,
+        "rows": len(bundles),
+        "bytes": size,
+        "sha256": hasher.hexdigest(),
+        "first_key": first_key,
+        "last_key": last_key,
+    }
+    return entry, TIMINGS.drain()
+
+
+
+def plan_shards(
+    bundles: list[BundleRef],
+    mapping: dict[str, Any],
+    *,
+    shard_rows: int | None,
+    shard_bytes: int | None,
+    executor: ProcessPoolExecutor,
+    jobs: int,
+) -> list[list[BundleRef]]:
+    """Split sorted bundles into contiguous shards; boundaries depend only on row order and sizes."""
+    if shard_rows:
+        return [bundles[start:start + shard_rows] for start in range(0, len(bundles), shard_rows)] or [[]]
+    assert shard_bytes
+    chunk = max(1, len(bundles) // (jobs * 4))
+    chunks = [bundles[start:start + chunk] for start in range(0, len(bundles), chunk)]
+    lengths: list[int] = []
+    for part, timings in executor.map(partial(_encoded_lengths_job, mapping=mapping), chunks):
+        lengths.extend(part)
+        TIMINGS.merge(timings)
+    shards: list[list[BundleRef]] = [[]]
+    current = 0
+    for bundle, length in zip(bundles, lengths):
+        if shards[-1] and current + length > shard_bytes:
+            shards.append([])
+            current = 0
+        shards[-1].append(bundle)
+        current += length
+    return shards
+
+
+
+def sharded_export_rows(
+    output: pathlib.Path,
+    mapping: dict[str, Any],
+    include_archives: bool,
+    *,
+    shard_rows: int | None,
+    shard_bytes: int | None,
+    jobs: int,
+    write_sha256: bool = False,
+) -> tuple[int, str, list[dict[str, Any]]]:
+    """Write the export as ordered shards in parallel plus a shard manifest.
+
+    Concatenating the shards in index order reproduces the single-file export byte-for-byte;
+    the manifest's top-level ``sha256`` is the digest of that concatenation. Shard ``.sha256``
+    sidecars are rewritten with ``write_sha256`` and removed otherwise, so none is left stale.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    bundles = list(iter_export_bundles(mapping, include_archives))
+    with TIMINGS.phase("sort"):
+        bundles.sort(key=bundle_sort_key)
+    with ProcessPoolExecutor(max_workers=jobs, initializer=init_worker_timings, initargs=(TIMINGS.enabled,)) as executor:
+        shards = plan_shards(bundles, mapping, shard_rows=shard_rows, shard_bytes=shard_bytes, executor=executor, jobs=jobs)
+        paths = [shard_path(output, index, len(shards)) for index in range(len(shards))]
+        entries = []
+        for entry, timings in executor.map(partial(_write_shard_job, mapping=mapping), zip(paths, shards)):
+            entries.append(entry)
+            TIMINGS.merge(timings)
+
+    hasher = hashlib.sha256()
+    for path in paths:
+        with path.open("rb") as handle:
+            for chunk in iter(lambda: handle.read(1 << 20), b""):
+                hasher.update(chunk)
+    digest = hasher.hexdigest()
+
+    manifest = {
+        "export": output.name,
+        "include_archives": include_archives,
+        "rows": len(bundles),
+        "bytes": sum(entry["bytes"] for entry in entries),
+        "sha256": digest,
+        "shard_count": len(entries),
+        "shards": entries,
+    }
+    shard_manifest_path(output).write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+    current = {path.name for path in paths}
+    for stale in output.parent.glob(f"{output.stem}-*-of-*{output.suffix}"):
+        if stale.name not in current:
+            stale.unlink()
+    for sidecar in output.parent.glob(f"{output.stem}-*-of-*{output.suffix}.sha256"):
+        sidecar.unlink()
+    if write_sha256:
+        for path, entry in zip(paths, entries):
+            path.with_suffix(path.suffix + ".sha256").write_text(f"{entry['sha256']}  {entry['file']}\n", encoding="utf-8")
+    return len(bundles), digest, entries
+
+
+
+def manifest_path(output: pathlib.Path) -> pathlib.Path:
+    return output.with_suffix(output.suffix + ".manifest.json")
+
+
+
+def export_inputs_sha256() -> str:
+    """Hash of the repo-level inputs every row depends on (mapping, dataset version, manifest format)."""
+    hasher = hashlib.sha256(f"export-manifest-{EXPORT_MANIFEST_VERSION}\n".encode("utf-8"))
+    for path in (DATASET_VERSION_PATH, DATASET_MAPPING_PATH):
+        hasher.update(file_sha256(path).encode("ascii"))
+    return hasher.hexdigest()
+
+
+
+def load_export_manifest(output: pathlib.Path, inputs_sha256: str, include_archives: bool) -> dict[str, dict[str, Any]]:
+    """Return previous manifest rows keyed by artifact path, or an empty dict when nothing is reusable."""
+    path = manifest_path(output)
+    if not path.exists() or not output.exists():
+        return {}
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        return {}
+    if (
+        manifest.get("inputs_sha256") != inputs_sha256
+        or manifest.get("include_archives") != include_archives
+        or manifest.get("size") != output.stat().st_size
+    ):
+        return {}
+    return {entry["source_paths"]["artifact"]: entry for entry in manifest.get("rows", [])}
+
+
+
+def incremental_export_rows(
+    output: pathlib.Path,
+    mapping: dict[str, Any],
+    include_archives: bool,
+    index: ExportIndexBuilder | None = None,
+    merkle: ExportMerkleBuilder | None = None,
+) -> tuple[int, str, int]:
+    """Export like ``stream_export_rows()`` but splice unchanged rows from the previous export.
+
+    A row is reused when the manifest from the previous run records identical content hashes
+    for every source file and the mapping/version inputs are unchanged; spliced bytes are
+    checked against the recorded row hash before use. Returns (rows, sha256, rebuilt rows).
+    """
+    inputs_sha256 = export_inputs_sha256()
+    previous = load_export_manifest(output, inputs_sha256, include_archives)
+
+    planned: list[tuple[tuple[str, int, str, str, str], dict[str, Any], BundleRef, dict[str, Any] | None]] = []
+    for bundle in iter_export_bundles(mapping, include_archives):
+        sources = {key: path.as_posix() for key, path in bundle_source_paths(bundle).items() if path is not None}
+        with TIMINGS.fixture(bundle.fixture_dir.name):
+            source_sha256 = {key: file_sha256(pathlib.Path(path)) for key, path in sources.items()}
+        entry = previous.get(sources["artifact"])
+        if entry is not None and entry["source_sha256"] == source_sha256:
+            planned.append((tuple(entry["key"]), source_sha256, bundle, entry))
+        else:
+            planned.append((bundle_sort_key(bundle), source_sha256, bundle, None))
+    with TIMINGS.phase("sort"):
+        planned.sort(key=lambda item: item[0])
+
+    hasher = hashlib.sha256()
+    rows: list[dict[str, Any]] = []
+    rebuilt = 0
+    offset = 0
+    previous_handle = output.open("rb") if previous else None
+    try:
+        with atomic_output(output) as handle:
+            for key, source_sha256, bundle, entry in planned:
+                line = None
+                if entry is not None and previous_handle is not None:
+                    previous_handle.seek(entry["offset"])
+                    line = previous_handle.read(entry["length"])
+                    if hashlib.sha256(line).hexdigest() != entry["sha256"]:
+                        line = None
+                if line is None:
+                    row, line = encode_bundle(bundle, mapping)
+                    key = sort_key(row)
+                    index_fields = {field: row["metadata"][field] for field in EXPORT_INDEX_FIELDS}
+                    rebuilt += 1
+                else:
+                    index_fields = entry["index_fields"]
+                handle.write(line)
+                hasher.update(line)
+                if index is not None:
+                    index.add(len(line), index_fields)
+                if merkle is not None:
+                    merkle.add(key, line)
+                row_sources = bundle_source_paths(bundle)
+                rows.append(
+                    {
+                        "key": list(key),
+                        "index_fields": index_fields,
+                        "source_paths": {k: p.as_posix() if p is not None else None for k, p in row_sources.items()},
+                        "source_sha256": source_sha256,
+                        "offset": offset,
+                        "length": len(line),
+                        "sha256": hashlib.sha256(line).hexdigest(),
+                    }
+                )
+                offset += len(line)
+    finally:
+        if previous_handle is not None:
+            previous_handle.close()
+
+    digest = hasher.hexdigest()
+    manifest = {
+        "manifest_version": EXPORT_MANIFEST_VERSION,
+        "export": output.name,
+        "sha256": digest,
+        "size": offset,
+        "include_archives": include_archives,
+        "inputs_sha256": inputs_sha256,
+        "rows": rows,
+    }
+    manifest_path(output).write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return len(planned), digest, rebuilt
+
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("--include-archives", action="store_true", help="Include archived compatibility examples in the export.")
     parser.add_argument("--write-sha256", action="store_true", help="Write a sibling .sha256 file for the JSONL output.")
-    args = parser.parse_args()
+    parser.add_argument("--stream", action="store_true", help="Write rows one at a time through a temp file with incremental hashing (constant memory).")
+    parser.add_argument("--incremental", action="store_true", help="Rebuild only rows whose source files changed, splicing the rest from the previous export via its manifest sidecar.")
+    parser.add_argument("--write-index", action="store_true", help="Write a sibling .index.json with row byte spans and metadata lookups for random access.")
+    parser.add_argument("--write-merkle", action="store_true", help="Write a sibling .merkle.json with per-row hashes folded into a binary Merkle tree over row identities; compare two with diff_exports.py.")
+    parser.add_argument("--shard-rows", type=int, default=None, help="Write <export>-NNNNN-of-NNNNN.jsonl shards of at most N rows plus a shard manifest instead of one file.")
+    parser.add_argument("--shard-bytes", type=int, default=None, help="Like --shard-rows, but start a new shard before a row would push it past N bytes.")
+    parser.add_argument("--jobs", type=int, default=0, help="Worker processes for sharded export (default: all CPUs).")
+    parser.add_argument("--cache-stats", action="store_true", help="Print document cache hit/miss counters to stderr.")
+    parser.add_argument("--timings", nargs="?", const="-", default=None, help="Record per-phase and per-fixture timings and write a JSON summary to PATH (stderr when omitted); BLUX_DATASET_TIMINGS=PATH does the same.")
+    parser.add_argument("--dedup", action="store_true", help="Write the deduplicated layout (<export>.dedup.jsonl slim rows, .blobs.jsonl, .dedup.json) instead of the plain JSONL file; expand with expand_export.py.")
+    parser.add_argument("--compress", choices=sorted(EXPORT_COMPRESSIONS), default=None, help="Stream rows through a reproducible compressor into <export>.gz/.xz/.bz2 instead of the plain JSONL file.")
+    parser.add_argument("--format", choices=("jsonl", "sqlite"), default="jsonl", help="Output format: the canonical JSONL file, or a SQLite database (<export>.sqlite) with indexed metadata columns that expand_export.py --format sqlite turns back into the canonical JSONL.")
+
+
+def run(args: argparse.Namespace) -> int:
+    sharded = args.shard_rows is not None or args.shard_bytes is not None
+    if args.shard_rows is not None and args.shard_bytes is not None:
+        raise SystemExit("Use either --shard-rows or --shard-bytes, not both.")
+    if (args.shard_rows is not None and args.shard_rows < 1) or (args.shard_bytes is not None and args.shard_bytes < 1):
+        raise SystemExit("Shard sizes must be >= 1.")
+    if sharded and (args.stream or args.incremental or args.write_index or args.write_merkle):
+        raise SystemExit("--shard-rows/--shard-bytes cannot be combined with --stream, --incremental, --write-index, or --write-merkle.")
+    if args.compress and (sharded or args.incremental):
+        raise SystemExit("--compress cannot be combined with --shard-rows/--shard-bytes or --incremental.")
+    if args.dedup and (sharded or args.incremental or args.compress or args.write_index or args.write_merkle):
+        raise SystemExit("--dedup cannot be combined with --shard-rows/--shard-bytes, --incremental, --compress, --write-index, or --write-merkle.")
+
+    if args.format == "sqlite" and (sharded or args.incremental or args.compress or args.dedup or args.write_index or args.write_merkle or args.stream):
+        raise SystemExit("--format sqlite cannot be combined with --shard-rows/--shard-bytes, --incremental, --compress, --dedup, --write-index, --write-merkle, or --stream.")
 
     mapping = read_mapping()
     output = CANONICAL_EXPORT_PATH
+    if args.compress:
+        output = output.with_name(output.name + EXPORT_COMPRESSIONS[args.compress])
     output.parent.mkdir(parents=True, exist_ok=True)
 
-    rows: list[dict] = []
-    for fixture_dir in fixture_dirs():
-        for bundle in iter_expected_bundles(fixture_dir, mapping["dataset_version"]):
-            if bundle.archive_version is not None and not args.include_archives:
-                continue
-            rows.append(build_export_row(bundle, mapping))
+    if sharded:
+        row_count, digest, shards = sharded_export_rows(
+            output,
+            mapping,
+            args.include_archives,
+            shard_rows=args.shard_rows,
+            shard_bytes=args.shard_bytes,
+            jobs=args.jobs or os.cpu_count() or 1,
+            write_sha256=args.write_sha256,
+        )
+        print(f"Exported {row_count} rows to {len(shards)} shards; manifest {shard_manifest_path(output)}.")
+        print(f"sha256={digest}")
+        if args.cache_stats:
+            print(format_cache_stats(), file=sys.stderr)
+        return 0
+
+    if args.format == "sqlite":
+        output = sqlite_export_path(output)
+        row_count, digest = sqlite_export_rows(output, mapping, args.include_archives)
+        if args.write_sha256:
+            output.with_suffix(output.suffix + ".stream.sha256").write_text(f"{digest}  {CANONICAL_EXPORT_PATH.name}\n", encoding="utf-8")
+        print(f"Exported {row_count} rows to {output}.")
+        print(f"sha256={digest}")
+        if args.cache_stats:
+            print(format_cache_stats(), file=sys.stderr)
+        return 0
+
+    if args.dedup:
+        row_count, digest, manifest = dedup_export_rows(output, mapping, args.include_archives)
+        if args.write_sha256:
+            for label in ("rows", "blobs"):
+                name = manifest[f"{label}_file"]
+                output.with_name(f"{name}.sha256").write_text(f"{manifest[f'{label}_sha256']}  {name}\n", encoding="utf-8")
+        saved = 1 - manifest["dedup_bytes"] / manifest["expanded_bytes"] if manifest["expanded_bytes"] else 0.0
+        print(f"Exported {row_count} rows with {manifest['blobs']} shared blobs; manifest {dedup_export_paths(output)[2]}.")
+        print(f"sha256={digest}")
+        print(f"dedup_bytes={manifest['dedup_bytes']} expanded_bytes={manifest['expanded_bytes']} saved={saved:.1%}")
+        if args.cache_stats:
+            print(format_cache_stats(), file=sys.stderr)
+        return 0
 
-    rows.sort(key=sort_key)
-    jsonl = "".join(f"{canonical_dumps(row)}\n" for row in rows)
-    output.write_text(jsonl, encoding="utf-8")
-    digest = hashlib.sha256(jsonl.encode("utf-8")).hexdigest()
+    rebuilt = None
+    compressed_digest = None
+    index = ExportIndexBuilder() if args.write_index else None
+    merkle = ExportMerkleBuilder() if args.write_merkle else None
+    if args.compress:
+        row_count, digest = stream_export_rows(output, mapping, args.include_archives, index, compression=args.compress, merkle=merkle)
+        compressed_digest = file_sha256(output)
+    elif args.incremental:
+        row_count, digest, rebuilt = incremental_export_rows(output, mapping, args.include_archives, index, merkle)
+    elif args.stream:
+        row_count, digest = stream_export_rows(output, mapping, args.include_archives, index, merkle=merkle)
+    else:
+        row_count, digest = export_rows(output, mapping, args.include_archives, index, merkle)
+    if index is not None:
+        index.write(output, digest)
+    if merkle is not None:
+        merkle.write(output, digest)
 
-    if args.write_sha256:
+    if args.write_sha256 and compressed_digest is not None:
+        output.with_suffix(output.suffix + ".sha256").write_text(f"{compressed_digest}  {output.name}\n", encoding="utf-8")
+        output.with_suffix(output.suffix + ".stream.sha256").write_text(f"{digest}  {CANONICAL_EXPORT_PATH.name}\n", encoding="utf-8")
+    elif args.write_sha256:
         output.with_suffix(output.suffix + ".sha256").write_text(f"{digest}  {output.name}\n", encoding="utf-8")
 
-    print(f"Exported {len(rows)} rows to {output}.")
+    print(f"Exported {row_count} rows to {output}.")
     print(f"sha256={digest}")
+    if compressed_digest is not None:
+        print(f"compressed_sha256={compressed_digest}")
+    if rebuilt is not None:
+        print(f"Rebuilt {rebuilt} of {row_count} rows; manifest {manifest_path(output)}.")
+    if index is not None:
+        print(f"Wrote row index {export_index_path(output)}.")
+    if merkle is not None:
+        print(f"Wrote Merkle manifest {export_merkle_path(output)} (root {merkle.root}).")
+    if args.cache_stats:
+        print(format_cache_stats(), file=sys.stderr)
     return 0
 
 
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Export deterministic BLUX cA JSONL rows.")
+    add_arguments(parser)
+    args = parser.parse_args()
+    timings_destination = configure_timings(args.timings)
+    status = run(args)
+    emit_timings(timings_destination, "export_jsonl")
+    return status
+
+
 if __name__ == "__main__":
     sys.exit(main())
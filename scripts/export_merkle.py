@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""Merkle manifests of JSONL exports and the subtree-pruning diff between two of them."""
+from __future__ import annotations
+
+import hashlib
+import json
+import pathlib
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator, Sequence
+
+from export_compression import open_export
+
+EXPORT_MERKLE_FORMAT = 2
+# A node holding at most this many rows is stored as one bucket of leaves instead of being split further.
+MERKLE_BUCKET_ROWS = 16
+MERKLE_PATH_BITS = 64
+
+
+def export_merkle_path(export_path: pathlib.Path) -> pathlib.Path:
+    return export_path.with_suffix(export_path.suffix + ".merkle.json")
+
+
+def merkle_node_hash(children: dict[str, str]) -> str:
+    """Hash of a node: SHA-256 of the compact JSON list of its ``[name, child hash]`` pairs in name order."""
+    pairs = [[name, children[name]] for name in sorted(children)]
+    return hashlib.sha256(json.dumps(pairs, separators=(",", ":"), ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def merkle_leaf_path(key: tuple[str, str]) -> str:
+    """Bit string that places a row in the tree: the leading bits of the SHA-256 of ``<fixture_id>/<row name>``."""
+    digest = hashlib.sha256("/".join(key).encode("utf-8")).digest()
+    return format(int.from_bytes(digest[: MERKLE_PATH_BITS // 8], "big"), f"0{MERKLE_PATH_BITS}b")
+
+
+def merkle_tree_nodes(leaves: Iterable[tuple[tuple[str, str], str]]) -> dict[str, str]:
+    """Fold ``((fixture_id, row name), row sha256)`` leaves into node hashes keyed by bit-string prefix (``""`` is the root).
+
+    A node with more than ``MERKLE_BUCKET_ROWS`` rows splits on the next path bit into children ``"0"`` and ``"1"``
+    (an empty side is omitted); smaller nodes hash their ``[<fixture_id>/<row name>, row hash]`` pairs directly.
+    The shape depends only on the set of rows, so adding or removing a row rehashes just the nodes on its path.
+    """
+    nodes: dict[str, str] = {}
+
+    def fold(prefix: str, items: list[tuple[str, str, str]]) -> str:
+        if len(items) <= MERKLE_BUCKET_ROWS or len(prefix) == MERKLE_PATH_BITS:
+            nodes[prefix] = merkle_node_hash({name: sha256 for _, name, sha256 in items})
+        else:
+            depth = len(prefix)
+            children = {}
+            for bit in "01":
+                part = [item for item in items if item[0][depth] == bit]
+                if part:
+                    children[bit] = fold(prefix + bit, part)
+            nodes[prefix] = merkle_node_hash(children)
+        return nodes[prefix]
+
+    fold("", [(merkle_leaf_path(key), "/".join(key), sha256) for key, sha256 in leaves])
+    return nodes
+
+
+def merkle_row_name(key: Sequence[Any], ordinal: int) -> str:
+    """Leaf name of a row within its fixture: ``<archive_version>/<profile_id>/<policy_pack_id>/<ordinal>``."""
+    _, _, archive_version, profile_id, policy_pack_id = key
+    return f"{archive_version}/{profile_id}/{policy_pack_id}/{ordinal}"
+
+
+def merkle_row_fields(fixture_id: str, name: str) -> dict[str, Any]:
+    """Row identity for a Merkle leaf, with empty profile/archive parts mapped back to ``None``."""
+    archive_version, profile_id, policy_pack_id, ordinal = name.split("/")
+    return {
+        "fixture_id": fixture_id,
+        "policy_pack_id": policy_pack_id,
+        "profile_id": profile_id or None,
+        "archive_version": archive_version or None,
+        "ordinal": int(ordinal),
+    }
+
+
+class ExportMerkleBuilder:
+    """Collect per-row hashes while an export is written, then fold them into a binary Merkle tree over row identities."""
+
+    def __init__(self) -> None:
+        self.fixtures: dict[str, dict[str, list[Any]]] = {}
+        self.rows = 0
+        self.root: str | None = None
+        self._offset = 0
+        self._previous_key: tuple[Any, ...] | None = None
+        self._ordinal = 0
+
+    def add(self, key: Sequence[Any], line: bytes) -> None:
+        """Record the next row of the export; rows must arrive in export order."""
+        key = tuple(key)
+        # Rows sharing a sort key (a base and a profile bundle declaring the same profile) are numbered in export order.
+        self._ordinal = self._ordinal + 1 if key == self._previous_key else 0
+        self._previous_key = key
+        rows = self.fixtures.setdefault(key[0], {})
+        rows[merkle_row_name(key, self._ordinal)] = [hashlib.sha256(line).hexdigest(), self._offset, len(line)]
+        self.rows += 1
+        self._offset += len(line)
+
+    def write(self, export_path: pathlib.Path, sha256: str) -> pathlib.Path:
+        path = export_merkle_path(export_path)
+        nodes = merkle_tree_nodes(((fixture_id, name), leaf[0]) for fixture_id, rows in self.fixtures.items() for name, leaf in rows.items())
+        self.root = nodes[""]
+        manifest = {
+            "format": EXPORT_MERKLE_FORMAT,
+            "export": export_path.name,
+            "sha256": sha256,
+            "size": self._offset,
+            "rows": self.rows,
+            "root": self.root,
+            "nodes": nodes,
+            "fixtures": self.fixtures,
+        }
+        path.write_text(json.dumps(manifest, separators=(",", ":"), sort_keys=True) + "\n", encoding="utf-8")
+        return path
+
+
+class ExportMerkle:
+    """A Merkle manifest written by ``export_jsonl.py --write-merkle``; leaves are ``[sha256, offset, length]``."""
+
+    def __init__(self, path: pathlib.Path) -> None:
+        if not path.exists():
+            raise SystemExit(f"Merkle manifest not found: {path}. Run scripts/export_jsonl.py --write-merkle first.")
+        try:
+            manifest = json.loads(path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError as exc:
+            raise SystemExit(f"Invalid JSON in {path}: {exc}") from exc
+        if manifest.get("format") != EXPORT_MERKLE_FORMAT:
+            raise SystemExit(f"Unsupported Merkle manifest {path}; re-export with this version of export_jsonl.py.")
+        self.path = path
+        self.export: str = manifest["export"]
+        self.sha256: str = manifest["sha256"]
+        self.size: int = manifest["size"]
+        self.rows: int = manifest["rows"]
+        self.root: str = manifest["root"]
+        self.nodes: dict[str, str] = manifest["nodes"]
+        self.fixtures: dict[str, dict[str, list[Any]]] = manifest["fixtures"]
+        # Bucket membership is implied by the leaf paths: a row sits in the first node on its path that has no children.
+        self.buckets: dict[str, list[tuple[str, str]]] = {}
+        for key, _ in self.leaves():
+            path_bits = merkle_leaf_path(key)
+            depth = 0
+            while depth < len(path_bits) and self.is_inner(path_bits[:depth]):
+                depth += 1
+            self.buckets.setdefault(path_bits[:depth], []).append(key)
+
+    def is_inner(self, prefix: str) -> bool:
+        return prefix + "0" in self.nodes or prefix + "1" in self.nodes
+
+    def leaves(self, fixture_id: str | None = None) -> Iterator[tuple[tuple[str, str], list[Any]]]:
+        """Yield ``((fixture_id, row name), leaf)`` for every row, or for the rows of one fixture."""
+        for fixture in sorted(self.fixtures) if fixture_id is None else [fixture_id]:
+            rows = self.fixtures[fixture]
+            for name in sorted(rows):
+                yield (fixture, name), rows[name]
+
+    def subtree_hashes(self, prefix: str) -> dict[tuple[str, str], str]:
+        """Row hashes of every leaf below the node at ``prefix``; empty when the tree has no such node."""
+        if prefix not in self.nodes:
+            return {}
+        if not self.is_inner(prefix):
+            return {key: self.fixtures[key[0]][key[1]][0] for key in self.buckets.get(prefix, [])}
+        hashes = self.subtree_hashes(prefix + "0")
+        hashes.update(self.subtree_hashes(prefix + "1"))
+        return hashes
+
+    def check_tree(self) -> list[str]:
+        """Recompute every node hash from the leaves; return the nodes (bit-string prefixes) whose stored hash is wrong."""
+        expected = merkle_tree_nodes((key, leaf[0]) for key, leaf in self.leaves())
+        problems = [prefix or "(root)" for prefix in sorted(self.nodes.keys() | expected.keys()) if self.nodes.get(prefix) != expected.get(prefix)]
+        if self.root != expected[""] and "(root)" not in problems:
+            problems.insert(0, "(root)")
+        return problems
+
+    def check_rows(self, export_path: pathlib.Path, keys: Iterable[tuple[str, str]] | None = None) -> list[tuple[str, str]]:
+        """Re-hash the rows at ``keys`` (every row by default) in ``export_path``; return the keys that do not match."""
+        if keys is None:
+            selected = list(self.leaves())
+        else:
+            selected = [(key, self.fixtures[key[0]][key[1]]) for key in keys]
+        selected.sort(key=lambda item: item[1][1])
+        corrupt = []
+        with open_export(export_path) as handle:
+            for key, (sha256, offset, length) in selected:
+                handle.seek(offset)
+                if hashlib.sha256(handle.read(length)).hexdigest() != sha256:
+                    corrupt.append(key)
+        return sorted(corrupt)
+
+
+@dataclass
+class ExportDiff:
+    added: list[tuple[str, str]] = field(default_factory=list)
+    removed: list[tuple[str, str]] = field(default_factory=list)
+    changed: list[tuple[str, str]] = field(default_factory=list)
+    visited: int = 0
+
+
+def diff_export_merkles(old: ExportMerkle, new: ExportMerkle) -> ExportDiff:
+    """Compare two Merkle manifests, descending only into nodes whose hashes differ.
+
+    Both trees split on the same path bits, so a node is compared with the node at the same prefix. Where
+    either side is a bucket (or has no node), the rows below that prefix are compared directly.
+    """
+    diff = ExportDiff()
+    pending = [""]
+    while pending:
+        prefix = pending.pop()
+        diff.visited += 1
+        if old.nodes.get(prefix) == new.nodes.get(prefix):
+            continue
+        if old.is_inner(prefix) and new.is_inner(prefix):
+            pending.extend(prefix + bit for bit in "10")
+            continue
+        old_rows, new_rows = old.subtree_hashes(prefix), new.subtree_hashes(prefix)
+        for key in old_rows.keys() | new_rows.keys():
+            diff.visited += 1
+            if key not in new_rows:
+                diff.removed.append(key)
+            elif key not in old_rows:
+                diff.added.append(key)
+            elif old_rows[key] != new_rows[key]:
+                diff.changed.append(key)
+    diff.added.sort()
+    diff.removed.sort()
+    diff.changed.sort()
+    return diff
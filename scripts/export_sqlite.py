@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""SQLite export layout: schema, bulk writer and the reader that re-emits the canonical JSONL."""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pathlib
+from typing import TYPE_CHECKING, Any, BinaryIO, Iterator, Sequence
+
+from dataset_common import canonical_dumps
+from timings import TIMINGS
+
+if TYPE_CHECKING:
+    import sqlite3
+
+SQLITE_EXPORT_FORMAT = 1
+# Top-level export row keys in canonical (sorted) order; each is stored as <name>_json.
+SQLITE_EXPORT_SECTIONS = ("artifact", "input", "metadata", "report", "source_paths", "verdict")
+SQLITE_METADATA_COLUMNS = (
+    "dataset_id",
+    "dataset_repo",
+    "dataset_semver",
+    "dataset_version",
+    "engine_name",
+    "engine_line",
+    "dataset_engine_mapping",
+    "fixture_id",
+    "model_version",
+    "contract_version",
+    "output_contract_version",
+    "report_contract_version",
+    "policy_pack_id",
+    "policy_pack_version",
+    "profile_id",
+    "profile_version",
+    "device",
+    "scenario_type",
+    "expected_outcome",
+    "archive_version",
+    "has_report",
+    "source_kind",
+)
+SQLITE_INDEXED_FIELDS = ("fixture_id", "scenario_type", "expected_outcome", "policy_pack_id", "profile_id", "device", "archive_version")
+SQLITE_BATCH_ROWS = int(os.environ.get("BLUX_DATASET_SQLITE_BATCH_ROWS", "50000"))
+_SQLITE_SECTION_PREFIXES = tuple(f'"{name}":'.encode("ascii") for name in SQLITE_EXPORT_SECTIONS)
+
+
+def sqlite_export_path(export_path: pathlib.Path) -> pathlib.Path:
+    return export_path.with_suffix(".sqlite")
+
+
+def sqlite_export_schema() -> list[str]:
+    """``CREATE`` statements for a SQLite export, without the metadata indexes (built after loading)."""
+    columns = ", ".join(f"{name} {'INTEGER' if name == 'has_report' else 'TEXT'}" for name in SQLITE_METADATA_COLUMNS)
+    sections = ", ".join(f"{name}_json TEXT NOT NULL" for name in SQLITE_EXPORT_SECTIONS)
+    return [
+        "CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+        f"CREATE TABLE rows (row_number INTEGER PRIMARY KEY, {columns}, {sections})",
+    ]
+
+
+def compose_export_line(sections: Sequence[bytes]) -> bytes:
+    """Join canonical ``SQLITE_EXPORT_SECTIONS`` payloads into the canonical export line they came from."""
+    return b"{" + b",".join(prefix + section for prefix, section in zip(_SQLITE_SECTION_PREFIXES, sections)) + b"}\n"
+
+
+class SqliteExportReader:
+    """Query a read-only SQLite export (``export_jsonl.py --format sqlite``) and re-emit the canonical JSONL."""
+
+    def __init__(self, path: pathlib.Path) -> None:
+        if not path.exists():
+            raise SystemExit(f"SQLite export not found: {path}")
+        import sqlite3
+
+        self.path = path
+        try:
+            self._connection: sqlite3.Connection | None = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+            self.meta = dict(self._connection.execute("SELECT key, value FROM meta"))
+        except sqlite3.DatabaseError as exc:
+            raise SystemExit(f"Invalid SQLite export {path}: {exc}") from exc
+        if self.meta.get("format") != str(SQLITE_EXPORT_FORMAT):
+            self.close()
+            raise SystemExit(f"Unsupported SQLite export format in {path}: {self.meta.get('format')}")
+
+    def __len__(self) -> int:
+        return int(self.meta["rows"])
+
+    def __enter__(self) -> SqliteExportReader:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _query(self, select: str, filters: dict[str, Any], order: str = " ORDER BY row_number") -> sqlite3.Cursor:
+        unknown = set(filters) - set(SQLITE_METADATA_COLUMNS)
+        if unknown:
+            raise SystemExit(f"Unsupported SQLite export fields: {', '.join(sorted(unknown))}")
+        assert self._connection is not None
+        clauses = [f"{name} IS NULL" if value is None else f"{name} = ?" for name, value in filters.items()]
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._connection.execute(f"SELECT {select} FROM rows{where}{order}", [value for value in filters.values() if value is not None])
+
+    def raw_rows(self, **filters: Any) -> Iterator[bytes]:
+        """Canonical export lines whose metadata matches every ``field=value`` filter (``None`` matches null)."""
+        columns = ", ".join(f"{name}_json" for name in SQLITE_EXPORT_SECTIONS)
+        for sections in self._query(columns, filters):
+            yield compose_export_line([section.encode("utf-8") for section in sections])
+
+    def find(self, **filters: Any) -> Iterator[dict[str, Any]]:
+        for line in self.raw_rows(**filters):
+            yield json.loads(line)
+
+    def count(self, **filters: Any) -> int:
+        return self._query("COUNT(*)", filters, order="").fetchone()[0]
+
+    def expand(self, handle: BinaryIO) -> str:
+        """Write the canonical export to ``handle`` and return its SHA-256."""
+        hasher = hashlib.sha256()
+        for line in self.raw_rows():
+            handle.write(line)
+            hasher.update(line)
+        return hasher.hexdigest()
+
+
+class SqliteExportWriter:
+    """Bulk-load canonically ordered export rows into a temp SQLite file that replaces ``output`` on ``finish()``."""
+
+    def __init__(self, output: pathlib.Path, batch_rows: int = SQLITE_BATCH_ROWS) -> None:
+        import sqlite3
+
+        self.output = output
+        self.batch_rows = batch_rows
+        self.tmp_path = output.with_name(f".{output.name}.{os.getpid()}.tmp")
+        self.tmp_path.unlink(missing_ok=True)
+        self.connection = sqlite3.connect(self.tmp_path)
+        self.connection.execute("PRAGMA journal_mode=OFF")
+        self.connection.execute("PRAGMA synchronous=OFF")
+        for statement in sqlite_export_schema():
+            self.connection.execute(statement)
+        columns = ("row_number", *SQLITE_METADATA_COLUMNS, *(f"{name}_json" for name in SQLITE_EXPORT_SECTIONS))
+        self._insert = f"INSERT INTO rows ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+        self._pending: list[tuple[Any, ...]] = []
+        self.hasher = hashlib.sha256()
+        self.rows = 0
+
+    def add(self, row: dict[str, Any]) -> bytes:
+        """Queue ``row`` for insertion and return its canonical export line."""
+        if len(row) != len(SQLITE_EXPORT_SECTIONS) or any(name not in row for name in SQLITE_EXPORT_SECTIONS):
+            raise SystemExit(f"Export row keys {sorted(row)} do not match the SQLite export sections {list(SQLITE_EXPORT_SECTIONS)}.")
+        sections = [canonical_dumps(row[name]).encode("utf-8") for name in SQLITE_EXPORT_SECTIONS]
+        line = compose_export_line(sections)
+        self.hasher.update(line)
+        metadata = row["metadata"]
+        self._pending.append((self.rows, *(metadata.get(name) for name in SQLITE_METADATA_COLUMNS), *(section.decode("utf-8") for section in sections)))
+        self.rows += 1
+        if len(self._pending) >= self.batch_rows:
+            self._flush()
+        return line
+
+    def _flush(self) -> None:
+        with TIMINGS.phase("write"):
+            self.connection.executemany(self._insert, self._pending)
+            self.connection.commit()
+        self._pending = []
+
+    def finish(self) -> tuple[int, str]:
+        """Flush, index and install the database; return (rows, sha256 of the canonical export)."""
+        self._flush()
+        digest = self.hasher.hexdigest()
+        with TIMINGS.phase("write"):
+            for name in SQLITE_INDEXED_FIELDS:
+                self.connection.execute(f"CREATE INDEX rows_{name} ON rows ({name})")
+            meta = {"format": str(SQLITE_EXPORT_FORMAT), "rows": str(self.rows), "sha256": digest}
+            self.connection.executemany("INSERT INTO meta (key, value) VALUES (?, ?)", sorted(meta.items()))
+            self.connection.commit()
+        self.connection.close()
+        os.chmod(self.tmp_path, 0o644)
+        os.replace(self.tmp_path, self.output)
+        return self.rows, digest
+
+    def abort(self) -> None:
+        self.connection.close()
+        self.tmp_path.unlink(missing_ok=True)
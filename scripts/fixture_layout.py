@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""Fixture layout backends: a scandir-backed directory index and the memory-mapped fixture pack."""
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import pathlib
+from dataclasses import dataclass
+from typing import BinaryIO
+
+from timings import TIMINGS
+
+LAYOUT_CACHE_VERSION = 1
+FIXTURE_PACK_FORMAT = 1
+FIXTURE_PACK_INDEX = ".bluxpack-index.json"
+
+
+@dataclass
+class _DirListing:
+    mtime_ns: int
+    subdirs: list[str]
+    files: dict[str, tuple[int, int]]
+
+
+class LayoutIndex:
+    """Subdirectories and file sizes/mtimes of every directory under ``root``, from one ``os.scandir`` each."""
+
+    def __init__(self, root: pathlib.Path) -> None:
+        self.root = root
+        self._root = str(root)
+        self._prefix = self._root + os.sep
+        self.dirs: dict[str, _DirListing] = {}
+        self.scanned = 0
+        self._changed: set[str] | None = None
+
+    @classmethod
+    def build(cls, root: pathlib.Path, cache_path: pathlib.Path | None = None) -> LayoutIndex:
+        index = cls(root)
+        with TIMINGS.phase("walk"):
+            if cache_path is not None and index.load(cache_path):
+                index.refresh()
+            else:
+                index._scan("")
+        if cache_path is not None and index.scanned:
+            index.save(cache_path)
+        return index
+
+    def _abs(self, rel: str) -> str:
+        return os.path.join(self._root, rel) if rel else self._root
+
+    def _rel(self, path: pathlib.Path) -> str | None:
+        text = str(path)
+        if text == self._root:
+            return ""
+        if text.startswith(self._prefix):
+            return text[len(self._prefix):].replace(os.sep, "/")
+        return None
+
+    def _scan(self, rel: str) -> None:
+        path = self._abs(rel)
+        mtime_ns = os.stat(path).st_mtime_ns
+        subdirs: list[str] = []
+        files: dict[str, tuple[int, int]] = {}
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    subdirs.append(entry.name)
+                elif entry.is_file():
+                    stat = entry.stat()
+                    files[entry.name] = (stat.st_size, stat.st_mtime_ns)
+        subdirs.sort()
+        previous = self.dirs.get(rel)
+        self.dirs[rel] = _DirListing(mtime_ns, subdirs, files)
+        self.scanned += 1
+        if self._changed is not None:
+            previous_files = previous.files if previous is not None else {}
+            for name in previous_files.keys() | files.keys():
+                if previous_files.get(name) != files.get(name):
+                    self._changed.add(f"{rel}/{name}" if rel else name)
+        if previous is not None:
+            for name in set(previous.subdirs).difference(subdirs):
+                self._drop(f"{rel}/{name}" if rel else name)
+                if self._changed is not None:
+                    self._changed.add(f"{rel}/{name}" if rel else name)
+        for name in subdirs:
+            child = f"{rel}/{name}" if rel else name
+            if child not in self.dirs:
+                self._scan(child)
+
+    def _drop(self, rel: str) -> None:
+        prefix = rel + "/"
+        for key in [key for key in self.dirs if key == rel or key.startswith(prefix)]:
+            del self.dirs[key]
+
+    def refresh(self) -> int:
+        """Re-list directories whose mtime changed; return how many were re-listed."""
+        before = self.scanned
+        # Sorted order visits parents before children, so dropped subtrees are skipped.
+        for rel in sorted(self.dirs):
+            listing = self.dirs.get(rel)
+            if listing is None:
+                continue
+            try:
+                mtime_ns = os.stat(self._abs(rel)).st_mtime_ns
+            except FileNotFoundError:
+                self._drop(rel)
+                continue
+            if mtime_ns != listing.mtime_ns:
+                self._scan(rel)
+        if "" not in self.dirs and os.path.isdir(self._root):
+            self._scan("")
+        return self.scanned - before
+
+    def poll(self) -> set[str]:
+        """Stat every indexed file and return root-relative paths changed (or removed) since the last look."""
+        changed: set[str] = set()
+        stale: list[str] = []
+        stat = os.stat
+        for rel, listing in self.dirs.items():
+            base = self._abs(rel)
+            try:
+                if stat(base).st_mtime_ns != listing.mtime_ns:
+                    stale.append(rel)
+            except FileNotFoundError:
+                stale.append(rel)
+                continue
+            prefix, rel_prefix = base + os.sep, f"{rel}/" if rel else ""
+            files = listing.files
+            for name, signature in files.items():
+                try:
+                    current = stat(prefix + name)
+                except FileNotFoundError:
+                    changed.add(rel_prefix + name)
+                    continue
+                if (current.st_size, current.st_mtime_ns) != signature:
+                    files[name] = (current.st_size, current.st_mtime_ns)
+                    changed.add(rel_prefix + name)
+        self._changed = changed
+        try:
+            # Sorted order re-lists parents first; children dropped with them are skipped.
+            for rel in sorted(stale):
+                if rel not in self.dirs:
+                    continue
+                if os.path.isdir(self._abs(rel)):
+                    self._scan(rel)
+                else:
+                    self._drop(rel)
+                    changed.add(rel)
+        finally:
+            self._changed = None
+        return changed
+
+    def load(self, cache_path: pathlib.Path) -> bool:
+        try:
+            payload = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+        if not isinstance(payload, dict) or payload.get("version") != LAYOUT_CACHE_VERSION:
+            return False
+        stored = payload.get("roots", {}).get(os.path.abspath(self._root))
+        if not isinstance(stored, dict):
+            return False
+        self.dirs = {
+            rel: _DirListing(mtime_ns, subdirs, {name: (size, mtime) for name, (size, mtime) in files.items()})
+            for rel, (mtime_ns, subdirs, files) in stored.items()
+        }
+        return True
+
+    def save(self, cache_path: pathlib.Path) -> None:
+        """Merge this root into the cache file at ``cache_path`` (other roots are kept)."""
+        try:
+            payload = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            payload = {}
+        if not isinstance(payload, dict) or payload.get("version") != LAYOUT_CACHE_VERSION:
+            payload = {}
+        roots = payload.get("roots", {})
+        roots[os.path.abspath(self._root)] = {
+            rel: [listing.mtime_ns, listing.subdirs, listing.files] for rel, listing in self.dirs.items()
+        }
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps({"version": LAYOUT_CACHE_VERSION, "roots": roots}, sort_keys=True), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+
+    def exists(self, path: pathlib.Path) -> bool:
+        rel = self._rel(path)
+        if rel is None:
+            return path.exists()
+        if rel in self.dirs:
+            return True
+        parent, _, name = rel.rpartition("/")
+        listing = self.dirs.get(parent)
+        return listing is not None and name in listing.files
+
+    def is_dir(self, path: pathlib.Path) -> bool:
+        rel = self._rel(path)
+        return path.is_dir() if rel is None else rel in self.dirs
+
+    def subdirs(self, path: pathlib.Path) -> list[pathlib.Path]:
+        rel = self._rel(path)
+        if rel is None:
+            return sorted(child for child in path.iterdir() if child.is_dir()) if path.is_dir() else []
+        listing = self.dirs.get(rel)
+        return [path / name for name in listing.subdirs] if listing is not None else []
+
+    def file_count(self) -> int:
+        return sum(len(listing.files) for listing in self.dirs.values())
+
+
+class FixturePack:
+    """Read-only fixture tree served from a memory-mapped pack written by ``scripts/fixture_pack.py``."""
+
+    def __init__(self, pack_path: pathlib.Path, root: pathlib.Path) -> None:
+        self.pack_path = pack_path
+        self.root = root
+        self._root = str(root)
+        self._prefix = self._root + os.sep
+        self.files: dict[str, tuple[int, int, str]] = {}
+        self.dirs: dict[str, list[str]] = {}
+        self.scanned = 0
+        self._handle: BinaryIO | None = None
+        self._data: mmap.mmap | None = None
+        self._stat_signature: tuple[int, int] | None = None
+        self._open()
+
+    def _open(self) -> None:
+        import zipfile
+
+        with TIMINGS.phase("walk"):
+            try:
+                stat = self.pack_path.stat()
+                with zipfile.ZipFile(self.pack_path) as archive:
+                    index = json.loads(archive.read(FIXTURE_PACK_INDEX))
+            except (OSError, KeyError, ValueError, zipfile.BadZipFile) as exc:
+                raise SystemExit(f"Invalid fixture pack {self.pack_path}: {exc}") from exc
+            if not isinstance(index, dict) or index.get("format") != FIXTURE_PACK_FORMAT:
+                raise SystemExit(f"Unsupported fixture pack {self.pack_path}: expected format {FIXTURE_PACK_FORMAT}.")
+            files = {rel: (offset, length, sha256) for rel, (offset, length, sha256) in index["files"].items()}
+            dirs: dict[str, set[str]] = {"": set()}
+            for rel in files:
+                parts = rel.split("/")
+                for depth in range(1, len(parts)):
+                    dirs.setdefault("/".join(parts[: depth - 1]), set()).add(parts[depth - 1])
+                    dirs.setdefault("/".join(parts[:depth]), set())
+            self.close()
+            self._handle = self.pack_path.open("rb")
+            self._data = mmap.mmap(self._handle.fileno(), 0, access=mmap.ACCESS_READ)
+            self.files = files
+            self.dirs = {rel: sorted(names) for rel, names in dirs.items()}
+            self._stat_signature = (stat.st_size, stat.st_mtime_ns)
+            self.scanned += 1
+
+    def close(self) -> None:
+        if self._data is not None:
+            self._data.close()
+            self._data = None
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def _rel(self, path: pathlib.Path) -> str | None:
+        text = str(path)
+        if text == self._root:
+            return ""
+        if text.startswith(self._prefix):
+            return text[len(self._prefix):].replace(os.sep, "/")
+        return None
+
+    def _member(self, path: pathlib.Path) -> tuple[int, int, str]:
+        rel = self._rel(path)
+        member = self.files.get(rel) if rel is not None else None
+        if member is None:
+            raise FileNotFoundError(f"{path} is not in fixture pack {self.pack_path}")
+        return member
+
+    def read_bytes(self, path: pathlib.Path) -> bytes:
+        offset, length, _ = self._member(path)
+        assert self._data is not None
+        return self._data[offset:offset + length]
+
+    def sha256(self, path: pathlib.Path) -> str:
+        return self._member(path)[2]
+
+    def signature(self, path: pathlib.Path) -> tuple[int, int]:
+        """A ``DocumentCache`` signature for ``path``: its length and a prefix of its content hash."""
+        _, length, sha256 = self._member(path)
+        return length, int(sha256[:15], 16)
+
+    def _changed_on_disk(self) -> bool:
+        try:
+            stat = self.pack_path.stat()
+        except FileNotFoundError:
+            return False
+        return (stat.st_size, stat.st_mtime_ns) != self._stat_signature
+
+    def refresh(self) -> int:
+        """Reopen the pack if its file was replaced; return 1 when it was, else 0."""
+        if not self._changed_on_disk():
+            return 0
+        self._open()
+        return 1
+
+    def poll(self) -> set[str]:
+        """Return root-relative paths whose content differs after reopening a replaced pack."""
+        previous = self.files
+        if not self.refresh():
+            return set()
+        return {rel for rel in previous.keys() | self.files.keys() if previous.get(rel) != self.files.get(rel)}
+
+    def exists(self, path: pathlib.Path) -> bool:
+        rel = self._rel(path)
+        if rel is None:
+            return path.exists()
+        return rel in self.dirs or rel in self.files
+
+    def is_dir(self, path: pathlib.Path) -> bool:
+        rel = self._rel(path)
+        return path.is_dir() if rel is None else rel in self.dirs
+
+    def subdirs(self, path: pathlib.Path) -> list[pathlib.Path]:
+        rel = self._rel(path)
+        if rel is None:
+            return sorted(child for child in path.iterdir() if child.is_dir()) if path.is_dir() else []
+        return [path / name for name in self.dirs.get(rel, ())]
+
+    def file_count(self) -> int:
+        return len(self.files)
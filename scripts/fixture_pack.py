@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Pack the BLUX cA fixture tree into one indexed file, unpack it again, or check a pack."""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import pathlib
+import sys
+import zipfile
+from typing import Any
+
+from dataset_common import FIXTURE_ROOT
+from export_jsonl import atomic_output
+from fixture_layout import FIXTURE_PACK_FORMAT, FIXTURE_PACK_INDEX, FixturePack
+
+DEFAULT_PACK_PATH = pathlib.Path(os.environ.get("BLUX_DATASET_FIXTURE_PACK") or "fixtures.pack")
+# A fixed timestamp keeps packs byte-identical for identical trees.
+_PACK_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+# Fixed size of a zip local file header before the file name and extra field.
+_LOCAL_HEADER_BYTES = 30
+
+
+def tree_files(root: pathlib.Path) -> list[str]:
+    """Return every file under ``root`` as a sorted root-relative POSIX path."""
+    files = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        rel_dir = pathlib.Path(dirpath).relative_to(root)
+        files.extend((rel_dir / name).as_posix() for name in filenames)
+    return sorted(files)
+
+
+def pack_tree(root: pathlib.Path, output: pathlib.Path) -> tuple[int, int]:
+    """Write ``root`` to ``output`` as an uncompressed zip plus index; return (files, bytes)."""
+    files = tree_files(root)
+    if not files:
+        raise SystemExit(f"No files to pack under {root}.")
+    index: dict[str, list[Any]] = {}
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with atomic_output(output) as handle:
+        with zipfile.ZipFile(handle, "w", compression=zipfile.ZIP_STORED) as archive:
+            for rel in files:
+                data = (root / rel).read_bytes()
+                info = zipfile.ZipInfo(rel, date_time=_PACK_DATE_TIME)
+                info.external_attr = 0o644 << 16
+                archive.writestr(info, data)
+                offset = info.header_offset + _LOCAL_HEADER_BYTES + len(info.filename.encode("utf-8")) + len(info.extra)
+                index[rel] = [offset, len(data), hashlib.sha256(data).hexdigest()]
+            info = zipfile.ZipInfo(FIXTURE_PACK_INDEX, date_time=_PACK_DATE_TIME)
+            info.external_attr = 0o644 << 16
+            archive.writestr(info, json.dumps({"format": FIXTURE_PACK_FORMAT, "files": index}, sort_keys=True, separators=(",", ":")))
+        size = handle.tell()
+    return len(files), size
+
+
+def check_pack(pack: FixturePack, root: pathlib.Path | None = None) -> list[str]:
+    """Re-hash every packed file; with ``root``, also report files that differ from that tree."""
+    problems = []
+    for rel in sorted(pack.files):
+        if hashlib.sha256(pack.read_bytes(pack.root / rel)).hexdigest() != pack.files[rel][2]:
+            problems.append(f"{rel}: stored bytes do not match the indexed sha256")
+    if root is not None:
+        loose = set(tree_files(root))
+        for rel in sorted(loose - pack.files.keys()):
+            problems.append(f"{rel}: in {root} but not in the pack")
+        for rel in sorted(pack.files.keys() - loose):
+            problems.append(f"{rel}: in the pack but not in {root}")
+        for rel in sorted(loose & pack.files.keys()):
+            if hashlib.sha256((root / rel).read_bytes()).hexdigest() != pack.files[rel][2]:
+                problems.append(f"{rel}: differs from {root / rel}")
+    return problems
+
+
+def unpack_tree(pack: FixturePack, output: pathlib.Path) -> int:
+    """Write every packed file under ``output`` after checking its sha256; return the file count."""
+    if output.exists() and any(output.iterdir()):
+        raise SystemExit(f"Unpack destination is not empty: {output}")
+    for rel, (_, _, sha256) in sorted(pack.files.items()):
+        data = pack.read_bytes(pack.root / rel)
+        if hashlib.sha256(data).hexdigest() != sha256:
+            raise SystemExit(f"Fixture pack {pack.pack_path} is corrupt: {rel} does not match its indexed sha256.")
+        destination = output / rel
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        destination.write_bytes(data)
+    return len(pack.files)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Pack fixtures/ into one indexed file that the dataset tools can read in place of the tree.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    pack = subparsers.add_parser("pack", help="Write the fixture tree to a pack file.")
+    pack.add_argument("--root", default=FIXTURE_ROOT.as_posix(), help="Fixture tree to pack (default: %(default)s).")
+    pack.add_argument("--output", default=DEFAULT_PACK_PATH.as_posix(), help="Pack file to write (default: BLUX_DATASET_FIXTURE_PACK or %(default)s).")
+    unpack = subparsers.add_parser("unpack", help="Recreate the fixture tree from a pack file.")
+    unpack.add_argument("--pack", default=DEFAULT_PACK_PATH.as_posix())
+    unpack.add_argument("--output", default=FIXTURE_ROOT.as_posix(), help="Empty or missing directory to unpack into (default: %(default)s).")
+    check = subparsers.add_parser("check", help="Verify every packed file against its indexed sha256.")
+    check.add_argument("--pack", default=DEFAULT_PACK_PATH.as_posix())
+    check.add_argument("--root", default=None, help="Also report files that differ between the pack and this tree (for example fixtures).")
+    args = parser.parse_args()
+
+    if args.command == "pack":
+        count, size = pack_tree(pathlib.Path(args.root), pathlib.Path(args.output))
+        print(f"Packed {count} files from {args.root} into {args.output} ({size} bytes).")
+        return 0
+    packed = FixturePack(pathlib.Path(args.pack), FIXTURE_ROOT)
+    try:
+        if args.command == "unpack":
+            count = unpack_tree(packed, pathlib.Path(args.output))
+            print(f"Unpacked {count} files from {args.pack} into {args.output}.")
+            return 0
+        problems = check_pack(packed, pathlib.Path(args.root) if args.root else None)
+    finally:
+        packed.close()
+    for problem in problems:
+        print(f"FAIL: {problem}")
+    if problems:
+        return 1
+    print(f"Fixture pack {args.pack} is intact ({len(packed.files)} files).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""Stdlib-only JSON Schema subset compiled to Python validator functions for the schemas/ directory."""
+from __future__ import annotations
+
+import argparse
+import functools
+import io
+import json
+import pathlib
+import re
+import sys
+from typing import Any, Callable
+
+from dataset_common import escape_pointer_token
+from export_compression import open_export
+
+SCHEMA_ROOT = pathlib.Path("schemas")
+DATASET_SCHEMA_FILES = {
+    "goal": "fixture.schema.json",
+    "artifact": "expected_artifact.schema.json",
+    "verdict": "expected_verdict.schema.json",
+    "report": "expected_report.schema.json",
+    "export_row": "export_row.schema.json",
+}
+# Annotation-only keywords that never affect validation.
+IGNORED_KEYWORDS = {"$schema", "$id", "title", "description", "$comment", "examples", "default"}
+SUPPORTED_KEYWORDS = IGNORED_KEYWORDS | {
+    "$ref", "type", "const", "enum", "minLength", "maxLength", "pattern", "minimum", "maximum",
+    "required", "properties", "additionalProperties", "items", "minItems", "maxItems",
+    "uniqueItems", "oneOf", "anyOf", "allOf",
+}
+# JSON values decoded by ``json.loads`` have exact builtin types, so type checks compare
+# ``type(value)`` directly; this also keeps ``bool`` out of integer/number.
+JSON_TYPES: dict[str, tuple[type, ...]] = {
+    "string": (str,),
+    "object": (dict,),
+    "array": (list,),
+    "boolean": (bool,),
+    "null": (type(None),),
+    "integer": (int,),
+    "number": (int, float),
+}
+ALL_JSON_TYPES = frozenset(t for types in JSON_TYPES.values() for t in types)
+
+# A compiled validator appends ``(json_pointer, message)`` pairs to ``errors``.
+Validator = Callable[[Any, list[tuple[str, str]]], None]
+_MISSING = object()
+
+
+def _json_key(value: Any) -> Any:
+    """Hashable identity for const/enum/uniqueItems comparison that keeps ``True`` distinct from ``1``."""
+    return (type(value) is bool, json.dumps(value, sort_keys=True))
+
+
+def _branch_rank(pointer: str, errors: list[tuple[str, str]]) -> tuple[bool, int]:
+    """Sort key for failed combinator branches: prefer ones whose declared type matched."""
+    type_mismatch = any(
+        path == pointer and message.startswith("expected ") and not message.startswith("expected constant")
+        for path, message in errors
+    )
+    return type_mismatch, len(errors)
+
+
+class SchemaCompiler:
+    """Compile schema files once into generated Python functions.
+
+    Each schema file becomes a single function with every keyword check inlined, so the hot
+    path performs no per-node calls. JSON pointers are only assembled when a check fails.
+    ``$ref`` targets are resolved relative to the referring file and inlined; recursive
+    references are rejected.
+    """
+
+    def __init__(self) -> None:
+        self._compiled: dict[str, Validator] = {}
+
+    def compile_file(self, path: pathlib.Path) -> Validator:
+        key = path.resolve().as_posix()
+        if key not in self._compiled:
+            self._compiled[key] = _FunctionBuilder(key).build()
+        return self._compiled[key]
+
+
+class _FunctionBuilder:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.lines: list[str] = []
+        self.namespace: dict[str, Any] = {
+            "_MISSING": _MISSING,
+            "_json_key": _json_key,
+            "_branch_rank": _branch_rank,
+            "_escape": escape_pointer_token,
+            "NoneType": type(None),
+        }
+        self.counter = 0
+        self.ref_stack: list[str] = []
+
+    def build(self) -> Validator:
+        self.lines.append("def validate(v0, E):")
+        self.compile_ref(self.path, "v0", '""', 1)
+        self.lines.append("    return None")
+        source = "\n".join(self.lines) + "\n"
+        exec(compile(source, f"<schema {self.path}>", "exec"), self.namespace)
+        return self.namespace["validate"]
+
+    def name(self, prefix: str) -> str:
+        self.counter += 1
+        return f"{prefix}{self.counter}"
+
+    def const(self, value: Any) -> str:
+        name = self.name("C")
+        self.namespace[name] = value
+        return name
+
+    def emit(self, depth: int, line: str) -> None:
+        self.lines.append("    " * depth + line)
+
+    def fail(self, depth: int, pointer: str, message: str) -> None:
+        self.emit(depth, f"E.append(({pointer}, {message}))")
+
+    def compile_ref(self, path: str, var: str, pointer: str, depth: int) -> None:
+        if path in self.ref_stack:
+            raise ValueError(f"Recursive $ref is not supported: {path}")
+        self.ref_stack.append(path)
+        schema_path = pathlib.Path(path)
+        schema = json.loads(schema_path.read_text(encoding="utf-8"))
+        self.compile_node(schema, schema_path.parent, var, pointer, depth)
+        self.ref_stack.pop()
+
+    def compile_node(self, schema: Any, base: pathlib.Path, var: str, pointer: str, depth: int) -> None:
+        if schema is True or schema == {}:
+            return
+        if schema is False:
+            self.fail(depth, pointer, repr("no value is allowed here"))
+            return
+        if not isinstance(schema, dict):
+            raise ValueError(f"Invalid schema node: {schema!r}")
+        unknown = set(schema) - SUPPORTED_KEYWORDS
+        if unknown:
+            raise ValueError(f"Unsupported JSON Schema keywords: {', '.join(sorted(unknown))}")
+
+        if "$ref" in schema:
+            ref = schema["$ref"]
+            if ref.startswith("#"):
+                raise ValueError(f"Unsupported local $ref: {ref}")
+            self.compile_ref((base / ref).resolve().as_posix(), var, pointer, depth)
+
+        types: frozenset[type] = ALL_JSON_TYPES
+        if "type" in schema:
+            names = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+            unsupported = [name for name in names if name not in JSON_TYPES]
+            if unsupported:
+                raise ValueError(f"Unsupported JSON Schema type: {', '.join(unsupported)}")
+            declared = frozenset(t for name in names for t in JSON_TYPES[name])
+            if declared != ALL_JSON_TYPES:
+                types = declared
+                message = repr(f"expected {' or '.join(names)}, got ") + f" + type({var}).__name__"
+                if len(types) == 1:
+                    self.emit(depth, f"if type({var}) is not {next(iter(types)).__name__}:")
+                else:
+                    self.emit(depth, f"if type({var}) not in {self.const(types)}:")
+                self.fail(depth + 1, pointer, message)
+                # Keyword checks assume the declared type, so skip them after a type error.
+                self.emit(depth, "else:")
+                depth += 1
+                self.emit(depth, "pass")
+
+        self.compile_value_checks(schema, var, pointer, depth, types)
+        if any(key in schema for key in ("required", "properties", "additionalProperties")):
+            self.compile_object(schema, base, var, pointer, depth, types)
+        if any(key in schema for key in ("items", "minItems", "maxItems", "uniqueItems")):
+            self.compile_array(schema, base, var, pointer, depth, types)
+        for keyword in ("allOf", "anyOf", "oneOf"):
+            if keyword in schema:
+                self.compile_combinator(keyword, schema[keyword], base, var, pointer, depth)
+
+    def guard(self, depth: int, var: str, types: frozenset[type], wanted: tuple[type, ...]) -> int:
+        """Open a type guard unless the declared type already guarantees one of ``wanted``."""
+        if types <= frozenset(wanted):
+            return depth
+        if len(wanted) == 1:
+            self.emit(depth, f"if type({var}) is {wanted[0].__name__}:")
+        else:
+            self.emit(depth, f"if type({var}) in {self.const(frozenset(wanted))}:")
+        return depth + 1
+
+    def compile_value_checks(self, schema: dict[str, Any], var: str, pointer: str, depth: int, types: frozenset[type]) -> None:
+        if "const" in schema:
+            const = schema["const"]
+            self.emit(depth, f"if {var} != {self.const(const)} or _json_key({var}) != {self.const(_json_key(const))}:")
+            self.fail(depth + 1, pointer, repr(f"expected constant {const!r}, got ") + f" + repr({var})")
+        if "enum" in schema:
+            options = list(schema["enum"])
+            message = f"repr({var}) + {repr(f' is not one of {options!r}')}"
+            if all(type(option) is str for option in options):
+                condition = f"type({var}) is not str or {var} not in {self.const(frozenset(options))}"
+            else:
+                condition = f"_json_key({var}) not in {self.const(frozenset(_json_key(option) for option in options))}"
+            self.emit(depth, f"if {condition}:")
+            self.fail(depth + 1, pointer, message)
+
+        string_checks = [key for key in ("minLength", "maxLength", "pattern") if key in schema]
+        if string_checks:
+            inner = self.guard(depth, var, types, (str,))
+            if "minLength" in schema:
+                self.emit(inner, f"if len({var}) < {int(schema['minLength'])}:")
+                self.fail(inner + 1, pointer, repr(f"string shorter than {schema['minLength']}"))
+            if "maxLength" in schema:
+                self.emit(inner, f"if len({var}) > {int(schema['maxLength'])}:")
+                self.fail(inner + 1, pointer, repr(f"string longer than {schema['maxLength']}"))
+            if "pattern" in schema:
+                pattern = re.compile(schema["pattern"])
+                self.emit(inner, f"if not {self.const(pattern)}.search({var}):")
+                self.fail(inner + 1, pointer, f"repr({var}) + {repr(f' does not match {pattern.pattern!r}')}")
+
+        if "minimum" in schema or "maximum" in schema:
+            inner = self.guard(depth, var, types, (int, float))
+            if "minimum" in schema:
+                minimum = schema["minimum"]
+                self.emit(inner, f"if {var} < {self.const(minimum)}:")
+                self.fail(inner + 1, pointer, f"repr({var}) + {repr(f' is less than {minimum!r}')}")
+            if "maximum" in schema:
+                maximum = schema["maximum"]
+                self.emit(inner, f"if {var} > {self.const(maximum)}:")
+                self.fail(inner + 1, pointer, f"repr({var}) + {repr(f' is greater than {maximum!r}')}")
+
+    def compile_object(self, schema: dict[str, Any], base: pathlib.Path, var: str, pointer: str, depth: int, types: frozenset[type]) -> None:
+        required = list(schema.get("required", ()))
+        properties: dict[str, Any] = schema.get("properties", {})
+        additional = schema.get("additionalProperties", True)
+        depth = self.guard(depth, var, types, (dict,))
+        self.emit(depth, "pass")
+        if required:
+            self.emit(depth, f"if not {self.const(frozenset(required))} <= {var}.keys():")
+            self.emit(depth + 1, f"for k in {self.const(tuple(required))}:")
+            self.emit(depth + 2, f"if k not in {var}:")
+            self.fail(depth + 3, pointer, "'missing required property ' + repr(k)")
+        allowed = self.const(frozenset(properties))
+        if additional is False:
+            self.emit(depth, f"if not {var}.keys() <= {allowed}:")
+            self.emit(depth + 1, f"for k in {var}:")
+            self.emit(depth + 2, f"if k not in {allowed}:")
+            self.fail(depth + 3, f"{pointer} + '/' + _escape(k)", "'additional property is not allowed'")
+        for key, sub in properties.items():
+            if sub is True or sub == {}:
+                continue
+            child = self.name("v")
+            self.emit(depth, f"{child} = {var}.get({key!r}, _MISSING)")
+            self.emit(depth, f"if {child} is not _MISSING:")
+            self.compile_node(sub, base, child, f"{pointer} + {repr('/' + escape_pointer_token(key))}", depth + 1)
+            self.emit(depth + 1, "pass")
+        if not isinstance(additional, bool):
+            key_var, child = self.name("k"), self.name("v")
+            self.emit(depth, f"for {key_var}, {child} in {var}.items():")
+            self.emit(depth + 1, f"if {key_var} not in {allowed}:")
+            self.compile_node(additional, base, child, f"{pointer} + '/' + _escape({key_var})", depth + 2)
+            self.emit(depth + 2, "pass")
+
+    def compile_array(self, schema: dict[str, Any], base: pathlib.Path, var: str, pointer: str, depth: int, types: frozenset[type]) -> None:
+        depth = self.guard(depth, var, types, (list,))
+        self.emit(depth, "pass")
+        if "minItems" in schema:
+            self.emit(depth, f"if len({var}) < {int(schema['minItems'])}:")
+            self.fail(depth + 1, pointer, repr(f"array shorter than {schema['minItems']}"))
+        if "maxItems" in schema:
+            self.emit(depth, f"if len({var}) > {int(schema['maxItems'])}:")
+            self.fail(depth + 1, pointer, repr(f"array longer than {schema['maxItems']}"))
+        if schema.get("uniqueItems"):
+            self.emit(depth, f"if len({{_json_key(x) for x in {var}}}) != len({var}):")
+            self.fail(depth + 1, pointer, repr("array items are not unique"))
+        items = schema.get("items", True)
+        if items is not True and items != {}:
+            index, child = self.name("i"), self.name("v")
+            self.emit(depth, f"for {index}, {child} in enumerate({var}):")
+            self.compile_node(items, base, child, f"{pointer} + '/' + str({index})", depth + 1)
+            self.emit(depth + 1, "pass")
+
+    def compile_combinator(self, keyword: str, branches: list[Any], base: pathlib.Path, var: str, pointer: str, depth: int) -> None:
+        if keyword == "allOf":
+            for branch in branches:
+                self.compile_node(branch, base, var, pointer, depth)
+            return
+        # Each branch collects into its own error list; the outer list only sees the result.
+        outer = self.name("E")
+        results = self.name("R")
+        self.emit(depth, f"{outer} = E")
+        self.emit(depth, f"{results} = []")
+        for branch in branches:
+            self.emit(depth, "E = []")
+            self.compile_node(branch, base, var, pointer, depth)
+            self.emit(depth, f"{results}.append(E)")
+        self.emit(depth, f"E = {outer}")
+        self.emit(depth, f"if all({results}):")
+        # Report the branch that got furthest to keep messages useful.
+        self.emit(depth + 1, f"P = {pointer}")
+        self.emit(depth + 1, f"E.extend(min({results}, key=lambda r: _branch_rank(P, r)))")
+        if keyword == "oneOf":
+            matches = f"sum(1 for r in {results} if not r)"
+            self.emit(depth, f"elif {matches} > 1:")
+            self.fail(depth + 1, pointer, f"'value matches ' + str({matches}) + ' oneOf branches, expected exactly one'")
+
+
+def validate(validator: Validator, value: Any) -> list[str]:
+    """Run a compiled validator and return ``"<json-pointer>: <message>"`` strings."""
+    errors: list[tuple[str, str]] = []
+    validator(value, errors)
+    return [f"{pointer or '/'}: {message}" for pointer, message in errors]
+
+
+@functools.lru_cache(maxsize=None)
+def dataset_schemas(root: pathlib.Path = SCHEMA_ROOT) -> dict[str, Validator]:
+    """Compile every dataset schema once per process; each schema inlines its own copy of the ``$ref`` targets it uses."""
+    compiler = SchemaCompiler()
+    return {kind: compiler.compile_file(root / name) for kind, name in DATASET_SCHEMA_FILES.items()}
+
+
+def validate_export_file(path: pathlib.Path) -> tuple[int, list[str]]:
+    """Validate every row of a JSONL export (plain or gzip/xz/bz2) against ``export_row.schema.json``."""
+    validator = dataset_schemas()["export_row"]
+    failures: list[str] = []
+    rows = 0
+    with io.TextIOWrapper(open_export(path), encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            rows += 1
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as exc:
+                failures.append(f"Invalid JSON in {path} line {line_number}: {exc}")
+                continue
+            for violation in validate(validator, row):
+                failures.append(f"Schema violation in {path} line {line_number} at {violation}")
+    return rows, failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Validate a JSONL export against schemas/export_row.schema.json.")
+    parser.add_argument("export", nargs="?", default="exports/blux-ca-dataset.jsonl", help="JSONL export to validate.")
+    args = parser.parse_args()
+
+    path = pathlib.Path(args.export)
+    if not path.exists():
+        raise SystemExit(f"Export not found: {path}")
+    rows, failures = validate_export_file(path)
+    if failures:
+        for failure in failures:
+            print(f"FAIL: {failure}")
+        return 1
+    print(f"{rows} export rows match the export row schema.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Offline stand-in for the blux-ca engine's ``accept`` CLI (see ``__main__``)."""
@@ -0,0 +1,154 @@
+"""Stub ``python -m blux_ca`` that replays this dataset's expected outputs.
+
+``accept`` reads the bridge goals ``verify_fixtures.py`` generates, looks up each fixture's expected
+bundle in the dataset (``BLUX_CA_STUB_DATASET``, else the ``BLUX_DATASET_FIXTURE_PACK`` fixture
+pack, default: this repo's ``fixtures/``) with the same profile/policy-pack fallbacks the verifier uses, and writes the acceptance ``report.json``
+plus per-fixture ``artifact.json``/``verdict.json``. It exercises the verification harness
+(including ``--matrix``) without a real engine checkout; it proves nothing about engine
+behavior.
+
+``run`` writes one fixture's dataset-format ``artifact.json``/``verdict.json`` (an
+``--engine-cmd`` target), and ``worker`` serves the same work over the ``--engine-worker``
+line-delimited JSON protocol. ``BLUX_CA_STUB_DELAY`` adds a sleep in seconds to every process
+start to imitate engine import time; ``BLUX_CA_STUB_CRASH``/``BLUX_CA_STUB_HANG`` name a fixture
+that makes ``run``/``worker`` exit with status 3 or stop responding.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import pathlib
+import sys
+import time
+import zipfile
+
+DATASET_ROOT = pathlib.Path(__file__).resolve().parents[4]
+MODEL_VERSION = "cA-1.0-pro"
+
+
+WORKER_PROTOCOL = 1
+
+
+def dataset_fixtures() -> pathlib.Path | zipfile.Path:
+    if os.environ.get("BLUX_CA_STUB_DATASET"):
+        return pathlib.Path(os.environ["BLUX_CA_STUB_DATASET"])
+    if os.environ.get("BLUX_DATASET_FIXTURE_PACK"):
+        # Pack members are paths relative to fixtures/, so the archive root stands in for the tree.
+        return zipfile.Path(os.environ["BLUX_DATASET_FIXTURE_PACK"])
+    return DATASET_ROOT / "fixtures"
+
+
+def expected_bundle(fixtures_root: pathlib.Path | zipfile.Path, fixture: str, policy_pack: str, profile: str | None, model_version: str = MODEL_VERSION) -> pathlib.Path | zipfile.Path | None:
+    base = fixtures_root / fixture / "expected" / model_version
+    for pack in dict.fromkeys((policy_pack, "cA-pro")):
+        candidates = [base / profile / pack, base / profile, base / pack] if profile else [base / pack]
+        for candidate in candidates:
+            if (candidate / "expected_verdict.json").exists():
+                return candidate
+    return None
+
+
+def accept(fixtures: pathlib.Path, out: pathlib.Path, profile: str | None) -> int:
+    fixtures_root = dataset_fixtures()
+    time.sleep(float(os.environ.get("BLUX_CA_STUB_DELAY", "0")))
+    out.mkdir(parents=True, exist_ok=True)
+    rows = []
+    for goal_dir in sorted(path for path in fixtures.iterdir() if path.is_dir()):
+        goal = json.loads((goal_dir / "goal.json").read_text(encoding="utf-8"))
+        policy_pack = goal.get("request", {}).get("policy_pack_id", "cA-pro")
+        bundle = expected_bundle(fixtures_root, goal_dir.name, policy_pack, profile)
+        if bundle is None:
+            print(f"stub engine: no expected bundle for {goal_dir.name}", file=sys.stderr)
+            continue
+        verdict = json.loads((bundle / "expected_verdict.json").read_text(encoding="utf-8"))
+        request = verdict.get("request") or {}
+        envelope = {"policy_pack_id": request.get("policy_pack_id", policy_pack), "model_version": MODEL_VERSION, "run": {"profile_id": profile}}
+        fixture_out = out / goal_dir.name
+        fixture_out.mkdir(parents=True, exist_ok=True)
+        (fixture_out / "artifact.json").write_text(json.dumps(envelope, indent=2) + "\n", encoding="utf-8")
+        (fixture_out / "verdict.json").write_text(json.dumps(dict(envelope, outcome=verdict.get("outcome")), indent=2) + "\n", encoding="utf-8")
+        rows.append({
+            "fixture": goal_dir.name,
+            "status": verdict.get("outcome"),
+            "policy_pack_id": envelope["policy_pack_id"],
+            "policy_pack_version": request.get("policy_pack_version"),
+        })
+    report = {"profile_id": profile, "accepted": len(rows), "fixtures": rows}
+    (out / "report.json").write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print(f"stub engine: accepted {len(rows)} fixtures into {out}")
+    return 0
+
+
+def run(goal: pathlib.Path, out: pathlib.Path, model_version: str, policy_pack: str, profile: str | None, fixtures_root: pathlib.Path | zipfile.Path) -> None:
+    """Write dataset-format outputs for the fixture owning ``goal`` into ``out``."""
+    fixture = goal.parent.name
+    if fixture == os.environ.get("BLUX_CA_STUB_CRASH"):
+        print(f"stub engine: crashing on {fixture}", file=sys.stderr)
+        sys.exit(3)
+    if fixture == os.environ.get("BLUX_CA_STUB_HANG"):
+        print(f"stub engine: hanging on {fixture}", file=sys.stderr)
+        while True:
+            time.sleep(60)
+    json.loads(goal.read_text(encoding="utf-8"))
+    bundle = expected_bundle(fixtures_root, fixture, policy_pack, profile or None, model_version)
+    if bundle is None:
+        raise ValueError(f"no expected bundle for {fixture}")
+    out.mkdir(parents=True, exist_ok=True)
+    for name in ("artifact", "verdict"):
+        (out / f"{name}.json").write_bytes((bundle / f"expected_{name}.json").read_bytes())
+
+
+def worker() -> int:
+    """Serve ``run`` requests from stdin, one JSON object per line, until stdin closes."""
+    fixtures_root = dataset_fixtures()
+    time.sleep(float(os.environ.get("BLUX_CA_STUB_DELAY", "0")))
+    print(json.dumps({"ready": True, "protocol": WORKER_PROTOCOL}), flush=True)
+    for line in sys.stdin:
+        request = json.loads(line)
+        response: dict[str, object] = {"id": request.get("id"), "ok": True}
+        try:
+            run(
+                pathlib.Path(request["goal"]),
+                pathlib.Path(request["out_dir"]),
+                request["model_version"],
+                request["policy_pack"],
+                request.get("profile"),
+                fixtures_root,
+            )
+        except (KeyError, OSError, ValueError) as exc:
+            response = {"id": request.get("id"), "ok": False, "error": f"{type(exc).__name__}: {exc}"}
+        print(json.dumps(response), flush=True)
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="blux_ca", description="Stub blux-ca engine for offline verification harness runs.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    accept_parser = subparsers.add_parser("accept")
+    accept_parser.add_argument("--fixtures", required=True)
+    accept_parser.add_argument("--out", required=True)
+    accept_parser.add_argument("--profile", default=None)
+    run_parser = subparsers.add_parser("run")
+    run_parser.add_argument("--goal", required=True)
+    run_parser.add_argument("--out", required=True)
+    run_parser.add_argument("--model-version", default=MODEL_VERSION)
+    run_parser.add_argument("--policy-pack", default="cA-pro")
+    run_parser.add_argument("--profile", default=None)
+    subparsers.add_parser("worker")
+    args = parser.parse_args()
+    if args.command == "worker":
+        return worker()
+    if args.command == "run":
+        time.sleep(float(os.environ.get("BLUX_CA_STUB_DELAY", "0")))
+        try:
+            run(pathlib.Path(args.goal), pathlib.Path(args.out), args.model_version, args.policy_pack, args.profile, dataset_fixtures())
+        except ValueError as exc:
+            print(f"stub engine: {exc}", file=sys.stderr)
+            return 1
+        return 0
+    return accept(pathlib.Path(args.fixtures), pathlib.Path(args.out), args.profile)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
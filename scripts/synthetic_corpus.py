@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Generate synthetic BLUX cA corpora in the committed fixture layout for scaling benchmarks.
+
+A corpus is a directory shaped like this repo (``DATASET_VERSION``, the mapping lock, ``schemas/``
+and ``fixtures/``) so the dataset scripts can run against it unchanged with it as the working
+directory. Every committed fixture is copied once (keeping coverage requirements satisfied) and
+the rest are clones of the committed fixtures, renamed ``<template>_<n>``, with their expected
+bundles, profile subdirectories, ``archives/`` trees and ``report.json`` files intact.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import shutil
+import sys
+from typing import Any
+
+from dataset_common import DATASET_MAPPING_PATH, DATASET_VERSION_PATH, FIXTURE_ROOT, REPO_ROOT, fixture_dirs
+
+# validate_dataset.py special-cases this fixture name, so clones of it would not validate.
+UNCLONEABLE_TEMPLATES = {"policy_pack_matrix"}
+FILLER = "blux-ca synthetic payload "
+
+
+def _pad_artifact(payload: dict[str, Any], artifact_bytes: int) -> None:
+    artifact = payload.get("artifact")
+    if not isinstance(artifact, dict):
+        return
+    content = artifact.get("content")
+    if isinstance(content, str):
+        target, key = artifact, "content"
+    elif isinstance(content, dict) and content.get("files"):
+        target, key = content["files"][0], "content"
+    else:
+        return
+    missing = artifact_bytes - len(target[key].encode("utf-8"))
+    if missing > 0:
+        target[key] += (FILLER * (missing // len(FILLER) + 1))[:missing]
+
+
+def _rename(payload: dict[str, Any], fixture_id: str, artifact_bytes: int) -> dict[str, Any]:
+    if "metadata" in payload:
+        payload["id"] = f"goal_{fixture_id}"
+        payload["metadata"]["fixture_id"] = fixture_id
+    else:
+        payload["fixture_id"] = fixture_id
+        if artifact_bytes:
+            _pad_artifact(payload, artifact_bytes)
+    return payload
+
+
+def _write_json(path: pathlib.Path, payload: Any) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+def clone_fixture(template: pathlib.Path, dest: pathlib.Path, fixture_id: str, artifact_bytes: int = 0) -> None:
+    for source in sorted(template.rglob("*.json")):
+        payload = json.loads(source.read_text(encoding="utf-8"))
+        _write_json(dest / source.relative_to(template), _rename(payload, fixture_id, artifact_bytes))
+
+
+def write_actual_outputs(fixture_dir: pathlib.Path, actual_root: pathlib.Path, dataset_version: str) -> None:
+    """Write a dataset-format run for ``fixture_dir`` that matches its default cA-pro bundle."""
+    bundle = fixture_dir / "expected" / dataset_version / "cA-pro"
+    out_dir = actual_root / fixture_dir.name
+    out_dir.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(bundle / "expected_artifact.json", out_dir / "artifact.json")
+    shutil.copyfile(bundle / "expected_verdict.json", out_dir / "verdict.json")
+
+
+def generate_corpus(
+    dest: pathlib.Path,
+    fixtures: int,
+    *,
+    artifact_bytes: int = 0,
+    actual_outputs: bool = True,
+    source_root: pathlib.Path = REPO_ROOT,
+) -> dict[str, Any]:
+    """Write a corpus with ``fixtures`` fixture directories under ``dest``; return a summary."""
+    if dest.exists() and any(dest.iterdir()):
+        raise SystemExit(f"Corpus destination is not empty: {dest}")
+    templates = fixture_dirs(source_root / FIXTURE_ROOT)
+    if fixtures < len(templates):
+        raise SystemExit(f"--fixtures must be at least {len(templates)} (one copy of each committed fixture).")
+    dataset_version = (source_root / DATASET_VERSION_PATH).read_text(encoding="utf-8").strip()
+
+    dest.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(source_root / DATASET_VERSION_PATH, dest / DATASET_VERSION_PATH)
+    shutil.copyfile(source_root / DATASET_MAPPING_PATH, dest / DATASET_MAPPING_PATH)
+    shutil.copytree(source_root / "schemas", dest / "schemas")
+    fixture_root = dest / FIXTURE_ROOT
+    for template in templates:
+        clone_fixture(template, fixture_root / template.name, template.name, artifact_bytes)
+
+    cloneable = [template for template in templates if template.name not in UNCLONEABLE_TEMPLATES]
+    for index in range(fixtures - len(templates)):
+        template = cloneable[index % len(cloneable)]
+        fixture_id = f"{template.name}_{index:06d}"
+        clone_fixture(template, fixture_root / fixture_id, fixture_id, artifact_bytes)
+
+    if actual_outputs:
+        for fixture_dir in sorted(path for path in fixture_root.iterdir() if path.is_dir()):
+            write_actual_outputs(fixture_dir, dest / "actual", dataset_version)
+    return {
+        "root": dest.as_posix(),
+        "fixtures": fixtures,
+        "artifact_bytes": artifact_bytes,
+        "actual_root": (dest / "actual").as_posix() if actual_outputs else None,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Generate a synthetic BLUX cA corpus in the fixture layout.")
+    parser.add_argument("dest", help="Empty (or missing) directory to write the corpus into.")
+    parser.add_argument("--fixtures", type=int, default=1_000, help="Total fixture directories to generate.")
+    parser.add_argument("--artifact-bytes", type=int, default=0, help="Pad text artifact content to at least this many bytes (0 keeps template sizes).")
+    parser.add_argument("--no-actual", action="store_true", help="Skip writing the matching dataset-format run under <dest>/actual.")
+    args = parser.parse_args()
+    summary = generate_corpus(pathlib.Path(args.dest), args.fixtures, artifact_bytes=args.artifact_bytes, actual_outputs=not args.no_actual)
+    print(json.dumps(summary, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
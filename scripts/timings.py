@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""Opt-in per-phase and per-fixture timings shared by the dataset scripts."""
+from __future__ import annotations
+
+import json
+import os
+import pathlib
+import sys
+import time
+from typing import Any
+
+TIMINGS_PATH = os.environ.get("BLUX_DATASET_TIMINGS") or None
+TIMINGS_TOP_N = int(os.environ.get("BLUX_DATASET_TIMINGS_TOP", "10"))
+
+
+class _NullSpan:
+    __slots__ = ("nbytes",)
+
+    def __enter__(self) -> _NullSpan:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _PhaseSpan:
+    __slots__ = ("timings", "name", "nbytes", "started")
+
+    def __init__(self, timings: Timings, name: str, nbytes: int) -> None:
+        self.timings = timings
+        self.name = name
+        self.nbytes = nbytes
+
+    def __enter__(self) -> _PhaseSpan:
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.timings.record(self.name, time.perf_counter() - self.started, self.nbytes)
+
+
+class _FixtureSpan:
+    __slots__ = ("timings", "name", "started")
+
+    def __init__(self, timings: Timings, name: str) -> None:
+        self.timings = timings
+        self.name = name
+
+    def __enter__(self) -> _FixtureSpan:
+        self.timings.current_fixture = self.name
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        elapsed = time.perf_counter() - self.started
+        self.timings.current_fixture = None
+        entry = self.timings.fixtures.setdefault(self.name, [0.0, 0, 0])
+        entry[0] += elapsed
+        entry[2] += 1
+
+
+class Timings:
+    """Opt-in wall time, call and byte counters per phase and per fixture; a shared no-op span while disabled."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.started = 0.0
+        self.current_fixture: str | None = None
+        self.phases: dict[str, list[float]] = {}
+        self.fixtures: dict[str, list[float]] = {}
+
+    def enable(self) -> None:
+        self.enabled = True
+        self.started = time.perf_counter()
+
+    def phase(self, name: str, nbytes: int = 0) -> _PhaseSpan | _NullSpan:
+        return _PhaseSpan(self, name, nbytes) if self.enabled else _NULL_SPAN
+
+    def fixture(self, name: str) -> _FixtureSpan | _NullSpan:
+        if not self.enabled or self.current_fixture is not None:
+            return _NULL_SPAN
+        return _FixtureSpan(self, name)
+
+    def record(self, name: str, seconds: float, nbytes: int = 0) -> None:
+        entry = self.phases.setdefault(name, [0.0, 0, 0])
+        entry[0] += seconds
+        entry[1] += 1
+        entry[2] += nbytes
+        if nbytes and self.current_fixture is not None:
+            self.fixtures.setdefault(self.current_fixture, [0.0, 0, 0])[1] += nbytes
+
+    def drain(self) -> dict[str, Any] | None:
+        """Return and reset the counters gathered so far (None while disabled)."""
+        if not self.enabled:
+            return None
+        snapshot = {"phases": self.phases, "fixtures": self.fixtures}
+        self.phases, self.fixtures = {}, {}
+        return snapshot
+
+    def merge(self, snapshot: dict[str, Any] | None) -> None:
+        if snapshot is None:
+            return
+        for name, (seconds, calls, nbytes) in snapshot["phases"].items():
+            entry = self.phases.setdefault(name, [0.0, 0, 0])
+            entry[0] += seconds
+            entry[1] += calls
+            entry[2] += nbytes
+        for name, (seconds, nbytes, calls) in snapshot["fixtures"].items():
+            entry = self.fixtures.setdefault(name, [0.0, 0, 0])
+            entry[0] += seconds
+            entry[1] += nbytes
+            entry[2] += calls
+
+    def summary(self, script: str, top: int = TIMINGS_TOP_N) -> dict[str, Any]:
+        slowest = sorted(self.fixtures.items(), key=lambda item: (-item[1][0], item[0]))[:top]
+        return {
+            "script": script,
+            "wall_seconds": round(time.perf_counter() - self.started, 6),
+            "phases": {
+                name: {"seconds": round(seconds, 6), "calls": calls, "bytes": nbytes}
+                for name, (seconds, calls, nbytes) in sorted(self.phases.items())
+            },
+            "fixtures": len(self.fixtures),
+            "slowest_fixtures": [
+                {"fixture": name, "seconds": round(seconds, 6), "calls": calls, "bytes": nbytes}
+                for name, (seconds, nbytes, calls) in slowest
+            ],
+        }
+
+
+TIMINGS = Timings()
+
+
+def init_worker_timings(enabled: bool) -> None:
+    """Process pool initializer: start the worker's counters empty and enabled like the parent's.
+
+    Forked workers would inherit (and re-report) the parent's counters, while spawned and
+    forkserver workers re-import this module with timings off, so the parent's state is passed in.
+    """
+    TIMINGS.phases, TIMINGS.fixtures = {}, {}
+    TIMINGS.current_fixture = None
+    if enabled:
+        TIMINGS.enable()
+    else:
+        TIMINGS.enabled = False
+
+
+def configure_timings(destination: str | None) -> str | None:
+    """Enable ``TIMINGS`` when ``--timings`` or ``BLUX_DATASET_TIMINGS`` names a destination ("-" is stderr)."""
+    destination = destination or TIMINGS_PATH
+    if destination:
+        TIMINGS.enable()
+    return destination
+
+
+def emit_timings(destination: str | None, script: str) -> None:
+    if not destination:
+        return
+    text = json.dumps(TIMINGS.summary(script), indent=2, sort_keys=True)
+    if destination == "-":
+        print(text, file=sys.stderr)
+    else:
+        pathlib.Path(destination).write_text(text + "\n", encoding="utf-8")
@@ -2,19 +2,27 @@
 """Validate fixture layout, metadata completeness, contract mapping, and export derivation."""
 from __future__ import annotations
 
+import argparse
+import os
 import pathlib
 import sys
 from collections import Counter
+from functools import partial
 from typing import Any
 
 from dataset_common import (
+    DOCUMENT_CACHE,
     REQUIRED_METADATA_FIELDS,
     build_export_row,
     fixture_dirs,
+    format_cache_stats,
     iter_expected_bundles,
     load_json,
+    path_exists,
     read_mapping,
 )
+from json_schema import dataset_schemas, validate as validate_schema
+from timings import TIMINGS, configure_timings, emit_timings, init_worker_timings
 
 REQUIRED_SCENARIO_TYPES = {
     "baseline_pass",
@@ -126,14 +134,30 @@ def validate_request_block(
 
 
 
-def validate_fixture(fixture_dir: pathlib.Path, mapping: dict[str, Any], coverage: Counter[str]) -> list[str]:
+def check_schema(kind: str, payload: Any, label: str, errors: list[str]) -> None:
+    with TIMINGS.phase("schema"):
+        violations = validate_schema(dataset_schemas()[kind], payload)
+    for violation in violations:
+        errors.append(f"Schema violation in {label} at {violation}")
+
+
+
+def validate_fixture(
+    fixture_dir: pathlib.Path,
+    mapping: dict[str, Any],
+    coverage: Counter[str],
+    *,
+    check_schemas: bool = False,
+) -> list[str]:
     errors: list[str] = []
     goal = fixture_dir / "goal.json"
-    if not goal.exists():
+    if not path_exists(goal):
         errors.append(f"Missing {goal}")
         return errors
 
     goal_metadata = validate_goal_metadata(goal, mapping, errors)
+    if check_schemas:
+        check_schema("goal", load_json(goal), str(goal), errors)
     scenario_type = goal_metadata.get("scenario_type")
     if scenario_type:
         coverage[scenario_type] += 1
@@ -150,9 +174,9 @@ def validate_fixture(fixture_dir: pathlib.Path, mapping: dict[str, Any], coverag
         artifact_path = bundle.bundle_dir / "expected_artifact.json"
         verdict_path = bundle.bundle_dir / "expected_verdict.json"
         for path in (artifact_path, verdict_path):
-            if not path.exists():
+            if not path_exists(path):
                 errors.append(f"Missing {path}")
-        if not artifact_path.exists() or not verdict_path.exists():
+        if not path_exists(artifact_path) or not path_exists(verdict_path):
             continue
 
         artifact = expect_version(artifact_path, bundle.model_version, errors)
@@ -183,8 +207,11 @@ def validate_fixture(fixture_dir: pathlib.Path, mapping: dict[str, Any], coverag
             errors.append(f"Verdict contract mismatch in {verdict_path}")
         if verdict.get("status") != verdict.get("outcome"):
             errors.append(f"Verdict status/outcome mismatch in {verdict_path}")
+        if check_schemas:
+            check_schema("artifact", artifact, str(artifact_path), errors)
+            check_schema("verdict", verdict, str(verdict_path), errors)
         report = bundle.bundle_dir / "report.json"
-        if report.exists():
+        if path_exists(report):
             report_data = expect_version(report, bundle.model_version, errors)
             validate_request_block(
                 report_data,
@@ -200,14 +227,18 @@ def validate_fixture(fixture_dir: pathlib.Path, mapping: dict[str, Any], coverag
                 errors.append(f"Report contract mismatch in {report}")
             if report_data.get("status") != report_data.get("outcome"):
                 errors.append(f"Report status/outcome mismatch in {report}")
+            if check_schemas:
+                check_schema("report", report_data, str(report), errors)
             coverage["report_harness"] += 1
 
         row = build_export_row(bundle, mapping)
+        if check_schemas:
+            check_schema("export_row", row, f"export row for {bundle.bundle_dir}", errors)
         for section in ("goal", "artifact", "verdict"):
             path = pathlib.Path(row["source_paths"][section])
-            if not path.exists():
+            if not path_exists(path):
                 errors.append(f"Export row points to missing path: {path}")
-        if row["source_paths"]["report"] is not None and not pathlib.Path(row["source_paths"]["report"]).exists():
+        if row["source_paths"]["report"] is not None and not path_exists(pathlib.Path(row["source_paths"]["report"])):
             errors.append(f"Export row points to missing report path: {row['source_paths']['report']}")
         if bundle.archive_version is None and bundle.fixture_dir.name != "policy_pack_matrix":
             if verdict.get("outcome") != row["metadata"]["expected_outcome"]:
@@ -226,19 +257,84 @@ def validate_fixture(fixture_dir: pathlib.Path, mapping: dict[str, Any], coverag
 
 
 
-def main() -> int:
-    mapping = read_mapping()
+def _validate_fixture_job(
+    fixture_dir: pathlib.Path, mapping: dict[str, Any], check_schemas: bool
+) -> tuple[list[str], Counter[str], tuple[int, int, int], dict[str, Any] | None]:
+    coverage: Counter[str] = Counter()
+    before = DOCUMENT_CACHE.counters()
+    with TIMINGS.fixture(fixture_dir.name):
+        errors = validate_fixture(fixture_dir, mapping, coverage, check_schemas=check_schemas)
+    after = DOCUMENT_CACHE.counters()
+    return errors, coverage, (after[0] - before[0], after[1] - before[1], after[2] - before[2]), TIMINGS.drain()
+
+
+
+def validate_fixtures(
+    fixtures: list[pathlib.Path],
+    mapping: dict[str, Any],
+    jobs: int = 1,
+    *,
+    check_schemas: bool = False,
+) -> tuple[list[str], Counter[str]]:
+    """Validate fixtures, fanning out over ``jobs`` worker processes when ``jobs > 1``.
+
+    Results are merged in fixture order, so failures are reported exactly as in a serial run.
+    """
     failures: list[str] = []
     coverage: Counter[str] = Counter()
-    for fixture_dir in fixture_dirs():
-        failures.extend(validate_fixture(fixture_dir, mapping, coverage))
+    if jobs <= 1 or len(fixtures) <= 1:
+        for fixture_dir in fixtures:
+            with TIMINGS.fixture(fixture_dir.name):
+                failures.extend(validate_fixture(fixture_dir, mapping, coverage, check_schemas=check_schemas))
+        return failures, coverage
+
+    from concurrent.futures import ProcessPoolExecutor
 
+    workers = min(jobs, len(fixtures))
+    chunksize = max(1, len(fixtures) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker_timings, initargs=(TIMINGS.enabled,)) as executor:
+        for errors, fixture_coverage, cache_counters, timings in executor.map(
+            partial(_validate_fixture_job, mapping=mapping, check_schemas=check_schemas), fixtures, chunksize=chunksize
+        ):
+            failures.extend(errors)
+            coverage.update(fixture_coverage)
+            DOCUMENT_CACHE.merge_counters(cache_counters)
+            TIMINGS.merge(timings)
+    return failures, coverage
+
+
+
+def coverage_gaps(coverage: Counter[str]) -> list[str]:
+    gaps: list[str] = []
     for required in REQUIRED_SCENARIO_TYPES:
         if coverage[required] == 0:
-            failures.append(f"Coverage gap: missing scenario_type '{required}'")
+            gaps.append(f"Coverage gap: missing scenario_type '{required}'")
     for required in REQUIRED_OUTCOMES:
         if coverage[f"outcome:{required}"] == 0:
-            failures.append(f"Coverage gap: missing outcome '{required}'")
+            gaps.append(f"Coverage gap: missing outcome '{required}'")
+    return gaps
+
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--jobs", type=int, default=1, help="Number of worker processes (default: 1 for serial; 0 uses all CPUs).")
+    parser.add_argument("--schema", action="store_true", help="Also validate goals, bundles, and derived export rows against schemas/.")
+    parser.add_argument("--cache-stats", action="store_true", help="Print document cache hit/miss counters to stderr.")
+    parser.add_argument("--timings", nargs="?", const="-", default=None, help="Record per-phase and per-fixture timings and write a JSON summary to PATH (stderr when omitted); BLUX_DATASET_TIMINGS=PATH does the same.")
+
+
+def run(args: argparse.Namespace) -> int:
+    if args.jobs < 0:
+        raise SystemExit("--jobs must be >= 0")
+    jobs = args.jobs or os.cpu_count() or 1
+
+    mapping = read_mapping()
+    failures, coverage = validate_fixtures(fixture_dirs(), mapping, jobs, check_schemas=args.schema)
+
+    failures.extend(coverage_gaps(coverage))
+
+    if args.cache_stats:
+        print(format_cache_stats(), file=sys.stderr)
 
     if failures:
         for failure in failures:
@@ -249,5 +345,15 @@ def main() -> int:
     return 0
 
 
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Validate BLUX cA fixture layout, metadata, and export derivation.")
+    add_arguments(parser)
+    args = parser.parse_args()
+    timings_destination = configure_timings(args.timings)
+    status = run(args)
+    emit_timings(timings_destination, "validate_dataset")
+    return status
+
+
 if __name__ == "__main__":
     sys.exit(main())
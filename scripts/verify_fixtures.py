@@ -3,16 +3,41 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import inspect
 import json
 import os
 import pathlib
+import queue
 import shlex
+import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Iterable
 
-from dataset_common import canonical_dumps, fixture_dirs, load_json, normalize, read_dataset_version
+import dataset_common
+import document_cache
+import fixture_layout
+from dataset_common import (
+    FIXTURE_PACK_PATH,
+    REPO_ROOT,
+    escape_pointer_token,
+    file_sha256,
+    fixture_dirs,
+    iter_expected_bundles,
+    load_json,
+    load_normalized_json,
+    path_exists,
+    read_dataset_version,
+    read_fixture_bytes,
+)
+from timings import TIMINGS, configure_timings, emit_timings, init_worker_timings
 
 
 def expected_dir(
@@ -30,94 +55,254 @@ def expected_dir(
     if profile_id:
         profile_root = base / profile_id
         policy_pack_dir = profile_root / policy_pack
-        return policy_pack_dir if policy_pack_dir.exists() else profile_root
+        return policy_pack_dir if path_exists(policy_pack_dir) else profile_root
     return base / policy_pack
 
 
+MAX_PAYLOAD_DIFFS = 20
+# Bump when comparison semantics change in a way the source fingerprint would not capture.
+VERIFIER_VERSION = "1"
+VERIFY_CACHE_FORMAT = 1
+VERIFY_CACHE_PATH = os.environ.get("BLUX_DATASET_VERIFY_CACHE") or (REPO_ROOT / ".cache" / "verify_fixtures.json").as_posix()
+VERIFY_CACHE_MAX_BYTES = 16 << 20
+_ABSENT = object()
+
+
+@dataclass(frozen=True)
+class PayloadDiff:
+    pointer: str
+    expected: Any
+    actual: Any
+
+    def describe(self) -> str:
+        actual = "<missing>" if self.actual is _ABSENT else _short_repr(self.actual)
+        return f"at {self.pointer or '/'}: expected {_short_repr(self.expected)}, got {actual}"
+
+
+def _short_repr(value: Any, limit: int = 120) -> str:
+    text = json.dumps(value, ensure_ascii=False, sort_keys=True) if not isinstance(value, str) else repr(value)
+    return text if len(text) <= limit else f"{text[:limit - 3]}..."
+
+
+def diff_payloads(expected: Any, actual: Any, limit: int = MAX_PAYLOAD_DIFFS) -> list[PayloadDiff]:
+    """Return up to ``limit`` places where ``actual`` does not contain ``expected``.
+
+    Subset semantics match the stored-envelope contract: dicts in ``expected`` may omit keys
+    that ``actual`` has, lists must match length and element-wise, scalars compare with ``==``.
+    Any subtree that compares equal is skipped with a single C-level ``==`` instead of walked.
+    """
+    diffs: list[PayloadDiff] = []
+    # Explicit stack of (pointer, expected, actual) keeps traversal order document-ordered.
+    stack: list[tuple[str, Any, Any]] = [("", expected, actual)]
+    while stack and len(diffs) < limit:
+        pointer, exp, act = stack.pop()
+        if exp is act or exp == act:
+            continue
+        if isinstance(exp, dict):
+            if not isinstance(act, dict):
+                diffs.append(PayloadDiff(pointer, exp, act))
+                continue
+            for key in reversed(list(exp)):
+                stack.append((f"{pointer}/{escape_pointer_token(key)}", exp[key], act.get(key, _ABSENT)))
+            continue
+        if isinstance(exp, list):
+            if not isinstance(act, list) or len(exp) != len(act):
+                diffs.append(PayloadDiff(pointer, exp, act))
+                continue
+            for index in range(len(exp) - 1, -1, -1):
+                stack.append((f"{pointer}/{index}", exp[index], act[index]))
+            continue
+        diffs.append(PayloadDiff(pointer, exp, act))
+    return diffs
+
+
 def payload_contains(expected: Any, actual: Any) -> bool:
-    if isinstance(expected, dict):
-        if not isinstance(actual, dict):
-            return False
-        return all(k in actual and payload_contains(v, actual[k]) for k, v in expected.items())
-    if isinstance(expected, list):
-        if not isinstance(actual, list) or len(expected) != len(actual):
-            return False
-        return all(payload_contains(e, a) for e, a in zip(expected, actual))
-    return expected == actual
+    return not diff_payloads(expected, actual, limit=1)
 
 
 def compare_payloads(errors: list[str], label: str, expected_path: pathlib.Path, actual_path: pathlib.Path, fixture: str) -> None:
-    expected = normalize(load_json(expected_path))
-    actual = normalize(load_json(actual_path))
-    if canonical_dumps(expected) == canonical_dumps(actual):
-        return
-    if payload_contains(expected, actual):
-        return
-    errors.append(f"{label} mismatch for fixture '{fixture}'")
+    expected, actual = load_normalized_json(expected_path), load_normalized_json(actual_path)
+    with TIMINGS.phase("diff"):
+        diffs = diff_payloads(expected, actual, limit=MAX_PAYLOAD_DIFFS + 1)
+    for diff in diffs[:MAX_PAYLOAD_DIFFS]:
+        errors.append(f"{label} mismatch for fixture '{fixture}' {diff.describe()}")
+    if len(diffs) > MAX_PAYLOAD_DIFFS:
+        errors.append(f"{label} mismatch for fixture '{fixture}': further differences omitted after {MAX_PAYLOAD_DIFFS}")
 
 
-def compare_fixture(name: str, expected_root: pathlib.Path, actual_root: pathlib.Path, model_version: str, policy_pack: str, profile_id: str | None) -> list[str]:
-    errors: list[str] = []
-    expected_base = expected_dir(expected_root, name, model_version, policy_pack, profile_id=profile_id)
+class VerificationCache:
+    """Persistent record of comparisons that last verified clean.
+
+    A key is the sha256 over the verifier fingerprint, the comparison arguments, and the path and
+    content hash of every expected/actual file involved, so editing any input or the verifier
+    itself misses the cache. Only passes are stored; failures are recomputed so their messages
+    stay current. Entries carry a last-used timestamp and are evicted oldest-first once the
+    serialized cache exceeds ``max_bytes``.
+    """
+
+    def __init__(self, path: pathlib.Path, max_bytes: int = VERIFY_CACHE_MAX_BYTES) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.entries: dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.now = int(time.time())
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            payload = None
+        if isinstance(payload, dict) and payload.get("version") == VERIFY_CACHE_FORMAT:
+            self.entries = {key: int(used) for key, used in payload.get("entries", {}).items()}
+
+    def key(self, args: Iterable[Any], files: dict[str, pathlib.Path]) -> str:
+        hasher = hashlib.sha256(verifier_fingerprint().encode("utf-8"))
+        hasher.update(json.dumps(list(args)).encode("utf-8"))
+        for label, path in sorted(files.items()):
+            hasher.update(f"\0{label}\0{file_sha256(path)}".encode("utf-8"))
+        return hasher.hexdigest()
+
+    def hit(self, key: str) -> bool:
+        if key in self.entries:
+            self.entries[key] = self.now
+            self.hits += 1
+            return True
+        self.misses += 1
+        return False
+
+    def store(self, key: str) -> None:
+        self.entries[key] = self.now
+
+    def prune(self, max_bytes: int | None = None) -> int:
+        """Drop least recently used entries until the serialized cache fits; return how many were dropped."""
+        budget = self.max_bytes if max_bytes is None else max_bytes
+        kept: dict[str, int] = {}
+        size = len(json.dumps({"entries": {}, "version": VERIFY_CACHE_FORMAT}))
+        for key, used in sorted(self.entries.items(), key=lambda item: item[1], reverse=True):
+            # '"<key>": <used>, ' per entry in json.dumps output.
+            size += len(key) + len(str(used)) + 6
+            if size > budget:
+                break
+            kept[key] = used
+        dropped = len(self.entries) - len(kept)
+        self.entries = kept
+        return dropped
+
+    def save(self) -> None:
+        self.prune()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps({"entries": self.entries, "version": VERIFY_CACHE_FORMAT}, sort_keys=True), encoding="utf-8")
+        os.replace(tmp_path, self.path)
 
-    if profile_id and not expected_base.exists():
-        expected_base = expected_dir(expected_root, name, model_version, policy_pack)
-    if not expected_base.exists() and policy_pack != "cA-pro":
-        expected_base = expected_dir(expected_root, name, model_version, "cA-pro", profile_id=profile_id)
-        if profile_id and not expected_base.exists():
-            expected_base = expected_dir(expected_root, name, model_version, "cA-pro")
 
+@lru_cache(maxsize=None)
+def verifier_fingerprint() -> str:
+    """VERIFIER_VERSION plus the source of the comparison code and the loaders it reads fixtures through, so local edits invalidate cached passes."""
+    hasher = hashlib.sha256(VERIFIER_VERSION.encode("utf-8"))
+    for module in (__file__, dataset_common.__file__, document_cache.__file__, fixture_layout.__file__):
+        hasher.update(pathlib.Path(module).read_bytes())
+    return hasher.hexdigest()
+
+
+def _compare_bundle(
+    errors: list[str],
+    fixture: str,
+    expected_base: pathlib.Path,
+    actual_base: pathlib.Path,
+    *,
+    label_suffix: str = "",
+    cache: VerificationCache | None = None,
+    cache_args: tuple[Any, ...] = (),
+) -> None:
     expected_paths = {
         "artifact": expected_base / "expected_artifact.json",
         "verdict": expected_base / "expected_verdict.json",
     }
     actual_paths = {
-        "artifact": actual_root / name / "artifact.json",
-        "verdict": actual_root / name / "verdict.json",
+        "artifact": actual_base / "artifact.json",
+        "verdict": actual_base / "verdict.json",
     }
 
+    missing: list[str] = []
     for key in ("artifact", "verdict"):
-        if not expected_paths[key].exists():
-            errors.append(f"Missing expected file {expected_paths[key]}")
+        if not path_exists(expected_paths[key]):
+            missing.append(f"Missing expected file {expected_paths[key]}")
         if not actual_paths[key].exists():
-            errors.append(f"Missing actual file {actual_paths[key]}")
+            missing.append(f"Missing actual file {actual_paths[key]}")
+    if missing:
+        errors.extend(missing)
+        return
+
+    cache_key = None
+    if cache is not None:
+        files = {f"expected_{key}": path for key, path in expected_paths.items()}
+        files.update({f"actual_{key}": path for key, path in actual_paths.items()})
+        # The actual root is not part of the key: engine-cmd runs write to a fresh temp dir.
+        cache_key = cache.key((*cache_args, expected_base.as_posix()), files)
+        if cache.hit(cache_key):
+            return
+    local_errors: list[str] = []
+    compare_payloads(local_errors, f"Artifact{label_suffix}", expected_paths["artifact"], actual_paths["artifact"], fixture)
+    compare_payloads(local_errors, f"Verdict{label_suffix}", expected_paths["verdict"], actual_paths["verdict"], fixture)
+    if cache_key is not None and not local_errors:
+        cache.store(cache_key)
+    errors.extend(local_errors)
 
-    if errors:
-        return errors
 
-    compare_payloads(errors, "Artifact", expected_paths["artifact"], actual_paths["artifact"], name)
-    compare_payloads(errors, "Verdict", expected_paths["verdict"], actual_paths["verdict"], name)
+def compare_fixture(
+    name: str,
+    expected_root: pathlib.Path,
+    actual_root: pathlib.Path,
+    model_version: str,
+    policy_pack: str,
+    profile_id: str | None,
+    cache: VerificationCache | None = None,
+) -> list[str]:
+    errors: list[str] = []
+    expected_base = expected_dir(expected_root, name, model_version, policy_pack, profile_id=profile_id)
+
+    if profile_id and not path_exists(expected_base):
+        expected_base = expected_dir(expected_root, name, model_version, policy_pack)
+    if not path_exists(expected_base) and policy_pack != "cA-pro":
+        expected_base = expected_dir(expected_root, name, model_version, "cA-pro", profile_id=profile_id)
+        if profile_id and not path_exists(expected_base):
+            expected_base = expected_dir(expected_root, name, model_version, "cA-pro")
+
+    _compare_bundle(
+        errors,
+        name,
+        expected_base,
+        actual_root / name,
+        cache=cache,
+        cache_args=("fixture", name, model_version, policy_pack, profile_id),
+    )
     return errors
 
 
-def compare_archives(fixture: str, expected_root: pathlib.Path, archive_root: pathlib.Path, policy_pack: str, versions: Iterable[str]) -> list[str]:
+def compare_archives(
+    fixture: str,
+    expected_root: pathlib.Path,
+    archive_root: pathlib.Path,
+    policy_pack: str,
+    versions: Iterable[str],
+    cache: VerificationCache | None = None,
+) -> list[str]:
     errors: list[str] = []
     for version in versions:
         expected_base = expected_dir(expected_root, fixture, model_version=version, policy_pack=policy_pack, archive_version=version)
-        if not expected_base.exists() and policy_pack != "cA-pro":
+        if not path_exists(expected_base) and policy_pack != "cA-pro":
             expected_base = expected_dir(expected_root, fixture, model_version=version, policy_pack="cA-pro", archive_version=version)
-        if not expected_base.exists():
+        if not path_exists(expected_base):
             continue
-        actual_base = archive_root / version / policy_pack / fixture
-        expected_paths = {
-            "artifact": expected_base / "expected_artifact.json",
-            "verdict": expected_base / "expected_verdict.json",
-        }
-        actual_paths = {
-            "artifact": actual_base / "artifact.json",
-            "verdict": actual_base / "verdict.json",
-        }
-        local_errors: list[str] = []
-        for key in ("artifact", "verdict"):
-            if not expected_paths[key].exists():
-                local_errors.append(f"Missing expected file {expected_paths[key]}")
-            if not actual_paths[key].exists():
-                local_errors.append(f"Missing actual file {actual_paths[key]}")
-        if local_errors:
-            errors.extend(local_errors)
-            continue
-        compare_payloads(errors, f"Artifact ({version})", expected_paths["artifact"], actual_paths["artifact"], fixture)
-        compare_payloads(errors, f"Verdict ({version})", expected_paths["verdict"], actual_paths["verdict"], fixture)
+        _compare_bundle(
+            errors,
+            fixture,
+            expected_base,
+            archive_root / version / policy_pack / fixture,
+            label_suffix=f" ({version})",
+            cache=cache,
+            cache_args=("archive", fixture, version, policy_pack),
+        )
     return errors
 
 
@@ -133,6 +318,230 @@ def render_engine_command(template: str, *, fixture: str, goal: pathlib.Path, ou
     return [part for part in shlex.split(command) if part]
 
 
+def engine_goal_path(fixture_dir: pathlib.Path, out_dir: pathlib.Path) -> pathlib.Path:
+    """Return an on-disk ``goal.json`` for an external engine, copying it into ``out_dir`` when it only exists in a fixture pack."""
+    goal = fixture_dir / "goal.json"
+    if goal.exists():
+        return goal
+    copied = out_dir / "goal.json"
+    copied.write_bytes(read_fixture_bytes(goal))
+    return copied
+
+
+def _stderr_tail(stderr_path: pathlib.Path) -> str:
+    try:
+        tail = stderr_path.read_text(encoding="utf-8", errors="replace").strip().splitlines()[-5:]
+    except OSError:
+        return ""
+    return f"; stderr tail: {' | '.join(tail)}" if tail else ""
+
+
+def _run_logged_engine_command(fixture: str, cmd: list[str], log_dir: pathlib.Path) -> str | None:
+    """Run one engine command with stdout/stderr captured to per-fixture logs; return a failure or None."""
+    stdout_path = log_dir / f"{fixture}.stdout.log"
+    stderr_path = log_dir / f"{fixture}.stderr.log"
+    try:
+        with stdout_path.open("wb") as stdout, stderr_path.open("wb") as stderr:
+            returncode = subprocess.run(cmd, stdout=stdout, stderr=stderr, stdin=subprocess.DEVNULL).returncode
+    except OSError as exc:
+        return f"Local blux-ca engine command failed for fixture '{fixture}': {exc}"
+    if returncode == 0:
+        return None
+    return f"Local blux-ca engine command failed for fixture '{fixture}' with exit code {returncode} (logs: {stderr_path}){_stderr_tail(stderr_path)}"
+
+
+def run_engine_commands(
+    template: str,
+    fixtures: list[pathlib.Path],
+    actual_root: pathlib.Path,
+    log_dir: pathlib.Path,
+    *,
+    model_version: str,
+    policy_pack: str,
+    profile: str | None,
+    jobs: int,
+) -> dict[str, str]:
+    """Run the per-fixture engine command for every fixture on a bounded thread pool.
+
+    Each child's output goes to ``<log_dir>/<fixture>.stdout.log`` / ``.stderr.log`` instead of
+    the console. Every fixture is run even when some fail; failures are returned by fixture name.
+    """
+    log_dir.mkdir(parents=True, exist_ok=True)
+    commands: dict[str, list[str]] = {}
+    for fixture_dir in fixtures:
+        out_dir = actual_root / fixture_dir.name
+        out_dir.mkdir(parents=True, exist_ok=True)
+        commands[fixture_dir.name] = render_engine_command(
+            template,
+            fixture=fixture_dir.name,
+            goal=engine_goal_path(fixture_dir, out_dir),
+            out_dir=out_dir,
+            model_version=model_version,
+            policy_pack=policy_pack,
+            profile=profile,
+        )
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        results = executor.map(lambda item: _run_logged_engine_command(item[0], item[1], log_dir), commands.items())
+        return {fixture: failure for fixture, failure in zip(commands, results) if failure is not None}
+
+
+ENGINE_WORKER_PROTOCOL = 1
+ENGINE_WORKER_TIMEOUT = 300.0
+
+
+class EngineWorkerError(RuntimeError):
+    pass
+
+
+def _pump_lines(stream: Any, lines: queue.Queue[bytes | None]) -> None:
+    for line in stream:
+        lines.put(line)
+    lines.put(None)
+
+
+class EngineWorker:
+    """One long-lived engine process fed fixtures over line-delimited JSON on stdin/stdout.
+
+    The process first prints ``{"ready": true, "protocol": 1}``. It then answers each request
+    line (``id``, ``fixture``, ``goal``, ``out_dir``, ``model_version``, ``policy_pack`` and
+    ``profile``, the values ``render_engine_command()`` substitutes) with ``{"id": <same>, "ok":
+    true}`` once ``out_dir`` holds ``artifact.json``/``verdict.json``, or with ``"ok": false`` and
+    an ``"error"`` message. stderr is appended to ``log_path``. A worker that exits, answers out
+    of turn or stays silent for ``timeout`` seconds is killed, and the next request starts a new one.
+    """
+
+    def __init__(self, command: list[str], log_path: pathlib.Path, timeout: float = ENGINE_WORKER_TIMEOUT) -> None:
+        self.command = command
+        self.log_path = log_path
+        self.timeout = timeout
+        self.process: subprocess.Popen[bytes] | None = None
+        self.lines: queue.Queue[bytes | None] = queue.Queue()
+        self.starts = 0
+        self.request_id = 0
+
+    def _start(self) -> None:
+        self.starts += 1
+        with self.log_path.open("ab") as stderr:
+            self.process = subprocess.Popen(self.command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=stderr)
+        self.lines = queue.Queue()
+        threading.Thread(target=_pump_lines, args=(self.process.stdout, self.lines), daemon=True).start()
+        hello = self._read()
+        if hello.get("ready") is not True or hello.get("protocol") != ENGINE_WORKER_PROTOCOL:
+            raise EngineWorkerError(f"unexpected handshake {_short_repr(hello)} (expected protocol {ENGINE_WORKER_PROTOCOL})")
+
+    def _read(self) -> dict[str, Any]:
+        assert self.process is not None
+        try:
+            line = self.lines.get(timeout=self.timeout)
+        except queue.Empty:
+            raise EngineWorkerError(f"no response within {self.timeout:g}s") from None
+        if line is None:
+            try:
+                returncode = self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                raise EngineWorkerError("closed stdout") from None
+            raise EngineWorkerError(f"exited with code {returncode}")
+        try:
+            message = json.loads(line)
+        except ValueError:
+            raise EngineWorkerError(f"sent a line that is not JSON: {_short_repr(line.decode('utf-8', 'replace').strip())}") from None
+        if not isinstance(message, dict):
+            raise EngineWorkerError(f"sent {_short_repr(message)} instead of a JSON object")
+        return message
+
+    def run(self, fixture: str, request: dict[str, Any]) -> str | None:
+        """Run one fixture; return a failure message or None."""
+        try:
+            if self.process is None:
+                self._start()
+            assert self.process is not None and self.process.stdin is not None
+            self.request_id += 1
+            self.process.stdin.write(json.dumps(dict(request, id=self.request_id, fixture=fixture)).encode("utf-8") + b"\n")
+            self.process.stdin.flush()
+            response = self._read()
+            if response.get("id") != self.request_id:
+                raise EngineWorkerError(f"answered request {response.get('id')!r} instead of {self.request_id}")
+        except (OSError, EngineWorkerError) as exc:
+            if isinstance(exc, OSError) and self.process is not None and self.process.poll() is not None:
+                exc = EngineWorkerError(f"exited with code {self.process.returncode}")
+            self.stop(kill=True)
+            return f"Local blux-ca engine worker failed for fixture '{fixture}': {exc} (logs: {self.log_path}){_stderr_tail(self.log_path)}"
+        if response.get("ok") is True:
+            return None
+        return f"Local blux-ca engine worker reported failure for fixture '{fixture}': {response.get('error') or 'no error message'}"
+
+    def stop(self, kill: bool = False) -> None:
+        """Close the worker's stdin and wait for it to exit; kill it if asked or if it lingers."""
+        process, self.process = self.process, None
+        if process is None:
+            return
+        if not kill and process.stdin is not None:
+            try:
+                process.stdin.close()
+                process.wait(timeout=10)
+            except (OSError, subprocess.TimeoutExpired):
+                kill = True
+        if kill or process.poll() is None:
+            process.kill()
+            process.wait()
+        if process.stdin is not None:
+            try:
+                process.stdin.close()
+            except OSError:
+                pass
+
+
+def run_engine_workers(
+    command: list[str],
+    fixtures: list[pathlib.Path],
+    actual_root: pathlib.Path,
+    log_dir: pathlib.Path,
+    *,
+    model_version: str,
+    policy_pack: str,
+    profile: str | None,
+    jobs: int,
+    timeout: float = ENGINE_WORKER_TIMEOUT,
+) -> tuple[dict[str, str], int]:
+    """Run every fixture through up to ``jobs`` long-lived :class:`EngineWorker` processes.
+
+    Worker stderr goes to ``<log_dir>/worker-<n>.stderr.log``. Every fixture is run even when
+    some fail or a worker has to be restarted. Returns failures by fixture name and the number of
+    worker processes started.
+    """
+    log_dir.mkdir(parents=True, exist_ok=True)
+    workers = [EngineWorker(command, log_dir / f"worker-{index}.stderr.log", timeout) for index in range(max(1, min(jobs, len(fixtures))))]
+    idle: queue.Queue[EngineWorker] = queue.Queue()
+    for worker in workers:
+        worker.log_path.write_bytes(b"")
+        idle.put(worker)
+
+    def run(fixture_dir: pathlib.Path) -> str | None:
+        out_dir = actual_root / fixture_dir.name
+        out_dir.mkdir(parents=True, exist_ok=True)
+        request = {
+            "goal": engine_goal_path(fixture_dir, out_dir).resolve().as_posix(),
+            "out_dir": out_dir.resolve().as_posix(),
+            "model_version": model_version,
+            "policy_pack": policy_pack,
+            "profile": profile,
+        }
+        worker = idle.get()
+        try:
+            return worker.run(fixture_dir.name, request)
+        finally:
+            idle.put(worker)
+
+    try:
+        with ThreadPoolExecutor(max_workers=len(workers)) as executor:
+            results = list(executor.map(run, fixtures))
+    finally:
+        for worker in workers:
+            worker.stop()
+    failures = {fixture_dir.name: failure for fixture_dir, failure in zip(fixtures, results) if failure is not None}
+    return failures, sum(worker.starts for worker in workers)
+
+
 def _bridge_request_for_fixture(name: str, policy_pack: str) -> dict[str, Any]:
     if name == "multi_file_artifact":
         return {
@@ -195,17 +604,6 @@ def bridge_goal_for_engine(goal: dict[str, Any], fixture_name: str, policy_pack:
     }
 
 
-def _write_engine_bridge_fixtures(expected_root: pathlib.Path, dest_root: pathlib.Path, policy_pack: str) -> None:
-    for fixture_dir in fixture_dirs(expected_root):
-        goal = load_json(fixture_dir / "goal.json")
-        bridge_dir = dest_root / fixture_dir.name
-        bridge_dir.mkdir(parents=True, exist_ok=True)
-        (bridge_dir / "goal.json").write_text(
-            json.dumps(bridge_goal_for_engine(goal, fixture_dir.name, policy_pack), indent=2) + "\n",
-            encoding="utf-8",
-        )
-
-
 def _effective_profile(profile_id: str | None) -> str | None:
     value = (profile_id or "").strip()
     if not value or value == "default":
@@ -220,97 +618,507 @@ def _report_profile_is_expected(report: dict[str, Any], expected_profile: str |
     return report_profile in (None, "default")
 
 
-def run_engine_acceptance(engine_root: pathlib.Path, expected_root: pathlib.Path, actual_root: pathlib.Path, policy_pack: str, profile_id: str | None, python_bin: str) -> None:
+def _check_engine_root(engine_root: pathlib.Path) -> None:
     if not engine_root.exists():
         raise SystemExit(
             f"Engine root not found: {engine_root}. "
             "Set --engine-root (or BLUX_CA_ENGINE_ROOT) to a local blux-ca checkout."
         )
-    with tempfile.TemporaryDirectory(prefix="blux-ca-bridge-fixtures-") as bridge_tmp:
-        bridge_root = pathlib.Path(bridge_tmp)
-        _write_engine_bridge_fixtures(expected_root, bridge_root, policy_pack)
-        cmd = [python_bin, "-m", "blux_ca", "accept", "--fixtures", bridge_root.as_posix(), "--out", actual_root.as_posix()]
-        effective_profile = _effective_profile(profile_id)
-        if effective_profile:
-            cmd.extend(["--profile", effective_profile])
-        env = os.environ.copy()
-        src_path = (engine_root / "src").as_posix()
-        env["PYTHONPATH"] = src_path if not env.get("PYTHONPATH") else f"{src_path}:{env['PYTHONPATH']}"
+
+
+def _run_engine_accept(engine_root: pathlib.Path, bridge_root: pathlib.Path, actual_root: pathlib.Path, profile_id: str | None, python_bin: str, log_dir: pathlib.Path | None = None) -> None:
+    # The engine runs from its checkout, so every path handed to it must be absolute.
+    engine_root = engine_root.resolve()
+    cmd = [python_bin, "-m", "blux_ca", "accept", "--fixtures", bridge_root.resolve().as_posix(), "--out", actual_root.resolve().as_posix()]
+    effective_profile = _effective_profile(profile_id)
+    if effective_profile:
+        cmd.extend(["--profile", effective_profile])
+    env = os.environ.copy()
+    src_path = (engine_root / "src").as_posix()
+    env["PYTHONPATH"] = src_path if not env.get("PYTHONPATH") else f"{src_path}:{env['PYTHONPATH']}"
+    if FIXTURE_PACK_PATH:
+        env["BLUX_DATASET_FIXTURE_PACK"] = os.path.abspath(FIXTURE_PACK_PATH)
+    if log_dir is None:
         subprocess.run(cmd, check=True, cwd=engine_root, env=env)
+        return
+    log_dir.mkdir(parents=True, exist_ok=True)
+    with (log_dir / "accept.stdout.log").open("wb") as stdout, (log_dir / "accept.stderr.log").open("wb") as stderr:
+        subprocess.run(cmd, check=True, cwd=engine_root, env=env, stdout=stdout, stderr=stderr, stdin=subprocess.DEVNULL)
 
 
-def compare_engine_verification(name: str, expected_root: pathlib.Path, actual_root: pathlib.Path, model_version: str, policy_pack: str, profile_id: str | None) -> list[str]:
-    errors: list[str] = []
-    expected_base = expected_dir(expected_root, name, model_version, policy_pack, profile_id=profile_id)
-    if profile_id and not expected_base.exists():
-        expected_base = expected_dir(expected_root, name, model_version, policy_pack)
-    expected_verdict_path = expected_base / "expected_verdict.json"
-    expected_artifact_path = expected_base / "expected_artifact.json"
-    if (not expected_verdict_path.exists() or not expected_artifact_path.exists()) and policy_pack != "cA-pro":
-        fallback_base = expected_dir(expected_root, name, model_version, "cA-pro", profile_id=profile_id)
-        if profile_id and not fallback_base.exists():
-            fallback_base = expected_dir(expected_root, name, model_version, "cA-pro")
-        expected_base = fallback_base
+# Bump when bridge goal generation changes in a way the source fingerprint would not capture.
+BRIDGE_GENERATOR_VERSION = "1"
+BRIDGE_CACHE_FORMAT = 1
+BRIDGE_CACHE_PATH = os.environ.get("BLUX_DATASET_BRIDGE_CACHE") or (REPO_ROOT / ".cache" / "bridge").as_posix()
+BRIDGE_CACHE_MAX_ENTRIES = 65536
+BRIDGE_CACHE_MAX_TREES = 16
+BRIDGE_RUN_FORMAT = 1
+BRIDGE_RUN_MANIFEST = "bridge-run.json"
+
+
+@lru_cache(maxsize=None)
+def bridge_generator_fingerprint() -> str:
+    """BRIDGE_GENERATOR_VERSION plus the source of the bridge goal generators."""
+    hasher = hashlib.sha256(BRIDGE_GENERATOR_VERSION.encode("utf-8"))
+    for function in (_bridge_request_for_fixture, bridge_goal_for_engine):
+        hasher.update(inspect.getsource(function).encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def _write_atomic(path: pathlib.Path, data: bytes) -> None:
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+class BridgeCache:
+    """Content-addressed store of engine bridge goals and the fixture directories built from them.
+
+    ``blobs/<sha256>.json`` holds each distinct bridge goal once, so policy packs that generate the
+    same goal for a fixture share it. ``index.json`` maps (fixture, goal.json sha256, policy pack) to
+    a blob and is discarded when the generator fingerprint changes; a goal is regenerated only on an
+    index miss. ``trees/<sha256>/`` is a directory for ``accept --fixtures``, addressed by its
+    (fixture, blob) pairs and built from hard links to the blobs, so packs whose bridge goals are all
+    identical resolve to the same tree. Trees are never modified once built; the most recently used
+    ``BRIDGE_CACHE_MAX_TREES`` are kept. A cache that is not ``persistent`` lives in a temporary
+    directory for one run.
+    """
+
+    def __init__(self, root: pathlib.Path, *, persistent: bool = True) -> None:
+        self.root = root
+        self.persistent = persistent
+        self.entries: dict[str, list[Any]] = {}
+        self.generated = 0
+        self.reused = 0
+        self.now = int(time.time())
+        try:
+            payload = json.loads((root / "index.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            payload = None
+        if isinstance(payload, dict) and payload.get("version") == BRIDGE_CACHE_FORMAT and payload.get("generator") == bridge_generator_fingerprint():
+            self.entries = payload.get("entries", {})
+
+    def goals(self, expected_root: pathlib.Path, policy_pack: str) -> dict[str, str]:
+        """Return the bridge goal blob of every fixture under ``expected_root`` for ``policy_pack``."""
+        blobs_dir = self.root / "blobs"
+        blobs_dir.mkdir(parents=True, exist_ok=True)
+        goals: dict[str, str] = {}
+        for fixture_dir in fixture_dirs(expected_root):
+            goal_path = fixture_dir / "goal.json"
+            key = hashlib.sha256(f"{fixture_dir.name}\0{file_sha256(goal_path)}\0{policy_pack}".encode("utf-8")).hexdigest()
+            entry = self.entries.get(key)
+            if entry is not None and (blobs_dir / f"{entry[0]}.json").exists():
+                entry[1] = self.now
+                self.reused += 1
+            else:
+                data = (json.dumps(bridge_goal_for_engine(load_json(goal_path), fixture_dir.name, policy_pack), indent=2) + "\n").encode("utf-8")
+                blob = hashlib.sha256(data).hexdigest()
+                if not (blobs_dir / f"{blob}.json").exists():
+                    _write_atomic(blobs_dir / f"{blob}.json", data)
+                entry = self.entries[key] = [blob, self.now]
+                self.generated += 1
+            goals[fixture_dir.name] = entry[0]
+        return goals
+
+    def tree(self, goals: dict[str, str]) -> pathlib.Path:
+        """Return a fixture directory holding ``<fixture>/goal.json`` for each ``fixture -> blob`` in ``goals``."""
+        digest = hashlib.sha256(json.dumps(sorted(goals.items())).encode("utf-8")).hexdigest()
+        path = self.root / "trees" / digest
+        if path.is_dir():
+            os.utime(path)
+            return path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        staging = pathlib.Path(tempfile.mkdtemp(prefix=f".{digest[:12]}.", dir=path.parent))
+        for name, blob in goals.items():
+            (staging / name).mkdir()
+            source = self.root / "blobs" / f"{blob}.json"
+            try:
+                os.link(source, staging / name / "goal.json")
+            except OSError:
+                shutil.copyfile(source, staging / name / "goal.json")
+        try:
+            os.rename(staging, path)
+        except OSError:
+            # Another run built the same tree first; its contents are identical.
+            shutil.rmtree(staging, ignore_errors=True)
+            if not path.is_dir():
+                raise
+        return path
+
+    def save(self) -> None:
+        """Persist the index, then drop the oldest index entries, unreferenced blobs and trees beyond the caps."""
+        if len(self.entries) > BRIDGE_CACHE_MAX_ENTRIES:
+            newest = sorted(self.entries.items(), key=lambda item: item[1][1], reverse=True)[:BRIDGE_CACHE_MAX_ENTRIES]
+            self.entries = dict(newest)
+            referenced = {f"{blob}.json" for blob, _ in self.entries.values()}
+            for blob_path in (self.root / "blobs").iterdir():
+                if blob_path.name not in referenced:
+                    blob_path.unlink(missing_ok=True)
+        self.root.mkdir(parents=True, exist_ok=True)
+        payload = {"entries": self.entries, "generator": bridge_generator_fingerprint(), "version": BRIDGE_CACHE_FORMAT}
+        _write_atomic(self.root / "index.json", json.dumps(payload, sort_keys=True).encode("utf-8"))
+        trees_dir = self.root / "trees"
+        if trees_dir.is_dir():
+            trees = sorted((path for path in trees_dir.iterdir() if not path.name.startswith(".")), key=lambda path: path.stat().st_mtime, reverse=True)
+            for stale in trees[BRIDGE_CACHE_MAX_TREES:]:
+                shutil.rmtree(stale, ignore_errors=True)
+
+
+def engine_identity(engine_root: pathlib.Path, python_bin: str) -> dict[str, Any]:
+    """Identify the engine behind an acceptance run: checkout path, interpreter, git HEAD and uncommitted diff."""
+    root = engine_root.resolve()
+    identity: dict[str, Any] = {"engine_root": root.as_posix(), "python": python_bin, "git_head": None, "git_diff_sha256": None}
+    try:
+        head = subprocess.run(["git", "rev-parse", "HEAD"], cwd=root, capture_output=True, text=True, check=True).stdout.strip()
+        diff = subprocess.run(["git", "diff", "HEAD", "--binary", "--", "."], cwd=root, capture_output=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return identity
+    identity.update(git_head=head, git_diff_sha256=hashlib.sha256(diff).hexdigest())
+    return identity
+
+
+def _load_bridge_run(actual_root: pathlib.Path, current: dict[str, Any]) -> dict[str, Any] | None:
+    """Return the run recorded in ``actual_root`` when it used the same engine, policy pack and profile."""
+    try:
+        prior = json.loads((actual_root / BRIDGE_RUN_MANIFEST).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(prior, dict) or not (actual_root / "report.json").exists():
+        return None
+    if any(prior.get(field) != current[field] for field in ("format", "engine", "policy_pack", "profile_id")):
+        return None
+    return prior
+
+
+def merge_acceptance_run(actual_root: pathlib.Path, partial_root: pathlib.Path | None, fixtures: Iterable[str], rerun: Iterable[str]) -> None:
+    """Fold a subset acceptance run in ``partial_root`` into the full run in ``actual_root``.
+
+    Output directories of re-run fixtures replace the old ones. ``report.json`` keeps the full
+    run's top-level fields; only its ``fixtures`` rows are rewritten, taking the subset run's rows
+    for re-run fixtures and dropping rows for fixtures no longer in ``fixtures``.
+    """
+    rerun = set(rerun)
+    report = json.loads((actual_root / "report.json").read_text(encoding="utf-8"))
+    rows = {row.get("fixture"): row for row in report.get("fixtures", []) if isinstance(row, dict) and row.get("fixture") not in rerun}
+    if partial_root is not None:
+        partial_report = json.loads((partial_root / "report.json").read_text(encoding="utf-8"))
+        rows.update({row.get("fixture"): row for row in partial_report.get("fixtures", []) if isinstance(row, dict)})
+        for name in rerun:
+            if (partial_root / name).is_dir():
+                shutil.rmtree(actual_root / name, ignore_errors=True)
+                os.replace(partial_root / name, actual_root / name)
+    merged = dict(report, fixtures=[rows[name] for name in fixtures if name in rows])
+    _write_atomic(actual_root / "report.json", (json.dumps(merged, indent=2) + "\n").encode("utf-8"))
+
+
+def _accept_bridge_goals(
+    engine_root: pathlib.Path,
+    bridge_cache: BridgeCache,
+    goals: dict[str, str],
+    actual_root: pathlib.Path,
+    policy_pack: str,
+    profile_id: str | None,
+    python_bin: str,
+    *,
+    incremental: bool,
+    log_dir: pathlib.Path | None = None,
+) -> int:
+    # The record is only kept for --incremental or --bridge-cache runs that may reuse it, because
+    # identifying the engine shells out to git.
+    current = None
+    if incremental or bridge_cache.persistent:
+        current = {
+            "format": BRIDGE_RUN_FORMAT,
+            "engine": engine_identity(engine_root, python_bin),
+            "policy_pack": policy_pack,
+            "profile_id": _effective_profile(profile_id),
+            "goals": goals,
+        }
+    prior = _load_bridge_run(actual_root, current) if incremental and current is not None else None
+    actual_root.mkdir(parents=True, exist_ok=True)
+    # The record is only rewritten after a successful run, so a failed run is never reused.
+    (actual_root / BRIDGE_RUN_MANIFEST).unlink(missing_ok=True)
+    if prior is None:
+        _run_engine_accept(engine_root, bridge_cache.tree(goals), actual_root, profile_id, python_bin, log_dir)
+        rerun = len(goals)
+    else:
+        changed = {name: blob for name, blob in goals.items() if prior["goals"].get(name) != blob or not (actual_root / name).is_dir()}
+        for name in prior["goals"].keys() - goals.keys():
+            shutil.rmtree(actual_root / name, ignore_errors=True)
+        if changed:
+            partial_root = pathlib.Path(tempfile.mkdtemp(prefix=".partial-", dir=actual_root))
+            try:
+                _run_engine_accept(engine_root, bridge_cache.tree(changed), partial_root, profile_id, python_bin, log_dir)
+                merge_acceptance_run(actual_root, partial_root, goals, changed)
+            finally:
+                shutil.rmtree(partial_root, ignore_errors=True)
+        else:
+            merge_acceptance_run(actual_root, None, goals, ())
+        rerun = len(changed)
+    if current is not None:
+        _write_atomic(actual_root / BRIDGE_RUN_MANIFEST, (json.dumps(current, indent=2, sort_keys=True) + "\n").encode("utf-8"))
+    return rerun
+
+
+def run_engine_acceptance(
+    engine_root: pathlib.Path,
+    expected_root: pathlib.Path,
+    actual_root: pathlib.Path,
+    policy_pack: str,
+    profile_id: str | None,
+    python_bin: str,
+    *,
+    bridge_cache: BridgeCache | None = None,
+    incremental: bool = False,
+) -> int:
+    """Run ``accept`` over the bridge goals of every fixture; return how many fixtures the engine ran.
+
+    With ``incremental``, a prior run recorded in ``actual_root`` by the same engine, policy pack
+    and profile is reused: only fixtures whose bridge goal changed (or whose outputs are missing)
+    are sent to the engine, and their outputs are merged into the prior run. Without
+    ``bridge_cache`` the goals are generated into a temporary directory, and unless
+    ``incremental`` is set no ``bridge-run.json`` record is written.
+    """
+    _check_engine_root(engine_root)
+    if bridge_cache is None:
+        with tempfile.TemporaryDirectory(prefix="blux-ca-bridge-fixtures-") as bridge_tmp:
+            return run_engine_acceptance(engine_root, expected_root, actual_root, policy_pack, profile_id, python_bin, bridge_cache=BridgeCache(pathlib.Path(bridge_tmp), persistent=False), incremental=incremental)
+    goals = bridge_cache.goals(expected_root, policy_pack)
+    return _accept_bridge_goals(engine_root, bridge_cache, goals, actual_root, policy_pack, profile_id, python_bin, incremental=incremental)
+
+
+def discover_engine_matrix(expected_root: pathlib.Path, model_version: str) -> list[tuple[str, str | None]]:
+    """Return every (policy pack, profile) pair spanned by the non-archive bundles under ``expected_root``.
+
+    Packs and profiles are crossed, so a pack that only ships default bundles is still run
+    under each profile; the session's profile and cA-pro fallbacks pick its expected bundle.
+    """
+    packs: set[str] = set()
+    profiles: set[str | None] = {None}
+    for fixture_dir in fixture_dirs(expected_root):
+        for bundle in iter_expected_bundles(fixture_dir, model_version):
+            if bundle.archive_version is None:
+                packs.add(bundle.policy_pack_id)
+                profiles.add(bundle.profile_id)
+    ordered_profiles = sorted(profiles, key=lambda profile: (profile is not None, profile or ""))
+    return [(pack, profile) for pack in sorted(packs) for profile in ordered_profiles]
+
+
+@dataclass
+class MatrixCell:
+    policy_pack: str
+    profile_id: str | None
+    actual_root: pathlib.Path
+    seconds: float = 0.0
+    engine_runs: int = 0
+    failures: list[str] = field(default_factory=list)
+
+    @property
+    def label(self) -> str:
+        return f"{self.policy_pack}/{self.profile_id or 'default'}"
+
+
+def run_engine_matrix(
+    engine_root: pathlib.Path,
+    expected_root: pathlib.Path,
+    actual_root: pathlib.Path,
+    model_version: str,
+    combinations: list[tuple[str, str | None]],
+    python_bin: str,
+    jobs: int,
+    *,
+    bridge_cache: BridgeCache | None = None,
+    incremental: bool = False,
+) -> list[MatrixCell]:
+    """Run one acceptance per (policy pack, profile) concurrently and verify each against its own output dir.
+
+    Bridge goals depend only on the policy pack, so they are resolved once per pack and shared
+    by that pack's profile runs (and by other packs with identical goals). Each cell writes to
+    ``<actual_root>/<pack>/<profile>`` with the engine's stdout/stderr in ``_engine_logs/``; at
+    most ``jobs`` engines run at once. ``incremental`` applies per cell as in
+    ``run_engine_acceptance``.
+    """
+    _check_engine_root(engine_root)
+    if bridge_cache is None:
+        with tempfile.TemporaryDirectory(prefix="blux-ca-bridge-fixtures-") as bridge_tmp:
+            return run_engine_matrix(engine_root, expected_root, actual_root, model_version, combinations, python_bin, jobs, bridge_cache=BridgeCache(pathlib.Path(bridge_tmp), persistent=False), incremental=incremental)
+    names = [fixture_dir.name for fixture_dir in fixture_dirs(expected_root)]
+    cells = [MatrixCell(pack, profile, actual_root / pack / (_effective_profile(profile) or "default")) for pack, profile in combinations]
+    pack_goals = {pack: bridge_cache.goals(expected_root, pack) for pack in dict.fromkeys(cell.policy_pack for cell in cells)}
+    # Build each distinct tree up front so concurrent cells only read the cache.
+    for goals in pack_goals.values():
+        bridge_cache.tree(goals)
+
+    def run(cell: MatrixCell) -> None:
+        started = time.perf_counter()
+        log_dir = cell.actual_root / "_engine_logs"
+        try:
+            cell.engine_runs = _accept_bridge_goals(engine_root, bridge_cache, pack_goals[cell.policy_pack], cell.actual_root, cell.policy_pack, cell.profile_id, python_bin, incremental=incremental, log_dir=log_dir)
+        except (OSError, subprocess.CalledProcessError) as exc:
+            tail = (log_dir / "accept.stderr.log").read_text(encoding="utf-8", errors="replace").strip().splitlines()[-5:] if (log_dir / "accept.stderr.log").exists() else []
+            detail = f"; stderr tail: {' | '.join(tail)}" if tail else ""
+            cell.failures.append(f"Local blux-ca acceptance command failed: {exc} (logs: {log_dir}){detail}")
+        else:
+            session = EngineVerificationSession(expected_root, cell.actual_root, model_version, cell.policy_pack, cell.profile_id)
+            cell.failures.extend(session.verify_all(names))
+        cell.seconds = time.perf_counter() - started
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        list(executor.map(run, cells))
+    return cells
+
+
+def format_matrix_table(cells: list[MatrixCell]) -> str:
+    header = ("Policy pack", "Profile", "Result", "Failures", "Seconds")
+    rows = [
+        (cell.policy_pack, cell.profile_id or "default", "FAIL" if cell.failures else "PASS", str(len(cell.failures)), f"{cell.seconds:.2f}")
+        for cell in cells
+    ]
+    widths = [max(len(row[column]) for row in (header, *rows)) for column in range(len(header))]
+    return "\n".join("  ".join(value.ljust(width) for value, width in zip(row, widths)).rstrip() for row in (header, *rows))
+
+
+class EngineVerificationSession:
+    """Evaluate engine-root fixtures against one acceptance run, loading and indexing shared inputs once.
+
+    The acceptance ``report.json`` is decoded once and its rows are indexed by fixture name, so
+    each fixture check is a dictionary lookup plus its own artifact/verdict reads instead of a
+    re-parse of the whole report.
+    """
+
+    def __init__(self, expected_root: pathlib.Path, actual_root: pathlib.Path, model_version: str, policy_pack: str, profile_id: str | None) -> None:
+        self.expected_root = expected_root
+        self.actual_root = actual_root
+        self.model_version = model_version
+        self.policy_pack = policy_pack
+        self.profile_id = profile_id
+        self.expected_profile = _effective_profile(profile_id)
+        self.report_path = actual_root / "report.json"
+        self.report: dict[str, Any] | None = load_json(self.report_path) if self.report_path.exists() else None
+        self.rows: dict[Any, dict[str, Any]] = {}
+        self.report_errors: list[str] = []
+        if self.report is not None:
+            self.rows = {row.get("fixture"): row for row in self.report.get("fixtures", []) if isinstance(row, dict)}
+            if self.expected_profile:
+                if not _report_profile_is_expected(self.report, self.expected_profile):
+                    self.report_errors.append(
+                        f"Acceptance report profile mismatch: expected {self.expected_profile}, got {self.report.get('profile_id')}"
+                    )
+            elif not _report_profile_is_expected(self.report, None):
+                self.report_errors.append(
+                    f"Acceptance report profile mismatch without --profile: expected omitted/default, got {self.report.get('profile_id')}"
+                )
+
+    def expected_bundle(self, name: str) -> tuple[pathlib.Path, pathlib.Path] | None:
+        """Return (expected_artifact, expected_verdict) for ``name``, falling back to the cA-pro bundle."""
+        expected_root, model_version, policy_pack, profile_id = self.expected_root, self.model_version, self.policy_pack, self.profile_id
+        expected_base = expected_dir(expected_root, name, model_version, policy_pack, profile_id=profile_id)
+        if profile_id and not path_exists(expected_base):
+            expected_base = expected_dir(expected_root, name, model_version, policy_pack)
         expected_verdict_path = expected_base / "expected_verdict.json"
         expected_artifact_path = expected_base / "expected_artifact.json"
-    if not expected_verdict_path.exists() or not expected_artifact_path.exists():
-        return [f"Missing expected engine-bridge bundle for fixture '{name}'"]
-
-    report_path = actual_root / "report.json"
-    if not report_path.exists():
-        return [f"Missing actual acceptance report {report_path}"]
-    report = load_json(report_path)
-    rows = {row.get("fixture"): row for row in report.get("fixtures", []) if isinstance(row, dict)}
-    row = rows.get(name)
-    if row is None:
-        return [f"Missing acceptance report row for fixture '{name}'"]
-
-    expected_verdict = load_json(expected_verdict_path)
-    expected_artifact = load_json(expected_artifact_path)
-    actual_artifact_path = actual_root / name / "artifact.json"
-    actual_verdict_path = actual_root / name / "verdict.json"
-    if not actual_artifact_path.exists() or not actual_verdict_path.exists():
-        return [f"Missing actual artifact/verdict files for fixture '{name}'"]
-    actual_artifact = load_json(actual_artifact_path)
-    actual_verdict = load_json(actual_verdict_path)
-
-    expected_outcome = str(expected_verdict.get("outcome", "")).lower()
-    actual_outcome = str(row.get("status", "")).lower()
-    if actual_outcome != expected_outcome:
-        errors.append(f"Outcome mismatch for fixture '{name}': expected {expected_outcome}, got {actual_outcome}")
-
-    expected_request = expected_verdict.get("request") or {}
-    expected_pack = expected_request.get("policy_pack_id")
-    if row.get("policy_pack_id") != expected_pack:
-        errors.append(f"Policy pack mismatch for fixture '{name}': expected {expected_pack}, got {row.get('policy_pack_id')}")
-    if actual_artifact.get("policy_pack_id") != expected_pack or actual_verdict.get("policy_pack_id") != expected_pack:
-        errors.append(f"Raw engine policy pack mismatch for fixture '{name}'")
-
-    expected_profile = _effective_profile(profile_id)
-    if expected_profile:
-        if not _report_profile_is_expected(report, expected_profile):
-            errors.append(f"Acceptance report profile mismatch: expected {expected_profile}, got {report.get('profile_id')}")
-        if actual_artifact.get("run", {}).get("profile_id") != expected_profile:
-            errors.append(f"Artifact run.profile_id mismatch for fixture '{name}'")
-        if actual_verdict.get("run", {}).get("profile_id") != expected_profile:
-            errors.append(f"Verdict run.profile_id mismatch for fixture '{name}'")
-    else:
-        if not _report_profile_is_expected(report, None):
-            errors.append(
-                f"Acceptance report profile mismatch without --profile: expected omitted/default, got {report.get('profile_id')}"
-            )
+        if (not path_exists(expected_verdict_path) or not path_exists(expected_artifact_path)) and policy_pack != "cA-pro":
+            fallback_base = expected_dir(expected_root, name, model_version, "cA-pro", profile_id=profile_id)
+            if profile_id and not path_exists(fallback_base):
+                fallback_base = expected_dir(expected_root, name, model_version, "cA-pro")
+            expected_verdict_path = fallback_base / "expected_verdict.json"
+            expected_artifact_path = fallback_base / "expected_artifact.json"
+        if not path_exists(expected_verdict_path) or not path_exists(expected_artifact_path):
+            return None
+        return expected_artifact_path, expected_verdict_path
 
-    if actual_artifact.get("model_version") != "cA-1.0-pro":
-        errors.append(f"Artifact model_version mismatch for fixture '{name}'")
-    if actual_verdict.get("model_version") != "cA-1.0-pro":
-        errors.append(f"Verdict model_version mismatch for fixture '{name}'")
-    if expected_artifact.get("request", {}).get("policy_pack_version") != row.get("policy_pack_version"):
-        errors.append(f"Policy pack version mismatch for fixture '{name}'")
-    return errors
+    def verify(self, name: str) -> list[str]:
+        errors: list[str] = []
+        expected_paths = self.expected_bundle(name)
+        if expected_paths is None:
+            return [f"Missing expected engine-bridge bundle for fixture '{name}'"]
+        if self.report is None:
+            return [f"Missing actual acceptance report {self.report_path}"]
+        row = self.rows.get(name)
+        if row is None:
+            return [f"Missing acceptance report row for fixture '{name}'"]
 
+        expected_artifact_path, expected_verdict_path = expected_paths
+        expected_verdict = load_json(expected_verdict_path)
+        expected_artifact = load_json(expected_artifact_path)
+        actual_artifact_path = self.actual_root / name / "artifact.json"
+        actual_verdict_path = self.actual_root / name / "verdict.json"
+        if not actual_artifact_path.exists() or not actual_verdict_path.exists():
+            return [f"Missing actual artifact/verdict files for fixture '{name}'"]
+        actual_artifact = load_json(actual_artifact_path)
+        actual_verdict = load_json(actual_verdict_path)
 
-def main() -> int:
-    parser = argparse.ArgumentParser(description="Compare actual blux-ca outputs to expected fixture artifacts/verdicts.")
+        expected_outcome = str(expected_verdict.get("outcome", "")).lower()
+        actual_outcome = str(row.get("status", "")).lower()
+        if actual_outcome != expected_outcome:
+            errors.append(f"Outcome mismatch for fixture '{name}': expected {expected_outcome}, got {actual_outcome}")
+
+        expected_request = expected_verdict.get("request") or {}
+        expected_pack = expected_request.get("policy_pack_id")
+        if row.get("policy_pack_id") != expected_pack:
+            errors.append(f"Policy pack mismatch for fixture '{name}': expected {expected_pack}, got {row.get('policy_pack_id')}")
+        if actual_artifact.get("policy_pack_id") != expected_pack or actual_verdict.get("policy_pack_id") != expected_pack:
+            errors.append(f"Raw engine policy pack mismatch for fixture '{name}'")
+
+        errors.extend(self.report_errors)
+        if self.expected_profile:
+            if actual_artifact.get("run", {}).get("profile_id") != self.expected_profile:
+                errors.append(f"Artifact run.profile_id mismatch for fixture '{name}'")
+            if actual_verdict.get("run", {}).get("profile_id") != self.expected_profile:
+                errors.append(f"Verdict run.profile_id mismatch for fixture '{name}'")
+
+        if actual_artifact.get("model_version") != "cA-1.0-pro":
+            errors.append(f"Artifact model_version mismatch for fixture '{name}'")
+        if actual_verdict.get("model_version") != "cA-1.0-pro":
+            errors.append(f"Verdict model_version mismatch for fixture '{name}'")
+        if expected_artifact.get("request", {}).get("policy_pack_version") != row.get("policy_pack_version"):
+            errors.append(f"Policy pack version mismatch for fixture '{name}'")
+        return errors
+
+    def verify_all(self, names: list[str], jobs: int = 1) -> list[str]:
+        """Verify ``names`` in order; with ``jobs > 1`` each worker process builds its own session once."""
+        failures: list[str] = []
+        if jobs <= 1 or len(names) <= 1:
+            for name in names:
+                with TIMINGS.fixture(name):
+                    failures.extend(self.verify(name))
+            return failures
+        from concurrent.futures import ProcessPoolExecutor
+
+        workers = min(jobs, len(names))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_engine_session,
+            initargs=(TIMINGS.enabled, self.expected_root, self.actual_root, self.model_version, self.policy_pack, self.profile_id),
+        ) as executor:
+            for errors, timings in executor.map(_verify_in_engine_session, names, chunksize=max(1, len(names) // (workers * 4))):
+                failures.extend(errors)
+                TIMINGS.merge(timings)
+        return failures
+
+
+_ENGINE_SESSION: EngineVerificationSession | None = None
+
+
+def _init_engine_session(timings_enabled: bool, *args: Any) -> None:
+    global _ENGINE_SESSION
+    init_worker_timings(timings_enabled)
+    _ENGINE_SESSION = EngineVerificationSession(*args)
+
+
+def _verify_in_engine_session(name: str) -> tuple[list[str], dict[str, Any] | None]:
+    assert _ENGINE_SESSION is not None
+    with TIMINGS.fixture(name):
+        errors = _ENGINE_SESSION.verify(name)
+    return errors, TIMINGS.drain()
+
+
+def compare_engine_verification(name: str, expected_root: pathlib.Path, actual_root: pathlib.Path, model_version: str, policy_pack: str, profile_id: str | None) -> list[str]:
+    """Verify a single fixture; prefer one ``EngineVerificationSession`` when checking many."""
+    return EngineVerificationSession(expected_root, actual_root, model_version, policy_pack, profile_id).verify(name)
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("--expected-root", default="fixtures", help="Path to fixtures directory containing expected outputs.")
     parser.add_argument("--actual-root", default=None, help="Path containing actual outputs. Each fixture should have artifact.json + verdict.json.")
     parser.add_argument("--model-version", default=None, help="Model version to compare against (defaults to DATASET_VERSION when present).")
@@ -319,10 +1127,32 @@ def main() -> int:
     parser.add_argument("--engine-root", default=os.environ.get("BLUX_CA_ENGINE_ROOT"), help="Path to a real local blux-ca checkout. Uses the supported CLI: python -m blux_ca accept --fixtures <generated-bridge-dir> --out <actual-root> [--profile <id>].")
     parser.add_argument("--engine-python", default=sys.executable, help="Python interpreter to use with --engine-root (default: current interpreter).")
     parser.add_argument("--engine-cmd", default=os.environ.get("BLUX_CA_ENGINE_CMD"), help="Optional custom command template for dataset-format outputs. Available placeholders: {fixture} {goal} {out_dir} {model_version} {policy_pack} {profile}.")
+    parser.add_argument("--engine-worker", default=os.environ.get("BLUX_CA_ENGINE_WORKER"), help="Command that starts a long-lived engine worker fed one fixture per line of JSON on stdin (see docs/VERIFICATION.md); it is started once instead of once per fixture, and --jobs N starts N workers.")
+    parser.add_argument("--worker-timeout", type=float, default=ENGINE_WORKER_TIMEOUT, help="Seconds to wait for an --engine-worker handshake or response before killing and restarting it (default: %(default)g).")
+    parser.add_argument("--jobs", type=int, default=1, help="Parallelism (0 uses all CPUs): run --engine-cmd (or --engine-worker processes) for up to N fixtures concurrently, writing engine output to per-fixture log files and running every fixture even if some fail; with --engine-root, verify fixtures across N worker processes.")
+    parser.add_argument("--matrix", action="store_true", help="With --engine-root, run every policy pack x profile combination found under --expected-root concurrently (ignoring --policy-pack/--profile) and print one pass/fail table; outputs go to <actual-root>/<pack>/<profile>.")
+    parser.add_argument("--matrix-jobs", type=int, default=0, help="Maximum concurrent acceptance runs with --matrix (default: one per combination, capped at the CPU count).")
+    parser.add_argument("--bridge-cache", nargs="?", const=BRIDGE_CACHE_PATH, default=None, metavar="PATH", help="Keep --engine-root bridge goals in a content-addressed cache reused across runs and policy packs (PATH defaults to BLUX_DATASET_BRIDGE_CACHE or .cache/bridge in the repository root).")
+    parser.add_argument("--no-bridge-cache", action="store_true", help="Generate --engine-root bridge goals into a temporary directory, even with --bridge-cache.")
+    parser.add_argument("--incremental", action="store_true", help="With --engine-root and --actual-root, reuse the acceptance run already in --actual-root when it came from the same engine checkout, policy pack and profile, and send only fixtures whose bridge goal changed to the engine.")
+    parser.add_argument("--engine-log-dir", default=None, help="Directory for per-fixture engine logs with --jobs (defaults to <actual-root>/_engine_logs).")
     parser.add_argument("--include-archives", action="store_true", help="Also compare archived outputs stored under fixtures/<case>/archives. Only supported with --actual-root or --engine-cmd dataset-format outputs.")
     parser.add_argument("--archive-versions", default="cA-0.4,cA-0.5,cA-0.6,cA-0.7,cA-0.8,cA-0.9,cA-1.0", help="Comma-separated archived versions to compare when --include-archives is set.")
     parser.add_argument("--archive-actual-root", default=None, help="Root directory containing archived actual outputs (defaults to <actual-root>/archives).")
-    args = parser.parse_args()
+    parser.add_argument("--cache", action="store_true", help="Reuse and record cached passes of dataset-format comparisons (local iteration only).")
+    parser.add_argument("--cache-path", default=VERIFY_CACHE_PATH, help="Verification result cache used by --cache and --prune-cache (default: BLUX_DATASET_VERIFY_CACHE or .cache/verify_fixtures.json in the repository root).")
+    parser.add_argument("--cache-max-bytes", type=int, default=VERIFY_CACHE_MAX_BYTES, help="Evict least recently used cache entries beyond this serialized size.")
+    parser.add_argument("--prune-cache", action="store_true", help="Evict verification cache entries down to --cache-max-bytes and exit.")
+    parser.add_argument("--timings", nargs="?", const="-", default=None, help="Record per-phase and per-fixture timings and write a JSON summary to PATH (stderr when omitted); BLUX_DATASET_TIMINGS=PATH does the same.")
+
+
+def run(args: argparse.Namespace) -> int:
+    if args.prune_cache:
+        cache = VerificationCache(pathlib.Path(args.cache_path), args.cache_max_bytes)
+        dropped = cache.prune()
+        cache.save()
+        print(f"Verification cache {args.cache_path}: kept {len(cache.entries)} entries, evicted {dropped}.")
+        return 0
 
     expected_root = pathlib.Path(args.expected_root)
     model_version = args.model_version or read_dataset_version() or "cA-1.0-pro"
@@ -330,33 +1160,87 @@ def main() -> int:
     profile_id = args.profile
     archive_versions = [v.strip() for v in args.archive_versions.split(",") if v.strip()]
 
-    if not expected_root.exists():
+    if not path_exists(expected_root):
         raise SystemExit(f"Expected fixtures directory not found: {expected_root}")
-    if not any(expected_root.iterdir()):
+    if not fixture_dirs(expected_root):
         raise SystemExit("No fixtures found to verify.")
-    if args.engine_root and args.engine_cmd:
-        raise SystemExit("Use either --engine-root or --engine-cmd, not both.")
+    if args.jobs < 0:
+        raise SystemExit("--jobs must be >= 0")
+    if sum(1 for engine in (args.engine_root, args.engine_cmd, args.engine_worker) if engine) > 1:
+        raise SystemExit("Use only one of --engine-root, --engine-cmd and --engine-worker.")
+    if args.worker_timeout <= 0:
+        raise SystemExit("--worker-timeout must be > 0")
     if args.include_archives and args.engine_root:
         raise SystemExit("--include-archives is not supported with --engine-root because archived bundles target historical engine lines.")
+    if args.matrix and not args.engine_root:
+        raise SystemExit("--matrix requires --engine-root (or BLUX_CA_ENGINE_ROOT).")
+    if args.matrix_jobs < 0:
+        raise SystemExit("--matrix-jobs must be >= 0")
+    if args.incremental and not (args.engine_root and args.actual_root):
+        raise SystemExit("--incremental requires --engine-root and --actual-root.")
 
     temp_dir: tempfile.TemporaryDirectory[str] | None = None
     if args.actual_root:
         actual_root = pathlib.Path(args.actual_root)
-    elif args.engine_root or args.engine_cmd:
+    elif args.engine_root or args.engine_cmd or args.engine_worker:
         temp_dir = tempfile.TemporaryDirectory(prefix="blux-ca-runs-")
         actual_root = pathlib.Path(temp_dir.name)
     else:
         raise SystemExit(
-            "Either --actual-root, --engine-root/BLUX_CA_ENGINE_ROOT, or --engine-cmd/BLUX_CA_ENGINE_CMD is required."
+            "Either --actual-root, --engine-root/BLUX_CA_ENGINE_ROOT, --engine-cmd/BLUX_CA_ENGINE_CMD or --engine-worker/BLUX_CA_ENGINE_WORKER is required."
         )
 
+    bridge_cache = None if args.no_bridge_cache or not args.bridge_cache or not args.engine_root else BridgeCache(pathlib.Path(args.bridge_cache))
+    if args.matrix:
+        combinations = discover_engine_matrix(expected_root, model_version)
+        matrix_jobs = args.matrix_jobs or min(len(combinations), os.cpu_count() or 1)
+        with TIMINGS.phase("engine"):
+            cells = run_engine_matrix(pathlib.Path(args.engine_root), expected_root, actual_root, model_version, combinations, args.engine_python, matrix_jobs, bridge_cache=bridge_cache, incremental=args.incremental)
+        if temp_dir is not None:
+            temp_dir.cleanup()
+        bridge_note = ""
+        if bridge_cache is not None:
+            bridge_cache.save()
+            bridge_note = f"; bridge goals: {bridge_cache.generated} generated, {bridge_cache.reused} cached ({args.bridge_cache})"
+        print(f"Engine acceptance: ran {sum(cell.engine_runs for cell in cells)} of {len(cells) * len(fixture_dirs(expected_root))} fixture runs{bridge_note}.", file=sys.stderr)
+        for cell in cells:
+            for failure in cell.failures:
+                print(f"FAIL: [{cell.label}] {failure}")
+        print(format_matrix_table(cells))
+        failed = sum(1 for cell in cells if cell.failures)
+        if failed:
+            print(f"{failed} of {len(cells)} policy pack/profile combinations failed against local blux-ca checkout {args.engine_root}.")
+            return 1
+        print(f"All {len(cells)} policy pack/profile combinations match expected outputs against local blux-ca checkout {args.engine_root}.")
+        return 0
+
     verification_mode = "dataset-format"
     if args.engine_root:
         verification_mode = "engine-root"
         try:
-            run_engine_acceptance(pathlib.Path(args.engine_root), expected_root, actual_root, policy_pack, profile_id, args.engine_python)
+            with TIMINGS.phase("engine"):
+                engine_runs = run_engine_acceptance(pathlib.Path(args.engine_root), expected_root, actual_root, policy_pack, profile_id, args.engine_python, bridge_cache=bridge_cache, incremental=args.incremental)
         except subprocess.CalledProcessError as exc:
             raise SystemExit(f"Local blux-ca acceptance command failed: {exc}") from exc
+        finally:
+            if bridge_cache is not None:
+                bridge_cache.save()
+        bridge_note = f"; bridge goals: {bridge_cache.generated} generated, {bridge_cache.reused} cached ({args.bridge_cache})" if bridge_cache is not None else ""
+        print(f"Engine acceptance: ran {engine_runs} of {len(fixture_dirs(expected_root))} fixtures{bridge_note}.", file=sys.stderr)
+    engine_failures: dict[str, str] = {}
+    jobs = args.jobs or os.cpu_count() or 1
+    if args.engine_cmd and jobs > 1:
+        with TIMINGS.phase("engine"):
+            engine_failures = run_engine_commands(
+                args.engine_cmd,
+                fixture_dirs(expected_root),
+                actual_root,
+                pathlib.Path(args.engine_log_dir) if args.engine_log_dir else actual_root / "_engine_logs",
+                model_version=model_version,
+                policy_pack=policy_pack,
+                profile=_effective_profile(profile_id),
+                jobs=jobs,
+            )
     elif args.engine_cmd:
         for fixture_dir in fixture_dirs(expected_root):
             out_dir = actual_root / fixture_dir.name
@@ -364,27 +1248,53 @@ def main() -> int:
             cmd = render_engine_command(
                 args.engine_cmd,
                 fixture=fixture_dir.name,
-                goal=fixture_dir / "goal.json",
+                goal=engine_goal_path(fixture_dir, out_dir),
                 out_dir=out_dir,
                 model_version=model_version,
                 policy_pack=policy_pack,
                 profile=_effective_profile(profile_id),
             )
             try:
-                subprocess.run(cmd, check=True)
+                with TIMINGS.phase("engine"), TIMINGS.fixture(fixture_dir.name):
+                    subprocess.run(cmd, check=True)
             except subprocess.CalledProcessError as exc:
                 raise SystemExit(f"Local blux-ca engine command failed: {exc}") from exc
+    elif args.engine_worker:
+        with TIMINGS.phase("engine"):
+            engine_failures, started = run_engine_workers(
+                shlex.split(args.engine_worker),
+                fixture_dirs(expected_root),
+                actual_root,
+                pathlib.Path(args.engine_log_dir) if args.engine_log_dir else actual_root / "_engine_logs",
+                model_version=model_version,
+                policy_pack=policy_pack,
+                profile=_effective_profile(profile_id),
+                jobs=jobs,
+                timeout=args.worker_timeout,
+            )
+        print(f"Engine workers: {started} processes started for {len(fixture_dirs(expected_root))} fixtures.", file=sys.stderr)
 
     archive_actual_root = pathlib.Path(args.archive_actual_root) if args.archive_actual_root else None
     failures: list[str] = []
-    for fixture_dir in fixture_dirs(expected_root):
-        if verification_mode == "engine-root":
-            failures.extend(compare_engine_verification(fixture_dir.name, expected_root, actual_root, model_version=model_version, policy_pack=policy_pack, profile_id=profile_id))
-        else:
-            failures.extend(compare_fixture(fixture_dir.name, expected_root, actual_root, model_version=model_version, policy_pack=policy_pack, profile_id=profile_id))
-            if args.include_archives:
-                archive_root = archive_actual_root or actual_root / "archives"
-                failures.extend(compare_archives(fixture_dir.name, expected_root, archive_root, policy_pack=policy_pack, versions=archive_versions))
+    cache: VerificationCache | None = None
+    if verification_mode == "engine-root":
+        session = EngineVerificationSession(expected_root, actual_root, model_version, policy_pack, profile_id)
+        failures.extend(session.verify_all([fixture_dir.name for fixture_dir in fixture_dirs(expected_root)], jobs))
+    else:
+        if args.cache:
+            cache = VerificationCache(pathlib.Path(args.cache_path), args.cache_max_bytes)
+        for fixture_dir in fixture_dirs(expected_root):
+            if fixture_dir.name in engine_failures:
+                failures.append(engine_failures[fixture_dir.name])
+                continue
+            with TIMINGS.fixture(fixture_dir.name):
+                failures.extend(compare_fixture(fixture_dir.name, expected_root, actual_root, model_version=model_version, policy_pack=policy_pack, profile_id=profile_id, cache=cache))
+                if args.include_archives:
+                    archive_root = archive_actual_root or actual_root / "archives"
+                    failures.extend(compare_archives(fixture_dir.name, expected_root, archive_root, policy_pack=policy_pack, versions=archive_versions, cache=cache))
+        if cache is not None:
+            cache.save()
+            print(f"Verification cache: {cache.hits} cached passes, {cache.misses} compared ({args.cache_path}).", file=sys.stderr)
 
     if temp_dir is not None:
         temp_dir.cleanup()
@@ -396,11 +1306,23 @@ def main() -> int:
 
     if verification_mode == "engine-root":
         source = f"local blux-ca checkout {args.engine_root}"
+    elif args.engine_worker:
+        source = "local blux-ca engine worker"
     else:
         source = "local blux-ca engine command" if args.engine_cmd else f"actual root {actual_root}"
     print(f"All fixtures match expected outputs against {source}.")
     return 0
 
 
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare actual blux-ca outputs to expected fixture artifacts/verdicts.")
+    add_arguments(parser)
+    args = parser.parse_args()
+    timings_destination = configure_timings(args.timings)
+    status = run(args)
+    emit_timings(timings_destination, "verify_fixtures")
+    return status
+
+
 if __name__ == "__main__":
     sys.exit(main())
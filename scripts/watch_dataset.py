@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""Poll the fixture tree and incrementally re-validate and re-export BLUX cA fixtures on change."""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import pathlib
+import sys
+import time
+from collections import Counter
+from typing import Any
+
+from dataset_common import DATASET_MAPPING_PATH, DATASET_VERSION_PATH, FIXTURE_ROOT, fixture_dirs, iter_expected_bundles, layout_index, read_mapping
+from export_jsonl import CANONICAL_EXPORT_PATH, atomic_output, encode_bundle, sort_key
+from validate_dataset import coverage_gaps, validate_fixture
+
+
+class DatasetWatcher:
+    """Resident validation results, coverage and export rows, refreshed per changed fixture.
+
+    Per-fixture errors, coverage counters and encoded export rows are kept in memory. A poll maps
+    changed paths under ``fixtures/`` to fixture names and rebuilds only those fixtures; a change
+    to ``DATASET_VERSION`` or the mapping lock rebuilds everything. The export is re-assembled
+    from the resident rows in the same order as ``export_rows()``, so its bytes match a cold run.
+    A fixture that cannot be read (for example a half-saved JSON file) is reported as failing and
+    retried on its next change; the export is left as it was until every fixture reads again.
+    """
+
+    def __init__(self, *, include_archives: bool, export: bool, check_schemas: bool) -> None:
+        self.include_archives = include_archives
+        self.export = export
+        self.check_schemas = check_schemas
+        self.layout = layout_index(FIXTURE_ROOT)
+        self.mapping: dict[str, Any] = {}
+        self.inputs_signature: tuple[tuple[int, int], ...] | None = None
+        self.errors: dict[str, list[str]] = {}
+        self.coverage: dict[str, Counter[str]] = {}
+        self.total_coverage: Counter[str] = Counter()
+        self.rows: dict[str, list[tuple[tuple[str, int, str, str, str], bytes]]] = {}
+        self.unreadable: set[str] = set()
+        self.export_sha256: str | None = None
+
+    def _inputs_signature(self) -> tuple[tuple[int, int], ...]:
+        signature = []
+        for path in (DATASET_VERSION_PATH, DATASET_MAPPING_PATH):
+            stat = path.stat()
+            signature.append((stat.st_size, stat.st_mtime_ns))
+        return tuple(signature)
+
+    def _forget(self, name: str) -> None:
+        self.total_coverage.subtract(self.coverage.pop(name, Counter()))
+        self.errors.pop(name, None)
+        self.rows.pop(name, None)
+        self.unreadable.discard(name)
+
+    def _rebuild(self, fixture_dir: pathlib.Path) -> None:
+        name = fixture_dir.name
+        self._forget(name)
+        coverage: Counter[str] = Counter()
+        try:
+            errors = validate_fixture(fixture_dir, self.mapping, coverage, check_schemas=self.check_schemas)
+            rows = self._encode_rows(fixture_dir) if self.export else []
+        except (SystemExit, OSError) as exc:
+            # load_json() reports undecodable files as SystemExit; keep watching instead of exiting.
+            self.errors[name] = [f"Unreadable fixture {name}: {exc}"]
+            self.unreadable.add(name)
+            return
+        self.errors[name] = errors
+        self.coverage[name] = coverage
+        self.total_coverage.update(coverage)
+        if self.export:
+            self.rows[name] = rows
+
+    def _encode_rows(self, fixture_dir: pathlib.Path) -> list[tuple[tuple[str, int, str, str, str], bytes]]:
+        rows = []
+        for bundle in iter_expected_bundles(fixture_dir, self.mapping["dataset_version"]):
+            if bundle.archive_version is not None and not self.include_archives:
+                continue
+            row, line = encode_bundle(bundle, self.mapping)
+            rows.append((sort_key(row), line))
+        return rows
+
+    def refresh(self, *, full: bool = False) -> list[str] | None:
+        """Apply changes since the last call; return the rebuilt fixture names, or None when nothing changed."""
+        changed = self.layout.poll()
+        inputs_signature = self._inputs_signature()
+        if inputs_signature != self.inputs_signature:
+            self.inputs_signature = inputs_signature
+            self.mapping = read_mapping()
+            full = True
+        if not full and not changed:
+            return None
+
+        current = {fixture_dir.name: fixture_dir for fixture_dir in fixture_dirs()}
+        if full:
+            names = sorted(current)
+            for name in set(self.errors) - set(current):
+                self._forget(name)
+        else:
+            names = sorted({path.split("/", 1)[0] for path in changed})
+        for name in names:
+            if name in current:
+                self._rebuild(current[name])
+            else:
+                self._forget(name)
+        if self.export and not self.unreadable:
+            self._write_export()
+        return names
+
+    def _write_export(self) -> None:
+        # Fixture order then stable sort by row key, exactly as export_rows() orders a cold export.
+        rows = [item for name in sorted(self.rows) for item in self.rows[name]]
+        rows.sort(key=lambda item: item[0])
+        hasher = hashlib.sha256()
+        CANONICAL_EXPORT_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with atomic_output(CANONICAL_EXPORT_PATH) as handle:
+            for _, line in rows:
+                handle.write(line)
+                hasher.update(line)
+        self.export_sha256 = hasher.hexdigest()
+
+    def failures(self) -> list[str]:
+        failures = [error for name in sorted(self.errors) for error in self.errors[name]]
+        return failures + coverage_gaps(self.total_coverage)
+
+    def row_count(self) -> int:
+        return sum(len(rows) for rows in self.rows.values())
+
+
+def report(watcher: DatasetWatcher, names: list[str], seconds: float, write_sha256: bool) -> None:
+    failures = watcher.failures()
+    stamp = time.strftime("%H:%M:%S")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    status = f"{len(failures)} failure(s)" if failures else "validated"
+    line = f"[{stamp}] {len(names)} fixture(s) refreshed in {seconds:.3f}s; {status}"
+    if watcher.export and watcher.unreadable:
+        line += f"; export not refreshed while {len(watcher.unreadable)} fixture(s) are unreadable"
+    elif watcher.export_sha256 is not None:
+        line += f"; exported {watcher.row_count()} rows sha256={watcher.export_sha256}"
+        if write_sha256:
+            CANONICAL_EXPORT_PATH.with_suffix(CANONICAL_EXPORT_PATH.suffix + ".sha256").write_text(
+                f"{watcher.export_sha256}  {CANONICAL_EXPORT_PATH.name}\n", encoding="utf-8"
+            )
+    print(line, flush=True)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Watch fixtures/ and incrementally re-validate and re-export on change.")
+    parser.add_argument("--interval", type=float, default=0.5, help="Seconds between polls (default: 0.5).")
+    parser.add_argument("--include-archives", action="store_true", help="Include archived compatibility examples in the export.")
+    parser.add_argument("--write-sha256", action="store_true", help="Rewrite the sibling .sha256 file after each export.")
+    parser.add_argument("--no-export", action="store_true", help="Only re-validate; leave exports/ untouched.")
+    parser.add_argument("--schema", action="store_true", help="Also validate against schemas/ (see validate_dataset.py --schema).")
+    parser.add_argument("--once", action="store_true", help="Run the initial full pass and exit with its status.")
+    args = parser.parse_args()
+    if args.interval <= 0:
+        raise SystemExit("--interval must be > 0")
+
+    watcher = DatasetWatcher(include_archives=args.include_archives, export=not args.no_export, check_schemas=args.schema)
+    started = time.perf_counter()
+    names = watcher.refresh(full=True) or []
+    report(watcher, names, time.perf_counter() - started, args.write_sha256)
+    if args.once:
+        return 1 if watcher.failures() else 0
+    try:
+        while True:
+            time.sleep(args.interval)
+            started = time.perf_counter()
+            names = watcher.refresh()
+            if names is not None:
+                report(watcher, names, time.perf_counter() - started, args.write_sha256)
+    except KeyboardInterrupt:
+        return 1 if watcher.failures() else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,46 @@
+"""Shared helpers for tests that run the dataset scripts against a scratch copy of the repository."""
+from __future__ import annotations
+
+import os
+import pathlib
+import shutil
+import subprocess
+import sys
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parent.parent
+SCRIPTS_DIR = REPO_ROOT / "scripts"
+STUB_ENGINE_ROOT = SCRIPTS_DIR / "stub_engine"
+DATASET_FILES = ("DATASET_VERSION", "DATASET_ENGINE_MAPPING.json")
+DATASET_DIRS = ("fixtures", "schemas")
+
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+
+def scratch_repo(dest: pathlib.Path) -> pathlib.Path:
+    """Copy the dataset inputs (not exports or caches) into ``dest``; scripts run with it as cwd."""
+    dest.mkdir(parents=True, exist_ok=True)
+    for name in DATASET_FILES:
+        shutil.copyfile(REPO_ROOT / name, dest / name)
+    for name in DATASET_DIRS:
+        shutil.copytree(REPO_ROOT / name, dest / name)
+    (dest / "exports").mkdir()
+    return dest
+
+
+def script_env(**overrides: str) -> dict[str, str]:
+    """The current environment without the dataset's BLUX_* switches, plus ``overrides``."""
+    env = {key: value for key, value in os.environ.items() if not key.startswith(("BLUX_DATASET_", "BLUX_CA_"))}
+    env.update(overrides)
+    return env
+
+
+def run_script(script: str, *args: str, cwd: pathlib.Path, env: dict[str, str] | None = None) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, str(SCRIPTS_DIR / script), *args],
+        cwd=cwd,
+        env=script_env() if env is None else env,
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
@@ -0,0 +1,83 @@
+"""dataset_cli.py all must leave the same outputs and exit status as the three standalone scripts."""
+from __future__ import annotations
+
+import json
+import pathlib
+import tempfile
+import unittest
+
+from support import STUB_ENGINE_ROOT, run_script, scratch_repo
+
+from fixture_pack import tree_files
+
+EXPORT_FILES = ("blux-ca-dataset.jsonl", "blux-ca-dataset.jsonl.sha256", "blux-ca-dataset.jsonl.merkle.json")
+EXPORT_FLAGS = ("--include-archives", "--write-sha256", "--write-merkle")
+
+
+def tree_contents(root: pathlib.Path) -> dict[str, bytes]:
+    return {rel: (root / rel).read_bytes() for rel in tree_files(root) if "_engine_logs" not in rel}
+
+
+class DatasetCliAllTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = scratch_repo(pathlib.Path(tmp.name) / "repo")
+        self.exports = self.root / "exports"
+
+    def separate(self, actual: str) -> tuple[int, str]:
+        stdout = []
+        for script, args in (
+            ("validate_dataset.py", ("--schema",)),
+            ("verify_fixtures.py", ("--engine-root", STUB_ENGINE_ROOT.as_posix(), "--actual-root", actual)),
+            ("export_jsonl.py", EXPORT_FLAGS),
+        ):
+            result = run_script(script, *args, cwd=self.root)
+            stdout.append(result.stdout)
+            if result.returncode:
+                return result.returncode, "".join(stdout)
+        return 0, "".join(stdout)
+
+    def unified(self, actual: str) -> tuple[int, str, str]:
+        result = run_script("dataset_cli.py", "all", "--schema", "--engine-root", STUB_ENGINE_ROOT.as_posix(), "--actual-root", actual, *EXPORT_FLAGS, cwd=self.root)
+        return result.returncode, result.stdout, result.stderr
+
+    def take_exports(self) -> dict[str, bytes]:
+        contents = {}
+        for name in EXPORT_FILES:
+            path = self.exports / name
+            if path.exists():
+                contents[name] = path.read_bytes()
+                path.unlink()
+        return contents
+
+    def test_all_matches_separate_scripts(self) -> None:
+        status, stdout = self.separate("actual-separate")
+        self.assertEqual(status, 0, stdout)
+        separate_exports = self.take_exports()
+        self.assertEqual(sorted(separate_exports), sorted(EXPORT_FILES))
+
+        status, unified_stdout, stderr = self.unified("actual-unified")
+        self.assertEqual(status, 0, unified_stdout + stderr)
+        # The stub engine echoes its output directory.
+        self.assertEqual(unified_stdout.replace("actual-unified", "actual-separate"), stdout)
+        self.assertEqual(self.take_exports(), separate_exports)
+        self.assertEqual(tree_contents(self.root / "actual-unified"), tree_contents(self.root / "actual-separate"))
+
+    def test_all_stops_at_the_failing_stage(self) -> None:
+        goal_path = self.root / "fixtures" / "hello" / "goal.json"
+        goal = json.loads(goal_path.read_text(encoding="utf-8"))
+        del goal["metadata"]["scenario_type"]
+        goal_path.write_text(json.dumps(goal, indent=2) + "\n", encoding="utf-8")
+
+        status, stdout = self.separate("actual-separate")
+        self.assertEqual(status, 1)
+        unified_status, unified_stdout, stderr = self.unified("actual-unified")
+        self.assertEqual((unified_status, unified_stdout), (status, stdout))
+        self.assertIn("Stopping after failed validate stage.", stderr)
+        self.assertEqual(self.take_exports(), {})
+        self.assertFalse((self.root / "actual-unified").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+"""diff_exports.py must report exactly the rows that differ and localize them without walking the whole tree."""
+from __future__ import annotations
+
+import hashlib
+import json
+import pathlib
+import tempfile
+import unittest
+
+from support import REPO_ROOT, run_script
+
+from export_merkle import ExportMerkle, ExportMerkleBuilder, diff_export_merkles, export_merkle_path, merkle_row_name
+
+ROWS = 4000
+
+
+def row_key(index: int) -> tuple[str, int, str, str, str]:
+    return (f"fixture_{index:05d}", 0, "", "", "cA-pro")
+
+
+def write_export(path: pathlib.Path, rows: dict[int, str]) -> None:
+    merkle = ExportMerkleBuilder()
+    hasher = hashlib.sha256()
+    with path.open("wb") as handle:
+        for index in sorted(rows):
+            line = (json.dumps({"fixture_id": row_key(index)[0], "note": rows[index]}, sort_keys=True) + "\n").encode("utf-8")
+            handle.write(line)
+            hasher.update(line)
+            merkle.add(row_key(index), line)
+    merkle.write(path, hasher.hexdigest())
+
+
+def leaf(index: int) -> tuple[str, str]:
+    return row_key(index)[0], merkle_row_name(row_key(index), 0)
+
+
+class DiffExportsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = pathlib.Path(tmp.name)
+        self.old_rows = {index: "base" for index in range(ROWS)}
+        self.old = self.tmp / "old.jsonl"
+        write_export(self.old, self.old_rows)
+
+    def release(self, rows: dict[int, str]) -> pathlib.Path:
+        path = self.tmp / "new.jsonl"
+        write_export(path, rows)
+        return path
+
+    def test_change_is_localized(self) -> None:
+        new = self.release({**self.old_rows, 1234: "changed"})
+        diff = diff_export_merkles(ExportMerkle(export_merkle_path(self.old)), ExportMerkle(export_merkle_path(new)))
+        self.assertEqual((diff.added, diff.removed, diff.changed), ([], [], [leaf(1234)]))
+        # One root-to-bucket path plus its siblings and one bucket of rows, not every fixture.
+        self.assertLess(diff.visited, 100)
+
+    def test_added_and_removed_rows(self) -> None:
+        rows = {index: note for index, note in self.old_rows.items() if index not in (7, 3000)}
+        rows[ROWS + 1] = "new"
+        rows[42] = "changed"
+        new = self.release(rows)
+        diff = diff_export_merkles(ExportMerkle(export_merkle_path(self.old)), ExportMerkle(export_merkle_path(new)))
+        self.assertEqual(diff.added, [leaf(ROWS + 1)])
+        self.assertEqual(diff.removed, [leaf(7), leaf(3000)])
+        self.assertEqual(diff.changed, [leaf(42)])
+        self.assertLess(diff.visited, 400)
+
+    def test_identical_exports_stop_at_the_root(self) -> None:
+        same = ExportMerkle(export_merkle_path(self.old))
+        self.assertEqual(diff_export_merkles(same, same).visited, 1)
+        self.assertEqual(same.check_tree(), [])
+
+    def test_exit_codes(self) -> None:
+        result = run_script("diff_exports.py", str(self.old), str(self.old), "--check", cwd=REPO_ROOT)
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+
+        new = self.release({**self.old_rows, 5: "changed"})
+        result = run_script("diff_exports.py", str(self.old), str(new), "--json", "--check", "changed", cwd=REPO_ROOT)
+        self.assertEqual(result.returncode, 1, result.stderr)
+        report = json.loads(result.stdout)
+        self.assertEqual([row["fixture_id"] for row in report["changed"]], [leaf(5)[0]])
+        self.assertEqual(report["check"]["corrupt"], [])
+
+        data = bytearray(new.read_bytes())
+        position = data.index(b'"changed"') + 1
+        data[position] = ord("C")
+        new.write_bytes(bytes(data))
+        result = run_script("diff_exports.py", str(self.old), str(new), "--check", "changed", cwd=REPO_ROOT)
+        self.assertEqual(result.returncode, 2, result.stdout + result.stderr)
+        self.assertIn("does not match its Merkle leaf hash", result.stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()
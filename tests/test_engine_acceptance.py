@@ -0,0 +1,82 @@
+"""An incremental --engine-root acceptance run must leave the same outputs as a cold full run."""
+from __future__ import annotations
+
+import json
+import os
+import pathlib
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+from dataset_common import fixture_dirs  # noqa: E402
+from verify_fixtures import BRIDGE_RUN_MANIFEST, BridgeCache, run_engine_acceptance  # noqa: E402
+
+STUB_ENGINE_ROOT = REPO_ROOT / "scripts" / "stub_engine"
+POLICY_PACK = "cA-pro"
+
+
+def tree_contents(root: pathlib.Path) -> dict[str, bytes]:
+    return {path.relative_to(root).as_posix(): path.read_bytes() for path in sorted(root.rglob("*")) if path.is_file()}
+
+
+class IncrementalAcceptanceTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = pathlib.Path(tmp.name)
+        self.fixtures = self.tmp / "fixtures"
+        shutil.copytree(REPO_ROOT / "fixtures", self.fixtures)
+        patcher = mock.patch.dict(os.environ, {"BLUX_CA_STUB_DATASET": self.fixtures.as_posix()})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def accept(self, actual_root: pathlib.Path, *, incremental: bool) -> int:
+        cache = BridgeCache(self.tmp / "bridge")
+        try:
+            return run_engine_acceptance(STUB_ENGINE_ROOT, self.fixtures, actual_root, POLICY_PACK, None, sys.executable, bridge_cache=cache, incremental=incremental)
+        finally:
+            cache.save()
+
+    def test_incremental_run_matches_cold_run(self) -> None:
+        actual = self.tmp / "actual"
+        fixtures = fixture_dirs(self.fixtures)
+        total = self.accept(actual, incremental=False)
+        self.assertEqual(total, len(fixtures))
+
+        changed_goal = fixtures[0] / "goal.json"
+        goal = json.loads(changed_goal.read_text(encoding="utf-8"))
+        goal["prompt"] = f"{goal.get('prompt', '')} (revised)"
+        changed_goal.write_text(json.dumps(goal, indent=2) + "\n", encoding="utf-8")
+        shutil.rmtree(actual / fixtures[1].name)
+
+        self.assertEqual(self.accept(actual, incremental=True), 2)
+        self.assertEqual(self.accept(actual, incremental=True), 0)
+
+        cold = self.tmp / "cold"
+        self.assertEqual(self.accept(cold, incremental=False), total)
+        report = json.loads((actual / "report.json").read_text(encoding="utf-8"))
+        self.assertEqual(report["accepted"], total)
+        self.assertEqual(tree_contents(actual), tree_contents(cold))
+
+    def test_plain_run_skips_the_run_record(self) -> None:
+        actual = self.tmp / "actual"
+        with mock.patch("verify_fixtures.engine_identity") as identity:
+            total = run_engine_acceptance(STUB_ENGINE_ROOT, self.fixtures, actual, POLICY_PACK, None, sys.executable)
+        self.assertEqual(total, len(fixture_dirs(self.fixtures)))
+        identity.assert_not_called()
+        self.assertFalse((actual / BRIDGE_RUN_MANIFEST).exists())
+        self.assertTrue((actual / "report.json").exists())
+
+        self.accept(actual, incremental=False)
+        self.assertTrue((actual / BRIDGE_RUN_MANIFEST).exists())
+        run_engine_acceptance(STUB_ENGINE_ROOT, self.fixtures, actual, POLICY_PACK, None, sys.executable)
+        self.assertFalse((actual / BRIDGE_RUN_MANIFEST).exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
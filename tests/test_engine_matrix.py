@@ -0,0 +1,80 @@
+"""A --matrix run against the stub engine must match separate single-pack runs, cell by cell."""
+from __future__ import annotations
+
+import json
+import os
+import pathlib
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from support import REPO_ROOT, STUB_ENGINE_ROOT
+
+from dataset_common import fixture_dirs
+from verify_fixtures import EngineVerificationSession, discover_engine_matrix, run_engine_acceptance, run_engine_matrix
+
+MODEL_VERSION = "cA-1.0-pro"
+COMBINATIONS = [(pack, profile) for pack in ("cA-mini", "cA-pro") for profile in (None, "cpu", "gpu")]
+
+
+def tree_contents(root: pathlib.Path) -> dict[str, bytes]:
+    return {
+        path.relative_to(root).as_posix(): path.read_bytes()
+        for path in sorted(root.rglob("*"))
+        if path.is_file() and "_engine_logs" not in path.relative_to(root).parts
+    }
+
+
+class EngineMatrixTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = pathlib.Path(tmp.name)
+        self.expected_root = self.tmp / "fixtures"
+        shutil.copytree(REPO_ROOT / "fixtures", self.expected_root)
+        self.names = [fixture_dir.name for fixture_dir in fixture_dirs(self.expected_root)]
+        # The stub replays the pristine fixtures, so edits to the copy show up as engine mismatches.
+        patcher = mock.patch.dict(os.environ, {"BLUX_CA_STUB_DATASET": (REPO_ROOT / "fixtures").as_posix()})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def run_matrix(self) -> dict[str, list[str]]:
+        cells = run_engine_matrix(STUB_ENGINE_ROOT, self.expected_root, self.tmp / "matrix", MODEL_VERSION, COMBINATIONS, sys.executable, jobs=3)
+        self.assertEqual([(cell.policy_pack, cell.profile_id) for cell in cells], COMBINATIONS)
+        for cell in cells:
+            self.assertEqual(cell.engine_runs, len(self.names))
+        return {cell.label: cell.failures for cell in cells}
+
+    def test_discovers_every_pack_and_profile(self) -> None:
+        self.assertEqual(discover_engine_matrix(self.expected_root, MODEL_VERSION), COMBINATIONS)
+
+    def test_cells_match_single_runs(self) -> None:
+        self.assertEqual(self.run_matrix(), {f"{pack}/{profile or 'default'}": [] for pack, profile in COMBINATIONS})
+        for pack, profile in COMBINATIONS:
+            with self.subTest(pack=pack, profile=profile):
+                single = self.tmp / "single" / pack / (profile or "default")
+                run_engine_acceptance(STUB_ENGINE_ROOT, self.expected_root, single, pack, profile, sys.executable)
+                session = EngineVerificationSession(self.expected_root, single, MODEL_VERSION, pack, profile)
+                self.assertEqual(session.verify_all(self.names), [])
+                self.assertEqual(tree_contents(self.tmp / "matrix" / pack / (profile or "default")), tree_contents(single))
+
+    def test_failures_stay_in_their_cells(self) -> None:
+        verdict_path = self.expected_root / "policy_pack_matrix" / "expected" / MODEL_VERSION / "cA-mini" / "expected_verdict.json"
+        verdict = json.loads(verdict_path.read_text(encoding="utf-8"))
+        verdict["outcome"] = "pass"
+        verdict_path.write_text(json.dumps(verdict, indent=2) + "\n", encoding="utf-8")
+
+        failures = self.run_matrix()
+        for label, cell_failures in failures.items():
+            with self.subTest(cell=label):
+                if label.startswith("cA-mini/"):
+                    self.assertTrue(cell_failures)
+                    self.assertTrue(all("policy_pack_matrix" in failure for failure in cell_failures), cell_failures)
+                else:
+                    self.assertEqual(cell_failures, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
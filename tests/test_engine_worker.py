@@ -0,0 +1,91 @@
+"""Engine workers must report a crashed or silent worker for its fixture and restart for the rest."""
+from __future__ import annotations
+
+import os
+import pathlib
+import shlex
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from support import REPO_ROOT, STUB_ENGINE_ROOT, run_script, script_env
+
+from dataset_common import fixture_dirs
+from verify_fixtures import run_engine_workers
+
+MODEL_VERSION = "cA-1.0-pro"
+POLICY_PACK = "cA-pro"
+WORKER_COMMAND = [sys.executable, "-m", "blux_ca", "worker"]
+FIXTURES = fixture_dirs(REPO_ROOT / "fixtures")
+# Not the last fixture, so a replacement worker has to be started after it.
+BROKEN = "hello"
+
+
+class EngineWorkerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = pathlib.Path(tmp.name)
+        self.assertNotEqual(FIXTURES[-1].name, BROKEN)
+
+    def run_workers(self, timeout: float = 30.0, jobs: int = 1, **env: str) -> tuple[dict[str, str], int]:
+        environ = script_env(PYTHONPATH=(STUB_ENGINE_ROOT / "src").as_posix(), **env)
+        with mock.patch.dict(os.environ, environ, clear=True):
+            return run_engine_workers(
+                WORKER_COMMAND,
+                FIXTURES,
+                self.tmp / "actual",
+                self.tmp / "logs",
+                model_version=MODEL_VERSION,
+                policy_pack=POLICY_PACK,
+                profile=None,
+                jobs=jobs,
+                timeout=timeout,
+            )
+
+    def assert_outputs(self, skip: str | None = None) -> None:
+        for fixture_dir in FIXTURES:
+            if fixture_dir.name == skip:
+                continue
+            expected = fixture_dir / "expected" / MODEL_VERSION / POLICY_PACK / "expected_verdict.json"
+            self.assertEqual((self.tmp / "actual" / fixture_dir.name / "verdict.json").read_bytes(), expected.read_bytes())
+
+    def test_clean_run_uses_one_process_per_job(self) -> None:
+        self.assertEqual(self.run_workers(jobs=2), ({}, 2))
+        self.assert_outputs()
+
+    def test_crash_fails_one_fixture_and_restarts(self) -> None:
+        failures, started = self.run_workers(BLUX_CA_STUB_CRASH=BROKEN)
+        self.assertEqual(list(failures), [BROKEN])
+        self.assertIn("exited with code 3", failures[BROKEN])
+        self.assertIn(f"crashing on {BROKEN}", failures[BROKEN])
+        self.assertEqual(started, 2)
+        self.assert_outputs(skip=BROKEN)
+
+    def test_timeout_kills_and_restarts(self) -> None:
+        failures, started = self.run_workers(timeout=2.0, BLUX_CA_STUB_HANG=BROKEN)
+        self.assertEqual(list(failures), [BROKEN])
+        self.assertIn("no response within 2s", failures[BROKEN])
+        self.assertEqual(started, 2)
+        self.assert_outputs(skip=BROKEN)
+
+    def test_cli_reports_the_crash(self) -> None:
+        result = run_script(
+            "verify_fixtures.py",
+            "--engine-worker",
+            shlex.join(WORKER_COMMAND),
+            "--actual-root",
+            (self.tmp / "cli").as_posix(),
+            cwd=REPO_ROOT,
+            env=script_env(PYTHONPATH=(STUB_ENGINE_ROOT / "src").as_posix(), BLUX_CA_STUB_CRASH=BROKEN),
+        )
+        self.assertEqual(result.returncode, 1, result.stdout + result.stderr)
+        failures = [line for line in result.stdout.splitlines() if line.startswith("FAIL: ")]
+        self.assertTrue(failures)
+        self.assertTrue(all(BROKEN in line for line in failures), failures)
+        self.assertIn("Engine workers: 2 processes started", result.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+"""ExportReader must reject an index that no longer describes its export."""
+from __future__ import annotations
+
+import os
+import pathlib
+import sys
+import tempfile
+import unittest
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+from dataset_common import read_mapping  # noqa: E402
+from export_index import ExportIndexBuilder, ExportReader  # noqa: E402
+from export_jsonl import export_rows  # noqa: E402
+
+_PREVIOUS_CWD = os.getcwd()
+
+
+def setUpModule() -> None:
+    os.chdir(REPO_ROOT)
+
+
+def tearDownModule() -> None:
+    os.chdir(_PREVIOUS_CWD)
+
+
+class ExportReaderStaleIndexTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.export_path = pathlib.Path(self.tmp.name) / "export.jsonl"
+        index = ExportIndexBuilder()
+        self.rows, digest = export_rows(self.export_path, read_mapping(), include_archives=False, index=index)
+        index.write(self.export_path, digest)
+
+    def test_fresh_index(self) -> None:
+        with ExportReader(self.export_path) as reader:
+            self.assertEqual(len(reader), self.rows)
+            self.assertEqual(reader.raw_row(0), self.export_path.read_bytes().splitlines(keepends=True)[0])
+
+    def test_same_size_rewrite_is_rejected(self) -> None:
+        data = bytearray(self.export_path.read_bytes())
+        position = data.index(b'"fixture_id":"') + len(b'"fixture_id":"')
+        data[position] = ord("x") if data[position] != ord("x") else ord("y")
+        self.export_path.write_bytes(bytes(data))
+        self.assertEqual(self.export_path.stat().st_size, len(data))
+        with self.assertRaises(SystemExit) as raised:
+            ExportReader(self.export_path)
+        self.assertIn("sha256", str(raised.exception))
+
+    def test_changed_size_is_rejected(self) -> None:
+        with self.export_path.open("ab") as handle:
+            handle.write(b"{}\n")
+        with self.assertRaises(SystemExit) as raised:
+            ExportReader(self.export_path)
+        self.assertIn("size", str(raised.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+"""The streaming export writer must stay byte-identical to the in-memory one."""
+from __future__ import annotations
+
+import hashlib
+import os
+import pathlib
+import sys
+import tempfile
+import unittest
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+from dataset_common import read_mapping  # noqa: E402
+from export_jsonl import export_rows, stream_export_rows  # noqa: E402
+
+_PREVIOUS_CWD = os.getcwd()
+
+
+def setUpModule() -> None:
+    os.chdir(REPO_ROOT)
+
+
+def tearDownModule() -> None:
+    os.chdir(_PREVIOUS_CWD)
+
+
+class StreamExportTest(unittest.TestCase):
+    def test_stream_matches_export_rows(self) -> None:
+        mapping = read_mapping()
+        with tempfile.TemporaryDirectory() as tmp:
+            for include_archives in (False, True):
+                with self.subTest(include_archives=include_archives):
+                    in_memory = pathlib.Path(tmp) / f"rows-{include_archives}.jsonl"
+                    streamed = pathlib.Path(tmp) / f"stream-{include_archives}.jsonl"
+                    expected = export_rows(in_memory, mapping, include_archives)
+                    actual = stream_export_rows(streamed, mapping, include_archives)
+                    data = in_memory.read_bytes()
+                    self.assertTrue(data)
+                    self.assertEqual(streamed.read_bytes(), data)
+                    self.assertEqual(actual, expected)
+                    self.assertEqual(expected[1], hashlib.sha256(data).hexdigest())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+"""Compressed, deduplicated and SQLite exports must expand back to the canonical JSONL export byte for byte."""
+from __future__ import annotations
+
+import bz2
+import gzip
+import json
+import lzma
+import pathlib
+import tempfile
+import unittest
+
+from support import run_script, scratch_repo
+
+from export_dedup import DedupExportReader
+
+EXPORT = pathlib.Path("exports") / "blux-ca-dataset.jsonl"
+DECOMPRESSORS = {"gzip": (".gz", gzip.decompress), "xz": (".xz", lzma.decompress), "bz2": (".bz2", bz2.decompress)}
+
+
+class ExportRoundTripTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = scratch_repo(pathlib.Path(tmp.name) / "repo")
+        self.export_path = self.root / EXPORT
+        self.run_ok("export_jsonl.py", "--include-archives")
+        self.canonical = self.export_path.read_bytes()
+        self.export_path.unlink()
+
+    def run_ok(self, script: str, *args: str) -> str:
+        result = run_script(script, *args, cwd=self.root)
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+        return result.stdout
+
+    def test_compression(self) -> None:
+        for compression, (suffix, decompress) in DECOMPRESSORS.items():
+            with self.subTest(compression=compression):
+                compressed = self.export_path.with_name(self.export_path.name + suffix)
+                self.run_ok("export_jsonl.py", "--include-archives", "--compress", compression)
+                first = compressed.read_bytes()
+                self.assertEqual(decompress(first), self.canonical)
+                self.run_ok("export_jsonl.py", "--include-archives", "--compress", compression)
+                self.assertEqual(compressed.read_bytes(), first)
+
+    def test_dedup(self) -> None:
+        self.run_ok("export_jsonl.py", "--include-archives", "--dedup")
+        self.assertFalse(self.export_path.exists())
+        self.run_ok("expand_export.py")
+        self.assertEqual(self.export_path.read_bytes(), self.canonical)
+
+        with DedupExportReader(self.export_path) as reader:
+            lines = self.canonical.splitlines(keepends=True)
+            self.assertEqual([reader.raw_row(number) for number in range(len(reader))], lines)
+            self.assertEqual(list(reader), [json.loads(line) for line in lines])
+
+    def test_sqlite(self) -> None:
+        self.run_ok("export_jsonl.py", "--include-archives", "--format", "sqlite")
+        output = self.root / "expanded.jsonl"
+        self.run_ok("expand_export.py", "--format", "sqlite", "--output", output.as_posix())
+        self.assertEqual(output.read_bytes(), self.canonical)
+
+    def test_dedup_refuses_blob_literals(self) -> None:
+        artifact_path = next((self.root / "fixtures" / "hello").rglob("expected_artifact.json"))
+        artifact = json.loads(artifact_path.read_text(encoding="utf-8"))
+        artifact["artifact"]["content"] = {"$blob": "0" * 64}
+        artifact_path.write_text(json.dumps(artifact, indent=2) + "\n", encoding="utf-8")
+
+        result = run_script("export_jsonl.py", "--include-archives", "--dedup", cwd=self.root)
+        self.assertNotEqual(result.returncode, 0)
+        self.assertIn("literal", result.stderr)
+        self.assertIn("hello", result.stderr)
+        self.run_ok("export_jsonl.py", "--include-archives")
+        self.assertIn(b'{"$blob":"' + b"0" * 64 + b'"}', self.export_path.read_bytes())
+
+
+if __name__ == "__main__":
+    unittest.main()
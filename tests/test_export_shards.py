@@ -0,0 +1,68 @@
+"""Sharded exports must concatenate to the canonical export and never leave stale sidecars."""
+from __future__ import annotations
+
+import hashlib
+import json
+import pathlib
+import tempfile
+import unittest
+
+from support import run_script, scratch_repo
+
+EXPORT = "blux-ca-dataset.jsonl"
+
+
+class ShardedExportTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = scratch_repo(pathlib.Path(tmp.name) / "repo")
+        self.exports = self.root / "exports"
+        canonical = self.export("--include-archives")
+        self.canonical = (self.exports / EXPORT).read_bytes()
+        self.assertIn(f"sha256={hashlib.sha256(self.canonical).hexdigest()}", canonical)
+        (self.exports / EXPORT).unlink()
+
+    def export(self, *args: str) -> str:
+        completed = run_script("export_jsonl.py", *args, cwd=self.root)
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+        return completed.stdout
+
+    def shards(self) -> list[pathlib.Path]:
+        return sorted(self.exports.glob("blux-ca-dataset-*-of-*.jsonl"))
+
+    def sidecars(self) -> list[pathlib.Path]:
+        return sorted(self.exports.glob("blux-ca-dataset-*-of-*.jsonl.sha256"))
+
+    def assert_shards_match_canonical(self) -> None:
+        shards = self.shards()
+        self.assertEqual(b"".join(path.read_bytes() for path in shards), self.canonical)
+        manifest = json.loads((self.exports / "blux-ca-dataset.shards.json").read_text(encoding="utf-8"))
+        self.assertEqual(manifest["sha256"], hashlib.sha256(self.canonical).hexdigest())
+        self.assertEqual([entry["file"] for entry in manifest["shards"]], [path.name for path in shards])
+
+    def assert_sidecars_verify(self) -> None:
+        self.assertEqual([path.name for path in self.sidecars()], [f"{path.name}.sha256" for path in self.shards()])
+        for sidecar in self.sidecars():
+            digest, name = sidecar.read_text(encoding="utf-8").split()
+            self.assertEqual(hashlib.sha256((self.exports / name).read_bytes()).hexdigest(), digest, name)
+
+    def test_reshard_rewrites_or_removes_sidecars(self) -> None:
+        self.export("--include-archives", "--shard-rows", "7", "--write-sha256", "--jobs", "1")
+        self.assert_shards_match_canonical()
+        self.assert_sidecars_verify()
+        by_rows = [path.read_bytes() for path in self.shards()]
+
+        self.export("--include-archives", "--shard-bytes", "20000", "--jobs", "1")
+        self.assert_shards_match_canonical()
+        # Same shard names, different boundaries: the old sidecars would no longer verify.
+        self.assertNotEqual([path.read_bytes() for path in self.shards()], by_rows)
+        self.assertEqual(self.sidecars(), [])
+
+        self.export("--include-archives", "--shard-bytes", "20000", "--write-sha256", "--jobs", "2")
+        self.assert_shards_match_canonical()
+        self.assert_sidecars_verify()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+"""Reading fixtures from a pack must give the same validation, export and verification results as the loose tree."""
+from __future__ import annotations
+
+import pathlib
+import tempfile
+import unittest
+
+from support import STUB_ENGINE_ROOT, run_script, scratch_repo, script_env
+
+from fixture_pack import tree_files
+
+EXPORT_FILES = ("blux-ca-dataset.jsonl", "blux-ca-dataset.jsonl.index.json", "blux-ca-dataset.jsonl.merkle.json")
+
+
+def tree_contents(root: pathlib.Path) -> dict[str, bytes]:
+    return {rel: (root / rel).read_bytes() for rel in tree_files(root) if "_engine_logs" not in rel}
+
+
+class FixturePackTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = scratch_repo(pathlib.Path(tmp.name) / "repo")
+
+    def run_ok(self, script: str, *args: str, env: dict[str, str] | None = None) -> str:
+        result = run_script(script, *args, cwd=self.root, env=env)
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+        return result.stdout
+
+    def outputs(self, actual: str, env: dict[str, str] | None = None) -> dict[str, object]:
+        validated = self.run_ok("validate_dataset.py", "--schema", env=env)
+        self.run_ok("export_jsonl.py", "--include-archives", "--write-index", "--write-merkle", env=env)
+        self.run_ok("verify_fixtures.py", "--engine-root", STUB_ENGINE_ROOT.as_posix(), "--actual-root", actual, env=env)
+        exports = {name: (self.root / "exports" / name).read_bytes() for name in EXPORT_FILES}
+        return {"validate": validated, "exports": exports, "engine": tree_contents(self.root / actual)}
+
+    def test_pack_matches_loose_tree(self) -> None:
+        loose = self.outputs("actual-loose")
+        self.run_ok("fixture_pack.py", "pack")
+        packed_bytes = (self.root / "fixtures.pack").read_bytes()
+        self.run_ok("fixture_pack.py", "pack")
+        self.assertEqual((self.root / "fixtures.pack").read_bytes(), packed_bytes)
+
+        # Without the loose tree, every read has to come from the pack.
+        (self.root / "fixtures").rename(self.root / "fixtures.loose")
+        packed = self.outputs("actual-pack", env=script_env(BLUX_DATASET_FIXTURE_PACK="fixtures.pack"))
+        self.assertEqual(packed, loose)
+
+        self.run_ok("fixture_pack.py", "unpack", "--output", "fixtures")
+        self.assertEqual(tree_contents(self.root / "fixtures"), tree_contents(self.root / "fixtures.loose"))
+
+    def test_check_reports_drift(self) -> None:
+        self.run_ok("fixture_pack.py", "pack")
+        self.assertIn("intact", self.run_ok("fixture_pack.py", "check", "--root", "fixtures"))
+        goal = self.root / "fixtures" / "hello" / "goal.json"
+        goal.write_bytes(goal.read_bytes() + b"\n")
+        result = run_script("fixture_pack.py", "check", "--root", "fixtures", cwd=self.root)
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("FAIL: hello/goal.json: differs from", result.stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+"""An incremental export after editing and deleting fixtures must equal a full export of the same tree."""
+from __future__ import annotations
+
+import json
+import pathlib
+import re
+import shutil
+import tempfile
+import unittest
+
+from support import run_script, scratch_repo
+
+EXPORT = pathlib.Path("exports") / "blux-ca-dataset.jsonl"
+SIDECARS = (".index.json", ".merkle.json")
+FLAGS = ("--include-archives", "--write-index", "--write-merkle")
+
+
+class IncrementalExportTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = scratch_repo(pathlib.Path(tmp.name) / "repo")
+
+    def export(self, *args: str) -> tuple[int, int | None]:
+        result = run_script("export_jsonl.py", *FLAGS, *args, cwd=self.root)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        rows = int(re.search(r"Exported (\d+) rows", result.stdout).group(1))
+        rebuilt = re.search(r"Rebuilt (\d+) of", result.stdout)
+        return rows, int(rebuilt.group(1)) if rebuilt else None
+
+    def outputs(self) -> dict[str, bytes]:
+        export = self.root / EXPORT
+        return {suffix: export.with_name(export.name + suffix).read_bytes() for suffix in ("", *SIDECARS)}
+
+    def test_edit_and_delete_match_full_export(self) -> None:
+        rows, rebuilt = self.export("--incremental")
+        self.assertEqual(rebuilt, rows)
+
+        goal_path = self.root / "fixtures" / "hello" / "goal.json"
+        goal = json.loads(goal_path.read_text(encoding="utf-8"))
+        goal["prompt"] = f"{goal.get('prompt', '')} (revised)"
+        goal_path.write_text(json.dumps(goal, indent=2) + "\n", encoding="utf-8")
+        shutil.rmtree(self.root / "fixtures" / "drift_probe")
+
+        incremental_rows, rebuilt = self.export("--incremental")
+        self.assertEqual((incremental_rows, rebuilt), (rows - 1, 1))
+        incremental = self.outputs()
+        self.assertNotIn(b'"fixture_id":"drift_probe"', incremental[""])
+        self.assertEqual(self.export("--incremental"), (incremental_rows, 0))
+        self.assertEqual(self.outputs(), incremental)
+
+        self.assertEqual(self.export(), (incremental_rows, None))
+        self.assertEqual(self.outputs(), incremental)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+"""--timings must count work done in --jobs worker processes under every multiprocessing start method."""
+from __future__ import annotations
+
+import json
+import multiprocessing
+import pathlib
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from support import REPO_ROOT, SCRIPTS_DIR, STUB_ENGINE_ROOT, scratch_repo, script_env
+
+from dataset_common import fixture_dirs
+
+# Runs a script's main() after choosing the start method; the script is imported so pool jobs pickle by module name.
+RUNNER = """
+import multiprocessing, sys
+multiprocessing.set_start_method(sys.argv[1])
+sys.path.insert(0, sys.argv[2])
+module = __import__(sys.argv[3])
+sys.argv = [sys.argv[3] + ".py", *sys.argv[4:]]
+sys.exit(module.main())
+"""
+FIXTURES = len(fixture_dirs(REPO_ROOT / "fixtures"))
+
+
+class WorkerTimingsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = pathlib.Path(tmp.name)
+        self.root = scratch_repo(self.tmp / "repo")
+
+    def timings(self, method: str, module: str, *args: str) -> dict:
+        path = self.tmp / f"{module}-{method}.json"
+        result = subprocess.run(
+            [sys.executable, "-c", RUNNER, method, str(SCRIPTS_DIR), module, *args, "--timings", path.as_posix()],
+            cwd=self.root,
+            env=script_env(),
+            capture_output=True,
+            text=True,
+            timeout=300,
+        )
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def test_start_methods(self) -> None:
+        for method in multiprocessing.get_all_start_methods():
+            with self.subTest(method=method):
+                validate = self.timings(method, "validate_dataset", "--jobs", "2")
+                self.assertEqual(validate["fixtures"], FIXTURES)
+                self.assertGreaterEqual(validate["phases"]["load_json"]["calls"], FIXTURES)
+
+                verify = self.timings(method, "verify_fixtures", "--jobs", "2", "--engine-root", STUB_ENGINE_ROOT.as_posix(), "--actual-root", (self.tmp / f"actual-{method}").as_posix())
+                self.assertEqual(verify["fixtures"], FIXTURES)
+
+                export = self.timings(method, "export_jsonl", "--jobs", "2", "--shard-rows", "4")
+                self.assertEqual(export["fixtures"], FIXTURES)
+
+
+if __name__ == "__main__":
+    unittest.main()
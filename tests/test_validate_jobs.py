@@ -0,0 +1,48 @@
+"""validate_dataset.py --jobs must print the same failures, in the same order, with the same exit status as a serial run."""
+from __future__ import annotations
+
+import json
+import pathlib
+import tempfile
+import unittest
+
+from support import run_script, scratch_repo
+
+BROKEN_METADATA = {"conflict_detection": "contract_version", "validator_pack": "scenario_type"}
+
+
+class ParallelValidationTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = scratch_repo(pathlib.Path(tmp.name) / "repo")
+
+    def assert_jobs_match_serial(self, expected_status: int) -> str:
+        for extra in ((), ("--schema",)):
+            serial = run_script("validate_dataset.py", *extra, cwd=self.root)
+            self.assertEqual(serial.returncode, expected_status, serial.stdout + serial.stderr)
+            for jobs in ("4", "0"):
+                with self.subTest(jobs=jobs, extra=extra):
+                    parallel = run_script("validate_dataset.py", "--jobs", jobs, *extra, cwd=self.root)
+                    self.assertEqual((parallel.returncode, parallel.stdout), (serial.returncode, serial.stdout))
+        return serial.stdout
+
+    def test_clean_tree(self) -> None:
+        self.assertIn("validated", self.assert_jobs_match_serial(0))
+
+    def test_failures_keep_fixture_order(self) -> None:
+        for fixture_id, field in BROKEN_METADATA.items():
+            goal_path = self.root / "fixtures" / fixture_id / "goal.json"
+            goal = json.loads(goal_path.read_text(encoding="utf-8"))
+            del goal["metadata"][field]
+            goal_path.write_text(json.dumps(goal, indent=2) + "\n", encoding="utf-8")
+        next((self.root / "fixtures" / "hello").rglob("expected_verdict.json")).unlink()
+
+        output = self.assert_jobs_match_serial(1)
+        failures = [line for line in output.splitlines() if line.startswith("FAIL: ")]
+        positions = [next(i for i, line in enumerate(failures) if f"fixtures/{name}/" in line) for name in ("conflict_detection", "hello", "validator_pack")]
+        self.assertEqual(positions, sorted(positions), failures)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""VerificationCache must reuse unchanged passes and miss whenever an input or the verifier changes."""
+from __future__ import annotations
+
+import json
+import pathlib
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from support import REPO_ROOT
+
+import document_cache
+import fixture_layout
+from dataset_common import fixture_dirs
+from verify_fixtures import VerificationCache, compare_fixture, verifier_fingerprint
+
+MODEL_VERSION = "cA-1.0-pro"
+POLICY_PACK = "cA-pro"
+
+
+class VerificationCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = pathlib.Path(tmp.name)
+        self.expected_root = self.tmp / "fixtures"
+        shutil.copytree(REPO_ROOT / "fixtures", self.expected_root)
+        self.actual_root = self.tmp / "actual"
+        self.names = [fixture_dir.name for fixture_dir in fixture_dirs(self.expected_root)]
+        for name in self.names:
+            bundle = self.expected_root / name / "expected" / MODEL_VERSION / POLICY_PACK
+            (self.actual_root / name).mkdir(parents=True)
+            for kind in ("artifact", "verdict"):
+                shutil.copyfile(bundle / f"expected_{kind}.json", self.actual_root / name / f"{kind}.json")
+        self.cache_path = self.tmp / "cache" / "verify_fixtures.json"
+
+    def verify(self) -> tuple[list[str], int, int]:
+        cache = VerificationCache(self.cache_path)
+        failures = []
+        for name in self.names:
+            failures.extend(compare_fixture(name, self.expected_root, self.actual_root, model_version=MODEL_VERSION, policy_pack=POLICY_PACK, profile_id=None, cache=cache))
+        cache.save()
+        return failures, cache.hits, cache.misses
+
+    def test_hits_after_a_clean_run(self) -> None:
+        self.assertEqual(self.verify(), ([], 0, len(self.names)))
+        self.assertEqual(self.verify(), ([], len(self.names), 0))
+
+    def test_changed_output_misses_and_failures_are_not_cached(self) -> None:
+        self.verify()
+        artifact_path = self.actual_root / self.names[0] / "artifact.json"
+        artifact = json.loads(artifact_path.read_text(encoding="utf-8"))
+        artifact["artifact_kind"] = "changed by test"
+        artifact_path.write_text(json.dumps(artifact, indent=2) + "\n", encoding="utf-8")
+        for _ in range(2):
+            failures, hits, misses = self.verify()
+            self.assertTrue(failures)
+            self.assertTrue(all(self.names[0] in failure for failure in failures), failures)
+            self.assertEqual((hits, misses), (len(self.names) - 1, 1))
+
+    def test_verifier_change_misses(self) -> None:
+        self.verify()
+        with mock.patch("verify_fixtures.verifier_fingerprint", return_value="edited verifier"):
+            self.assertEqual(self.verify(), ([], 0, len(self.names)))
+
+    def test_fingerprint_covers_the_fixture_loaders(self) -> None:
+        self.addCleanup(verifier_fingerprint.cache_clear)
+        verifier_fingerprint.cache_clear()
+        original = verifier_fingerprint()
+        for module in (document_cache, fixture_layout):
+            with self.subTest(module=module.__name__):
+                edited = self.tmp / pathlib.Path(module.__file__).name
+                edited.write_bytes(pathlib.Path(module.__file__).read_bytes() + b"\n# edited\n")
+                verifier_fingerprint.cache_clear()
+                with mock.patch.object(module, "__file__", edited.as_posix()):
+                    self.assertNotEqual(verifier_fingerprint(), original)
+        verifier_fingerprint.cache_clear()
+        self.assertEqual(verifier_fingerprint(), original)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+"""watch_dataset.py must survive a fixture that is briefly unreadable while it is being saved."""
+from __future__ import annotations
+
+import pathlib
+import queue
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+from support import SCRIPTS_DIR, run_script, scratch_repo, script_env
+
+LINE_TIMEOUT = 30.0
+
+
+class WatchDatasetTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = scratch_repo(pathlib.Path(tmp.name) / "repo")
+        self.process = subprocess.Popen(
+            [sys.executable, str(SCRIPTS_DIR / "watch_dataset.py"), "--interval", "0.05"],
+            cwd=self.root,
+            env=script_env(),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+        )
+        self.addCleanup(self._stop)
+        self.lines: queue.Queue[str] = queue.Queue()
+        threading.Thread(target=self._pump, daemon=True).start()
+
+    def _pump(self) -> None:
+        assert self.process.stdout is not None
+        for line in self.process.stdout:
+            self.lines.put(line)
+
+    def _stop(self) -> None:
+        if self.process.poll() is None:
+            self.process.kill()
+        self.process.wait()
+        if self.process.stdout is not None:
+            self.process.stdout.close()
+
+    def wait_for_status(self) -> tuple[str, list[str]]:
+        """Return the next refresh status line and the FAIL lines printed before it."""
+        failures = []
+        deadline = time.monotonic() + LINE_TIMEOUT
+        while True:
+            try:
+                line = self.lines.get(timeout=0.1)
+            except queue.Empty:
+                if self.process.poll() is not None or time.monotonic() > deadline:
+                    self.fail(f"watcher printed no status line (exit code {self.process.poll()})")
+                continue
+            if line.startswith("FAIL: "):
+                failures.append(line)
+            elif "refreshed in" in line:
+                return line, failures
+
+    def test_broken_fixture_is_reported_and_recovered(self) -> None:
+        export = self.root / "exports" / "blux-ca-dataset.jsonl"
+        status, failures = self.wait_for_status()
+        self.assertIn("validated", status)
+        self.assertEqual(failures, [])
+        exported = export.read_bytes()
+
+        goal = self.root / "fixtures" / "hello" / "goal.json"
+        original = goal.read_bytes()
+        goal.write_text('{"broken":', encoding="utf-8")
+        status, failures = self.wait_for_status()
+        self.assertIn("export not refreshed", status)
+        self.assertTrue(any("Unreadable fixture hello" in failure for failure in failures), failures)
+        self.assertIsNone(self.process.poll())
+        self.assertEqual(export.read_bytes(), exported)
+
+        goal.write_bytes(original)
+        status, failures = self.wait_for_status()
+        self.assertIn("1 fixture(s) refreshed", status)
+        self.assertIn("validated", status)
+        self.assertEqual(failures, [])
+        self.assertIsNone(self.process.poll())
+        self.assertEqual(export.read_bytes(), exported)
+        cold = run_script("export_jsonl.py", "--stream", cwd=self.root)
+        self.assertEqual(cold.returncode, 0, cold.stderr)
+        self.assertEqual(export.read_bytes(), exported)
+
+
+if __name__ == "__main__":
+    unittest.main()